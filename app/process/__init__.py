@@ -1,3 +1,5 @@
-from .log import log_process, log_trans, is_log_directory, walk_log_directories
-from .metrics import get_all_metrics, _ALL_NAME_LIST, _ALL_METRICS_LIST
-from .msgdata import msgdata_trans
+from .catalog import catalog_file_in_directory, open_catalog, record_run, load_catalog, load_metrics_table
+from .follow import LogFollower
+from .log import log_process, log_trans, load_log, wait_log_writes, is_log_directory, walk_log_directories
+from .metrics import get_all_metrics, compute_metrics, _ALL_NAME_LIST, _ALL_METRICS_LIST
+from .msgdata import msgdata_trans, msgdata_index, msgdata_senders
@@ -0,0 +1,114 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Mapping, Optional, Iterable
+
+import pandas as pd
+
+from .input import get_input_values_from_directory, _INPUT_NAMES_AND_TYPES, _OUTPUT_NAMES
+from .manifest import load_manifest
+from .metrics import metrics_cache_file_in_directory, _ALL_METRICS_LIST
+
+_CATALOG_TABLE = 'runs'
+_SQL_TYPES = {int: 'INTEGER', float: 'REAL'}
+
+
+def catalog_file_in_directory(directory: str) -> str:
+    return os.path.join(directory, 'catalog.sqlite3')
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _catalog_columns() -> Mapping[str, str]:
+    return {
+        'path': 'TEXT PRIMARY KEY',
+        **{name: _SQL_TYPES[type_] for name, type_ in _INPUT_NAMES_AND_TYPES},
+        **{name: 'REAL' for name in _ALL_METRICS_LIST},
+        'fingerprints': 'TEXT',
+        'elapsed': 'REAL',
+        'updated_at': 'REAL',
+    }
+
+
+def open_catalog(catalog_file: str) -> sqlite3.Connection:
+    """
+    Open (and create when needed) the catalog of a campaign, which holds one row per run directory with
+    its input values, metrics, log fingerprints and processing time. The parameter columns are indexed,
+    and the columns of newly added metrics are added to existing catalogs.
+    """
+    conn = sqlite3.connect(catalog_file)
+    columns = _catalog_columns()
+    conn.execute(f'CREATE TABLE IF NOT EXISTS {_CATALOG_TABLE} '
+                 f'({", ".join(f"{_quote(name)} {type_}" for name, type_ in columns.items())})')
+    existing = {row[1] for row in conn.execute(f'PRAGMA table_info({_CATALOG_TABLE})')}
+    for name, type_ in columns.items():
+        if name not in existing:
+            conn.execute(f'ALTER TABLE {_CATALOG_TABLE} ADD COLUMN {_quote(name)} {type_}')
+    for i, (name, _) in enumerate(_INPUT_NAMES_AND_TYPES):
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {_CATALOG_TABLE}_input_{i} ON {_CATALOG_TABLE} ({_quote(name)})')
+    conn.commit()
+    return conn
+
+
+def record_run(conn: sqlite3.Connection, root: str, directory: str, metrics: Mapping[str, object],
+               elapsed: Optional[float] = None):
+    """
+    Insert or update the row of run ``directory`` (keyed by its path relative to ``root``). Metrics which
+    are not in ``metrics`` keep their previously recorded values, unless the fingerprints of the logs have
+    changed since then, in which case they are cleared.
+    """
+    path = os.path.relpath(directory, start=root)
+    values = {
+        **get_input_values_from_directory(directory),
+        **{name: metrics[name] for name in _ALL_METRICS_LIST if name in metrics},
+        'fingerprints': json.dumps((load_manifest(metrics_cache_file_in_directory(directory)) or {}).get('sources')),
+        'elapsed': elapsed,
+        'updated_at': time.time(),
+    }
+    row = conn.execute(f'SELECT fingerprints FROM {_CATALOG_TABLE} WHERE path = ?', [path]).fetchone()
+    if row is not None and row[0] != values['fingerprints']:  # the other metrics are of the old logs
+        values.update({name: None for name in _ALL_METRICS_LIST if name not in values})
+
+    # not an UPSERT, which needs SQLite 3.24
+    names = list(values)
+    cursor = conn.execute(
+        f'UPDATE {_CATALOG_TABLE} SET {", ".join(f"{_quote(name)} = ?" for name in names)} WHERE path = ?',
+        [*(values[name] for name in names), path],
+    )
+    if cursor.rowcount == 0:
+        names = ['path', *names]
+        values['path'] = path
+        conn.execute(
+            f'INSERT INTO {_CATALOG_TABLE} ({", ".join(map(_quote, names))}) '
+            f'VALUES ({", ".join("?" for _ in names)})',
+            [values[name] for name in names],
+        )
+    conn.commit()
+
+
+def load_catalog(catalog_file: str, where: Optional[str] = None, params: Iterable[object] = ()) -> pd.DataFrame:
+    """
+    Runs of the catalog as a table laid out like the exported metrics (``Path`` and then the names of
+    ``_ALL_NAME_LIST``), optionally filtered with an SQL ``where`` condition and its ``params``, e.g.
+    ``load_catalog(file, '"perception" >= ?', [0.5])``.
+    """
+    columns = ['path AS Path', *map(_quote, _OUTPUT_NAMES), *map(_quote, _ALL_METRICS_LIST)]
+    sql = f'SELECT {", ".join(columns)} FROM {_CATALOG_TABLE}'
+    if where:
+        sql += f' WHERE {where}'
+    sql += ' ORDER BY path'
+
+    with closing(sqlite3.connect(catalog_file)) as conn:
+        return pd.read_sql_query(sql, conn, params=list(params))
+
+
+def load_metrics_table(filename: str) -> pd.DataFrame:
+    # metrics exported into a csv file, or the catalog of a campaign
+    if os.path.splitext(filename)[1].lower() == '.sqlite3':
+        return load_catalog(filename)
+    else:
+        return pd.read_csv(filename)
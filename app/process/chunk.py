@@ -0,0 +1,183 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Mapping, Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .frame import FrameIndex, index_frames, open_dat, iter_dat_blocks, is_compressed
+
+DEFAULT_CHUNK_ROWS = 1 << 16
+
+
+def _decode_in_worker(decode: Callable[..., pd.DataFrame], src_file: str, frames: FrameIndex) -> pd.DataFrame:
+    with open_dat(src_file) as con:
+        return decode(con, frames)
+
+
+def _detach(buf, frames: FrameIndex) -> Tuple[bytes, FrameIndex]:
+    # copy of the frames' bytes with the index rebased on it, for the workers which can not map the buffer
+    start = int(frames.offsets[0])
+    return bytes(buf[start:frames.end]), \
+        FrameIndex(frames.offsets - start, frames.lengths, frames.types, frames.end - start)
+
+
+def _iter_chunks(src_file: str, chunk_rows: int, spans: Optional[np.ndarray]) -> Iterator[Tuple[object, FrameIndex]]:
+    if spans is not None and not is_compressed(src_file):
+        with open_dat(src_file) as con:
+            for start, stop in spans:
+                for chunk in index_frames(con[:stop], start=int(start)).chunks(chunk_rows):
+                    yield con, chunk
+        return
+
+    for buf, block, base in iter_dat_blocks(src_file):
+        if spans is not None:
+            if len(spans) == 0 or base >= spans[-1, 1]:
+                break
+            offsets = block.offsets + base
+            span = np.maximum(np.searchsorted(spans[:, 0], offsets, side='right') - 1, 0)
+            block = block.take((offsets >= spans[span, 0]) & (offsets < spans[span, 1]))
+        for chunk in block.chunks(chunk_rows):
+            yield buf, chunk
+
+
+def iter_decoded(decode: Callable[..., pd.DataFrame], src_file: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 workers: Optional[int] = None, spans: Optional[np.ndarray] = None) -> Iterator[pd.DataFrame]:
+    """
+    Apply ``decode(con, frames)`` to consecutive ranges of ``chunk_rows`` frames of ``src_file`` (only the
+    frames starting in ``spans`` when given), and yield the reindexed chunks in file order. With ``workers``,
+    the ranges are decoded in a process pool, so ``decode`` must be picklable.
+    """
+    if not workers or workers <= 1:
+        yield from iter_reindexed(decode(con, chunk) for con, chunk in _iter_chunks(src_file, chunk_rows, spans))
+        return
+
+    def _iter_parallel():
+        compressed = is_compressed(src_file)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for con, chunk in _iter_chunks(src_file, chunk_rows, spans):
+                if compressed:
+                    pending.append(executor.submit(decode, *_detach(con, chunk)))
+                else:
+                    pending.append(executor.submit(_decode_in_worker, decode, src_file, chunk))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    yield from iter_reindexed(_iter_parallel())
+
+
+class DatFollower:
+    """
+    Resumable decoder of a ``.dat`` log which is still being written. Every :meth:`poll` decodes only the
+    frames appended since the last one, a partially written trailing frame is left for the next poll.
+    """
+
+    def __init__(self, decode: Callable[..., pd.DataFrame], src_file: str, dtypes: Mapping[str, np.dtype]):
+        if is_compressed(src_file):
+            raise ValueError(f'Compressed file {repr(src_file)} can not be followed.')
+        self.decode = decode
+        self.src_file = src_file
+        self.dtypes = dtypes
+        self.offset = 0  # end of the last complete frame
+        self.rows = 0
+
+    def poll(self) -> pd.DataFrame:
+        size = os.path.getsize(self.src_file)
+        if size < self.offset:
+            raise ValueError(f'File {repr(self.src_file)} has been truncated while being followed.')
+
+        chunk = None
+        if size > self.offset:
+            with open_dat(self.src_file) as con:
+                frames = index_frames(con, start=self.offset)
+                if len(frames) > 0:
+                    chunk = self.decode(con, frames)
+                self.offset = frames.end
+
+        if chunk is None or len(chunk) == 0:
+            return empty_frame(self.dtypes)
+        chunk.index = pd.RangeIndex(self.rows, self.rows + len(chunk))
+        self.rows += len(chunk)
+        return chunk
+
+
+def empty_frame(dtypes: Mapping[str, np.dtype]) -> pd.DataFrame:
+    return pd.DataFrame({name: np.empty(0, dtype=dtype) for name, dtype in dtypes.items()})
+
+
+def _fits(values: np.ndarray, dtype: np.dtype) -> bool:
+    if len(values) == 0:
+        return True
+    info = np.iinfo(dtype)
+    return info.min <= values.min() and values.max() <= info.max
+
+
+def compact_frame(df: pd.DataFrame, compact_dtypes: Mapping[str, object]) -> pd.DataFrame:
+    """
+    Convert the columns of ``df`` into their ``compact_dtypes`` (e.g. ``np.uint16`` or ``'category'``),
+    the columns which are not in ``compact_dtypes`` are kept as they are. An integer column is narrowed
+    only when all its values fit, so that the values are never changed.
+    """
+    dtypes = {}
+    for name, dtype in compact_dtypes.items():
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if name in df.columns and df[name].dtype != dtype:
+            if isinstance(dtype, np.dtype) and dtype.kind in 'ui' and not _fits(df[name].values, dtype):
+                continue
+            dtypes[name] = dtype
+
+    return df.astype(dtypes) if dtypes else df
+
+
+def full_frame(df: pd.DataFrame, dtypes: Mapping[str, np.dtype]) -> pd.DataFrame:
+    # back to the decoded ``dtypes`` from the ones of :func:`compact_frame`
+    dtypes = {name: dtype for name, dtype in dtypes.items() if name in df.columns and df[name].dtype != dtype}
+    return df.astype(dtypes) if dtypes else df
+
+
+def iter_reindexed(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Skip empty chunks and number the rows of the others continuously, so that concatenating them gives
+    the same frame as decoding the whole file at once.
+    """
+    start = 0
+    for chunk in chunks:
+        if len(chunk) > 0:
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+
+def concat_chunks(chunks: Iterable[pd.DataFrame], dtypes: Mapping[str, np.dtype]) -> pd.DataFrame:
+    chunks = list(chunks)
+    if len(chunks) == 1:
+        return chunks[0]
+    elif chunks:
+        return pd.concat(chunks)
+    else:
+        return empty_frame(dtypes)
+
+
+def frame_to_csv(df: pd.DataFrame, dst_file: str, mode: str = 'w', header: bool = True):
+    """
+    Export ``df`` with its index, the float32 columns (e.g. ``height``) are written as float64, i.e. with
+    the digits of their exact values. So a plain ``pd.read_csv`` gives the decoded values instead of their
+    shortest float32 decimals (which shifts the metrics), and reading them as float32 gives them back
+    unchanged.
+    """
+    widened = {name: np.float64 for name, dtype in df.dtypes.items() if dtype == np.float32}
+    (df.astype(widened) if widened else df).to_csv(dst_file, mode=mode, header=header)
+
+
+def chunks_to_csv(chunks: Iterable[pd.DataFrame], dst_file: str, dtypes: Mapping[str, np.dtype]):
+    empty = True
+    for chunk in chunks:
+        frame_to_csv(chunk, dst_file, mode='w' if empty else 'a', header=empty)
+        empty = False
+
+    if empty:
+        frame_to_csv(empty_frame(dtypes), dst_file)
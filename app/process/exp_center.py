@@ -1,13 +1,37 @@
 import glob
 import os
+from typing import Iterator, Optional, Iterable
 
+import numpy as np
 import pandas as pd
 
 from app.proto import MpsProtoData
+from .chunk import DEFAULT_CHUNK_ROWS, DatFollower, chunks_to_csv
+from .frame import is_compressed
+from .index import DatIndex
+from .manifest import manifest_file_of, build_if_stale
+from .schema import DECODER_VERSION, RecordSchema, register_schema, schema_index, iter_records, records_trans, \
+    follow_records
+
+EXP_CENTER_DTYPES = {
+    'id': np.uint32,
+    'type': np.uint32,
+    'time': np.float64,
+    'lng': np.float64,
+    'lat': np.float64,
+    'height': np.float32,
+}
+
+EXP_CENTER_COMPACT_DTYPES = {
+    'id': np.uint16,
+    'type': 'category',
+}
+
+_CENTER_IDS = (20000,)
 
 
 def find_expdata_in_directory(directory: str):
-    matchings = glob.glob1(directory, 'expdata_*')
+    matchings = sorted(glob.glob1(directory, 'expdata_*'), key=is_compressed)  # plain logs first
     if matchings:
         return os.path.join(directory, matchings[0])
     else:
@@ -18,6 +42,10 @@ def exp_center_file_in_directory(directory: str) -> str:
     return os.path.join(directory, 'exp_center.csv')
 
 
+def exp_center_cache_file_in_directory(directory: str) -> str:
+    return os.path.join(directory, 'exp_center.npz')
+
+
 def exp_center_process_in_directory(directory: str, force: bool = False):
     return exp_center_process(
         find_expdata_in_directory(directory),
@@ -26,53 +54,46 @@ def exp_center_process_in_directory(directory: str, force: bool = False):
     )
 
 
-def exp_center_trans(src_file: str) -> pd.DataFrame:
-    mpd = MpsProtoData()
-    with open(src_file, 'rb') as f:
-        con = f.read()
-        index = 0
-        data = {
-            'id': [],
-            'type': [],
-            'time': [],
-            'lng': [],
-            'lat': [],
-            'height': []
-        }
-        while index < len(con):
-            type_ = con[index]
-            cur = index + 1
-            lengths = []
-            while con[cur] >= 128:
-                lengths.append(con[cur] - 128)
-                cur += 1
-            if len(lengths) < 5:
-                lengths.append(con[cur])
-            lengths.reverse()
-            final_length = 0
-            for length in lengths:
-                final_length = final_length * 128 + length
-            content = con[cur + 1:cur + 1 + final_length]
-            if type_ == 1:
-                index = cur + 1 + final_length
-                continue
-            else:
-                mpd.ParseFromString(content)
-                if mpd.id == 20000:
-                    data['id'].append(mpd.id)
-                    data['type'].append(mpd.type)
-                    data['time'].append(mpd.time)
-                    data['lng'].append(mpd.lng)
-                    data['lat'].append(mpd.lat)
-                    data['height'].append(mpd.h)
-            index = cur + 1 + final_length
-
-        return pd.DataFrame(data)
-
-
-def exp_center_process(src_file: str, dst_file: str, force: bool = False):
-    if not force and os.path.exists(dst_file):
-        return
-
-    df = exp_center_trans(src_file)
-    df.to_csv(dst_file)
+EXP_CENTER_SCHEMA = register_schema(RecordSchema(
+    'exp_center', MpsProtoData, EXP_CENTER_DTYPES,
+    paths={
+        'id': 'id',
+        'type': 'type',
+        'time': 'time',
+        'lng': 'lng',
+        'lat': 'lat',
+        'height': 'h',
+    },
+    skip_types=(1,),  # MpsHead
+    compact_dtypes=EXP_CENTER_COMPACT_DTYPES,
+))
+
+
+def expdata_index(src_file: str) -> DatIndex:
+    return schema_index(EXP_CENTER_SCHEMA, src_file)
+
+
+def iter_exp_center(src_file: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                    ids: Optional[Iterable[int]] = _CENTER_IDS, types: Optional[Iterable[int]] = None,
+                    workers: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    return iter_records(EXP_CENTER_SCHEMA, src_file, chunk_rows, include={'id': ids, 'type': types},
+                        workers=workers)
+
+
+def exp_center_trans(src_file: str, ids: Optional[Iterable[int]] = _CENTER_IDS,
+                     types: Optional[Iterable[int]] = None, workers: Optional[int] = None,
+                     compact: bool = True) -> pd.DataFrame:
+    return records_trans(EXP_CENTER_SCHEMA, src_file, include={'id': ids, 'type': types}, workers=workers,
+                         compact=compact)
+
+
+def follow_exp_center(src_file: str, ids: Optional[Iterable[int]] = _CENTER_IDS,
+                      types: Optional[Iterable[int]] = None) -> DatFollower:
+    return follow_records(EXP_CENTER_SCHEMA, src_file, include={'id': ids, 'type': types})
+
+
+def exp_center_process(src_file: str, dst_file: str, force: bool = False) -> bool:
+    return build_if_stale(
+        manifest_file_of(dst_file), [src_file], [dst_file], str(DECODER_VERSION),
+        lambda: chunks_to_csv(iter_exp_center(src_file), dst_file, EXP_CENTER_DTYPES), force,
+    )
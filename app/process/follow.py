@@ -0,0 +1,152 @@
+from typing import Tuple, Optional, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .chunk import concat_chunks, empty_frame, frame_to_csv
+from .exp_center import find_expdata_in_directory, exp_center_file_in_directory, follow_exp_center, \
+    EXP_CENTER_DTYPES, EXP_CENTER_SCHEMA
+from .input import find_input_file_in_directory, get_input_values
+from .log import _center_means, _join_centers, _log_sources, _save_log_quietly, compact_log, \
+    _CENTER_TICKS_PER_SECOND
+from .manifest import source_fingerprints
+from .metrics import compute_metrics
+from .outformation import find_outformation_in_directory, OutformationFollower
+from .schema import compact_table
+from .simudata import find_simudata_in_directory, simudata_file_in_directory, follow_simudata, \
+    SIMUDATA_DTYPES, SIMUDATA_SCHEMA
+from .trajectory import TrajectoryIndex
+from .trans import time_ticks
+
+_EXP_CENTER_LOG_DTYPES = {**EXP_CENTER_DTYPES, 'r_x': np.float64, 'r_y': np.float64, 'r_h': np.float64}
+
+# errors of the metrics on logs which are not complete yet, e.g. before the first frames or while the
+# outformation log is behind the other ones
+_INCOMPLETE_ERRORS = {
+    'formation_num': (ZeroDivisionError,),
+    'initial_reduce': (IndexError,),
+    'final_total_size': (IndexError,),
+    'dispersion': (IndexError,),
+    'density': (IndexError, ZeroDivisionError),
+    'center_gap': (ZeroDivisionError,),
+    'polarization': (IndexError,),
+    'stable_time': (ZeroDivisionError,),
+}
+
+
+class LogFollower:
+    """
+    Incremental :func:`log_process` of a log directory whose simulation is still running. A frame of
+    simudata is closed (and its centroid calculated) once simudata has moved past its time, and
+    ``poll(final=True)`` closes the remaining ones and saves the cache files.
+    """
+
+    def __init__(self, directory: str, write_csv: bool = True, compact: bool = True):
+        self.directory = directory
+        self.write_csv = write_csv
+        self.compact = compact
+
+        self._simudata = follow_simudata(find_simudata_in_directory(directory))
+        self._exp_center = follow_exp_center(find_expdata_in_directory(directory))
+        self._outformation = OutformationFollower(find_outformation_in_directory(directory))
+
+        self._open = empty_frame({'time': np.float64, 'x': np.float64, 'y': np.float64, 'height': np.float32})
+        self._center_means = _center_means(self._open)
+        self._last_tick = None
+        self._pending = empty_frame(EXP_CENTER_DTYPES)
+        self._written = set()
+
+        self._simudata_chunks: List[pd.DataFrame] = []
+        self._simudata_df: Optional[pd.DataFrame] = None  # concatenation of the chunks, until new ones come
+        self._trajectory = TrajectoryIndex(empty_frame(SIMUDATA_DTYPES))
+        self._indexed_chunks = 0
+        self._exp_center_chunks: List[pd.DataFrame] = []
+        self._exp_center_rows = 0
+        self.outformation_data: List[Tuple[float, int, int]] = []
+
+    @property
+    def simudata(self) -> pd.DataFrame:
+        if self._simudata_df is None:
+            simudata = concat_chunks(self._simudata_chunks, SIMUDATA_DTYPES)
+            self._simudata_df = compact_table(SIMUDATA_SCHEMA, simudata) if self.compact else simudata
+        return self._simudata_df
+
+    @property
+    def trajectory(self) -> TrajectoryIndex:
+        # extended with the new chunks only
+        for chunk in self._simudata_chunks[self._indexed_chunks:]:
+            self._trajectory.extend(chunk)
+        self._indexed_chunks = len(self._simudata_chunks)
+        return self._trajectory
+
+    @property
+    def exp_center(self) -> pd.DataFrame:
+        exp_center = concat_chunks(self._exp_center_chunks, _EXP_CENTER_LOG_DTYPES)
+        return compact_table(EXP_CENTER_SCHEMA, exp_center) if self.compact else exp_center
+
+    def _append_csv(self, chunk: pd.DataFrame, dst_file: str):
+        if self.write_csv:
+            first = dst_file not in self._written
+            if len(chunk) > 0 or first:
+                frame_to_csv(chunk, dst_file, mode='w' if first else 'a', header=first)
+                self._written.add(dst_file)
+
+    def _close_frames(self, simudata_chunk: pd.DataFrame, final: bool):
+        records = pd.concat([self._open, simudata_chunk[list(self._open.columns)]], ignore_index=True)
+        ticks = time_ticks(records['time'].values, _CENTER_TICKS_PER_SECOND)
+        if len(ticks) > 0:
+            self._last_tick = int(ticks.max())
+        closed = np.ones(len(records), dtype=bool) if final else ticks < self._last_tick
+
+        means = _center_means(records[closed])
+        self._center_means = pd.concat([self._center_means, means[~means.index.isin(self._center_means.index)]])
+        self._open = records[~closed].reset_index(drop=True)
+
+    def _complete_exp_center(self, final: bool) -> pd.DataFrame:
+        if final:
+            done = np.ones(len(self._pending), dtype=bool)
+        elif self._last_tick is not None:
+            done = time_ticks(self._pending['time'].values, _CENTER_TICKS_PER_SECOND) < self._last_tick
+        else:
+            done = np.zeros(len(self._pending), dtype=bool)
+
+        chunk = _join_centers(self._pending[done].reset_index(drop=True), self._center_means)
+        chunk.index = pd.RangeIndex(self._exp_center_rows, self._exp_center_rows + len(chunk))
+        self._exp_center_rows += len(chunk)
+        self._pending = self._pending[~done].reset_index(drop=True)
+        return chunk
+
+    def poll(self, final: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Returns the new simudata rows and the newly completed exp_center rows.
+        """
+        fingerprints = source_fingerprints(_log_sources(self.directory)) if final else None
+        simudata_chunk = self._simudata.poll()
+        if len(simudata_chunk) > 0:
+            self._simudata_chunks.append(simudata_chunk)
+            self._simudata_df = None
+        self._close_frames(simudata_chunk, final)
+        self._append_csv(simudata_chunk, simudata_file_in_directory(self.directory))
+
+        exp_center_chunk = self._exp_center.poll()
+        if len(exp_center_chunk) > 0:
+            self._pending = pd.concat([self._pending, exp_center_chunk], ignore_index=True)
+        exp_center_chunk = self._complete_exp_center(final)
+        if len(exp_center_chunk) > 0:
+            self._exp_center_chunks.append(exp_center_chunk)
+        self._append_csv(exp_center_chunk, exp_center_file_in_directory(self.directory))
+
+        self.outformation_data.extend(self._outformation.poll())
+        if final:
+            exp_center = concat_chunks(self._exp_center_chunks, _EXP_CENTER_LOG_DTYPES)
+            _save_log_quietly(self.directory, *compact_log(self.simudata, exp_center), fingerprints)
+        return simudata_chunk, exp_center_chunk
+
+    def metrics(self, shown_names: Optional[List[str]] = None) -> Mapping[str, object]:
+        """
+        Metrics of the data followed so far, the ones which can not be calculated yet (e.g. before the
+        first complete frame) are ``nan``.
+        """
+        input_values = get_input_values(find_input_file_in_directory(self.directory))
+        return compute_metrics(input_values, self.simudata, self.exp_center.reset_index(drop=True),
+                               self.outformation_data, shown_names, self.trajectory, _INCOMPLETE_ERRORS)
@@ -0,0 +1,147 @@
+import gzip
+import mmap
+import os
+from array import array
+from contextlib import contextmanager
+from typing import NamedTuple, Iterator, BinaryIO, Tuple
+
+import numpy as np
+import zstandard
+
+DEFAULT_STREAM_BLOCK = 1 << 22
+
+
+class FrameIndex(NamedTuple):
+    offsets: np.ndarray  # int64, offset of each payload in the buffer
+    lengths: np.ndarray  # int64, length of each payload
+    types: np.ndarray  # uint8, type byte in front of each frame
+    end: int  # offset right after the last complete frame
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def chunks(self, size: int) -> Iterator['FrameIndex']:
+        for start in range(0, len(self), size):
+            stop = min(start + size, len(self))
+            yield FrameIndex(
+                self.offsets[start:stop], self.lengths[start:stop], self.types[start:stop],
+                int(self.offsets[stop - 1] + self.lengths[stop - 1]),
+            )
+
+    def take(self, mask: np.ndarray) -> 'FrameIndex':
+        offsets, lengths = self.offsets[mask], self.lengths[mask]
+        return FrameIndex(
+            offsets, lengths, self.types[mask],
+            int(offsets[-1] + lengths[-1]) if len(offsets) > 0 else 0,
+        )
+
+
+def index_frames(buf, start: int = 0) -> FrameIndex:
+    """
+    Scan the ``[type byte][varint length][payload]`` frames of a ``.dat`` log in one pass, up to the
+    first frame which is not complete in ``buf``.
+    """
+    offsets, lengths, types = array('q'), array('q'), array('B')
+    total = len(buf)
+    index = start
+    while index + 1 < total:
+        cur = index + 1
+        byte = buf[cur]
+        length = byte & 0x7f
+        shift = 7
+        while byte & 0x80:
+            cur += 1
+            if cur >= total:
+                break
+            byte = buf[cur]
+            length |= (byte & 0x7f) << shift
+            shift += 7
+        else:
+            payload_end = cur + 1 + length
+            if payload_end <= total:
+                types.append(buf[index])
+                offsets.append(cur + 1)
+                lengths.append(length)
+                index = payload_end
+                continue
+        break
+
+    return FrameIndex(
+        np.frombuffer(offsets, dtype=np.int64) if offsets else np.zeros(0, dtype=np.int64),
+        np.frombuffer(lengths, dtype=np.int64) if lengths else np.zeros(0, dtype=np.int64),
+        np.frombuffer(types, dtype=np.uint8) if types else np.zeros(0, dtype=np.uint8),
+        index,
+    )
+
+
+def _open_zstd(src_file: str) -> BinaryIO:
+    return zstandard.ZstdDecompressor().stream_reader(open(src_file, 'rb'), closefd=True)
+
+
+_DECOMPRESSORS = {
+    '.gz': gzip.open,
+    '.zst': _open_zstd,
+}
+
+
+def is_compressed(src_file: str) -> bool:
+    return os.path.splitext(src_file)[1].lower() in _DECOMPRESSORS
+
+
+def open_stream(src_file: str) -> BinaryIO:
+    """
+    Open ``src_file`` for reading, ``.gz`` and ``.zst`` files are decompressed on the fly.
+    """
+    decompressor = _DECOMPRESSORS.get(os.path.splitext(src_file)[1].lower())
+    return open(src_file, 'rb') if decompressor is None else decompressor(src_file)
+
+
+def iter_dat_blocks(src_file: str, block_size: int = DEFAULT_STREAM_BLOCK) \
+        -> Iterator[Tuple[memoryview, FrameIndex, int]]:
+    """
+    Yield ``(buf, frames, base)`` tuples covering the complete frames of ``src_file``, ``base`` is the
+    offset of ``buf`` in the (decompressed) log. Compressed logs are decompressed in blocks of about
+    ``block_size`` bytes.
+    """
+    if not is_compressed(src_file):
+        with open_dat(src_file) as con:
+            yield con, index_frames(con), 0
+        return
+
+    with open_stream(src_file) as f:
+        pending, base = b'', 0
+        while True:
+            data = f.read(block_size)
+            if not data:
+                break
+
+            buf = pending + data
+            frames = index_frames(buf)
+            if len(frames) > 0:
+                yield memoryview(buf), frames, base
+            pending, base = buf[frames.end:], base + frames.end
+
+
+@contextmanager
+def open_dat(src_file: str) -> Iterator[memoryview]:
+    """
+    Open a ``.dat`` log as a read-only memory map, compressed logs are decompressed in memory instead.
+    """
+    if is_compressed(src_file):
+        with open_stream(src_file) as f:
+            yield memoryview(f.read())
+        return
+
+    with open(src_file, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can not be mapped
+            yield memoryview(b'')
+            return
+
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+            mm.close()
@@ -0,0 +1,145 @@
+from typing import NamedTuple, Optional, Iterable, Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .frame import FrameIndex, iter_dat_blocks
+from .manifest import hidden_file_of, file_stamp, atomic_write
+from .wire import wire_decoder
+
+_INDEX_VERSION = 3
+DEFAULT_BLOCK_FRAMES = 4096
+
+
+class DatIndex(NamedTuple):
+    block_offsets: np.ndarray  # int64, offset of the first frame of each block of ``block_frames`` frames
+    end: int  # offset right after the last complete frame
+    block_frames: int
+    block_min_times: np.ndarray  # float64, nan for blocks without timed records
+    block_max_times: np.ndarray
+    ids: Optional[np.ndarray] = None  # sorted distinct values of the peeked id columns of the rows
+    rows: Optional[int] = None  # count of the rows whose ids are peeked
+
+    @property
+    def time_range(self):
+        if np.isnan(self.block_min_times).all():
+            return None
+        else:
+            return float(np.nanmin(self.block_min_times)), float(np.nanmax(self.block_max_times))
+
+    def select(self, t_start: Optional[float] = None, t_end: Optional[float] = None) -> np.ndarray:
+        """
+        Byte spans ``[start, stop)`` of the blocks which may contain records in ``[t_start, t_end]``, as an
+        array of shape ``[n, 2]`` with the consecutive blocks merged. The frames of the spans are indexed
+        again when reading them, and the records still need to be filtered by time after decoding.
+        """
+        blocks = np.ones(len(self.block_min_times), dtype=bool)
+        if t_start is not None:
+            blocks &= self.block_max_times >= t_start
+        if t_end is not None:
+            blocks &= self.block_min_times <= t_end
+
+        stops = np.append(self.block_offsets[1:], self.end)
+        firsts = blocks & ~np.concatenate([[False], blocks[:-1]])
+        lasts = blocks & ~np.concatenate([blocks[1:], [False]])
+        return np.stack([self.block_offsets[firsts], stops[lasts]], axis=1).astype(np.int64).reshape(-1, 2)
+
+
+def dat_index_file(src_file: str) -> str:
+    return hidden_file_of(src_file, 'idx.npz')
+
+
+def _load_dat_index(index_file: str, stamp: Mapping[str, int], block_frames: int,
+                    with_ids: bool) -> Optional[DatIndex]:
+    try:
+        with np.load(index_file) as data:
+            if int(data['version']) != _INDEX_VERSION or int(data['block_frames']) != block_frames or \
+                    any(int(data[key]) != value for key, value in stamp.items()) or ('ids' in data) != with_ids:
+                return None
+
+            return DatIndex(data['block_offsets'], int(data['end']), block_frames,
+                            data['block_min_times'], data['block_max_times'],
+                            data['ids'] if with_ids else None, int(data['rows']) if with_ids else None)
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_dat_index(index_file: str, stamp: Mapping[str, int], index: DatIndex):
+    ids = {} if index.ids is None else {'ids': index.ids, 'rows': index.rows}
+    atomic_write(index_file, lambda tmp_file: np.savez(
+        tmp_file, version=_INDEX_VERSION, block_frames=index.block_frames, **stamp,
+        block_offsets=index.block_offsets, end=index.end,
+        block_min_times=index.block_min_times, block_max_times=index.block_max_times, **ids,
+    ), quiet=True)
+
+
+def _build_dat_index(src_file: str, message_class, time_path: str, skip_types: Iterable[int],
+                     block_frames: int, peek_ids: Optional[Callable[[object, FrameIndex], pd.DataFrame]]) -> DatIndex:
+    decoder = wire_decoder(message_class)
+    block_offsets, min_times, max_times = [], [], []
+    ids, rows = np.zeros(0, dtype=np.int64), 0
+    starts, times = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)  # of the unfinished block
+    end = 0
+
+    def _add_blocks(final: bool):
+        nonlocal starts, times
+        count = len(starts) if final else len(starts) // block_frames * block_frames
+        for start in range(0, count, block_frames):
+            block_times = times[start:start + block_frames]
+            block_times = block_times[~np.isnan(block_times)]
+            block_offsets.append(starts[start])
+            min_times.append(block_times.min() if len(block_times) > 0 else np.nan)
+            max_times.append(block_times.max() if len(block_times) > 0 else np.nan)
+        starts, times = starts[count:], times[count:]
+
+    for buf, frames, base in iter_dat_blocks(src_file):
+        timed = ~np.isin(frames.types, list(skip_types))
+        frame_times = np.full(len(frames), np.nan)
+        frame_times[timed] = decoder.decode(buf, frames.offsets[timed], frames.lengths[timed],
+                                            paths=[time_path])[time_path]
+        # a frame starts where the previous one ends, the blocks of the stream start with a frame
+        frame_starts = np.concatenate([[0], frames.offsets[:-1] + frames.lengths[:-1]]).astype(np.int64) + base
+        starts, times = np.concatenate([starts, frame_starts]), np.concatenate([times, frame_times])
+        end = base + frames.end
+        _add_blocks(final=False)
+        if peek_ids is not None:
+            block_ids = peek_ids(buf, frames)
+            ids, rows = np.union1d(ids, np.unique(block_ids.values)), rows + len(block_ids)
+
+    _add_blocks(final=True)
+    index = DatIndex(np.asarray(block_offsets, dtype=np.int64), end, block_frames,
+                     np.asarray(min_times, dtype=np.float64), np.asarray(max_times, dtype=np.float64))
+    return index if peek_ids is None else index._replace(ids=ids, rows=rows)
+
+
+def load_dat_index(src_file: str, message_class, time_path: str, skip_types: Iterable[int] = (),
+                   block_frames: int = DEFAULT_BLOCK_FRAMES,
+                   peek_ids: Optional[Callable[[object, FrameIndex], pd.DataFrame]] = None) -> DatIndex:
+    """
+    Load the sidecar index of ``src_file``, it is (re)built and saved when missing or when the size or
+    modification time of ``src_file`` has changed. Frames whose type byte is in ``skip_types`` (e.g.
+    the header of expdata) are not taken into account for the block times. With ``peek_ids(buf, frames)``,
+    which decodes the id columns of the records of a block, the distinct ids and the count of rows are
+    collected in the same pass.
+    """
+    index_file = dat_index_file(src_file)
+    stamp = file_stamp(src_file)
+    index = _load_dat_index(index_file, stamp, block_frames, peek_ids is not None)
+    if index is None:
+        index = _build_dat_index(src_file, message_class, time_path, skip_types, block_frames, peek_ids)
+        _save_dat_index(index_file, stamp, index)
+
+    return index
+
+
+def select_spans(index: Callable[[str], DatIndex], src_file: str,
+                 t_start: Optional[float] = None, t_end: Optional[float] = None) -> Optional[np.ndarray]:
+    """
+    Byte spans of ``src_file`` which may hold records in ``[t_start, t_end]`` according to its sidecar index
+    (see :meth:`DatIndex.select`), ``None`` (i.e. the whole file, which does not need the sidecar) when
+    there is no time window.
+    """
+    if t_start is None and t_end is None:
+        return None
+    else:
+        return index(src_file).select(t_start, t_end)
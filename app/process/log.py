@@ -1,12 +1,24 @@
 import os
-from operator import itemgetter
-from typing import Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Iterator, Mapping, List
 
 import numpy as np
 import pandas as pd
 
-from .exp_center import find_expdata_in_directory, exp_center_file_in_directory, exp_center_trans
-from .simudata import find_simudata_in_directory, simudata_file_in_directory, simudata_trans
+from .chunk import concat_chunks, chunks_to_csv, frame_to_csv, full_frame
+from .exp_center import find_expdata_in_directory, exp_center_file_in_directory, exp_center_cache_file_in_directory, \
+    exp_center_trans, EXP_CENTER_SCHEMA, EXP_CENTER_DTYPES
+from .manifest import manifest_file_of, is_up_to_date, source_fingerprints, save_manifest
+from .schema import DECODER_VERSION, compact_table
+from .simudata import find_simudata_in_directory, simudata_file_in_directory, simudata_cache_file_in_directory, \
+    iter_simudata, SIMUDATA_DTYPES, SIMUDATA_SCHEMA
+from .store import save_frame, load_frame
+from .trans import time_ticks
+
+_LOG_PROCESS_VERSION = f'{DECODER_VERSION}.4'
+
+# a single writer, so that the files of a directory are never written by two threads at the same time
+_LOG_WRITER = ThreadPoolExecutor(max_workers=1)
 
 
 def is_log_directory(directory: str) -> bool:
@@ -25,47 +37,120 @@ def walk_log_directories(root: str) -> Iterator[str]:
             yield directory
 
 
-def log_trans(directory: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    simudata_df = simudata_trans(find_simudata_in_directory(directory))
-    exp_center_df = exp_center_trans(find_expdata_in_directory(directory))
+# the times of simudata and expdata are matched on microsecond ticks, so that the float noise of the
+# logged times does not split the records of a frame
+_CENTER_TICKS_PER_SECOND = 10 ** 6
+
 
-    records = {}
-    for lineno, row in simudata_df.iterrows():
-        time_ = row['time']
-        x, y = row['x'], row['y']
-        height = row['height']
-        if time_ not in records:
-            records[time_] = []
-        records[time_].append((x, y, height))
+def _center_means(simudata_df: pd.DataFrame) -> pd.DataFrame:
+    # np.mean of the positions of every frame in their order in simudata, i.e. the arithmetic of the original
+    # centroids, which does not depend on how the records are chunked
+    ticks = time_ticks(simudata_df['time'].values, _CENTER_TICKS_PER_SECOND)
+    order = np.argsort(ticks, kind='stable')
+    frame_ticks, starts = np.unique(ticks[order], return_index=True)
+    bounds = list(zip(starts.tolist(), [*starts[1:].tolist(), len(order)]))
 
     means = {}
-    for time_, items in records.items():
-        x_array = np.asarray(list(map(itemgetter(0), items)))
-        y_array = np.asarray(list(map(itemgetter(1), items)))
-        h_array = np.asarray(list(map(itemgetter(2), items)))
-        means[time_] = (np.mean(x_array), np.mean(y_array), np.mean(h_array))
-
-    xs, ys, hs = [], [], []
-    for lineno, row in exp_center_df.iterrows():
-        time_ = row['time']
-        rx, ry, rh = means.get(time_, (-1, -1, -1))
-        xs.append(rx)
-        ys.append(ry)
-        hs.append(rh)
-
-    exp_center_df['r_x'] = xs
-    exp_center_df['r_y'] = ys
-    exp_center_df['r_h'] = hs
+    for column in ['x', 'y', 'height']:
+        values = np.asarray(simudata_df[column].values[order], dtype=np.float64)
+        means[column] = np.asarray([np.mean(values[start:end]) for start, end in bounds], dtype=np.float64)
+    return pd.DataFrame(means, index=frame_ticks)
+
+
+def _join_centers(exp_center_df: pd.DataFrame, means: pd.DataFrame) -> pd.DataFrame:
+    means = means.reindex(time_ticks(exp_center_df['time'].values, _CENTER_TICKS_PER_SECOND))
+    xs, ys, hs = means['x'].values, means['y'].values, means['height'].values
+
+    exp_center_df['r_x'] = np.nan_to_num(xs, nan=-1)
+    exp_center_df['r_y'] = np.nan_to_num(ys, nan=-1)
+    exp_center_df['r_h'] = np.nan_to_num(hs, nan=-1)
+    return exp_center_df
 
+
+def log_trans(directory: str, compact: bool = True) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    simudata_df = concat_chunks(iter_simudata(find_simudata_in_directory(directory)), SIMUDATA_DTYPES)
+    exp_center_df = _join_centers(exp_center_trans(find_expdata_in_directory(directory), compact=False),
+                                  _center_means(simudata_df))
+    if compact:
+        simudata_df, exp_center_df = compact_log(simudata_df, exp_center_df)
     return simudata_df, exp_center_df
 
 
-def log_process(directory: str, force: bool = False):
-    simudata_file = simudata_file_in_directory(directory)
-    exp_center_file = exp_center_file_in_directory(directory)
-    if not force and os.path.exists(simudata_file) and os.path.exists(exp_center_file):
-        return
+def compact_log(simudata_df: pd.DataFrame, exp_center_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return compact_table(SIMUDATA_SCHEMA, simudata_df), compact_table(EXP_CENTER_SCHEMA, exp_center_df)
+
+
+def _full_log(simudata_df: pd.DataFrame, exp_center_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return full_frame(simudata_df, SIMUDATA_DTYPES), full_frame(exp_center_df, EXP_CENTER_DTYPES)
+
+
+def log_process_manifest_file_in_directory(directory: str) -> str:
+    return manifest_file_of(os.path.join(directory, 'log_process'))
+
+
+def _log_sources(directory: str) -> List[str]:
+    return [find_simudata_in_directory(directory), find_expdata_in_directory(directory)]
+
+
+def _save_log(directory: str, simudata_df: pd.DataFrame, exp_center_df: pd.DataFrame,
+              fingerprints: Mapping[str, Mapping[str, object]], csv: bool = False):
+    save_frame(simudata_df, simudata_cache_file_in_directory(directory))
+    save_frame(exp_center_df, exp_center_cache_file_in_directory(directory))
+    if csv:
+        chunks_to_csv([simudata_df], simudata_file_in_directory(directory), SIMUDATA_DTYPES)
+        frame_to_csv(exp_center_df, exp_center_file_in_directory(directory))
+    save_manifest(log_process_manifest_file_in_directory(directory), fingerprints, _LOG_PROCESS_VERSION)
+
+
+def _save_log_quietly(*args):
+    try:
+        _save_log(*args)
+    except OSError:  # e.g. read-only log directory, the logs are just decoded again next time
+        pass
+
+
+def log_process(directory: str, force: bool = False, csv: bool = False) -> bool:
+    """
+    Save the frames of :func:`log_trans` into the cache files of ``directory`` (and the CSV files with
+    ``csv``), unless these are up to date with the logs or ``force`` is enabled. Returns whether the
+    files have been (re)built.
+    """
+    dst_files = [simudata_cache_file_in_directory(directory), exp_center_cache_file_in_directory(directory)]
+    if csv:
+        dst_files += [simudata_file_in_directory(directory), exp_center_file_in_directory(directory)]
+
+    src_files = _log_sources(directory)
+    if not force and is_up_to_date(log_process_manifest_file_in_directory(directory),
+                                   src_files, dst_files, _LOG_PROCESS_VERSION):
+        return False
+
+    fingerprints = source_fingerprints(src_files)  # before decoding, in case the sources change meanwhile
+    _save_log(directory, *log_trans(directory), fingerprints, csv)
+    return True
+
+
+def load_log(directory: str, force: bool = False, persist: bool = True, compact: bool = True) \
+        -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Simudata and exp_center frames of ``directory``, loaded from its cache files when these are up to
+    date, otherwise decoded (and saved in the background when ``persist`` is enabled).
+    """
+    src_files = _log_sources(directory)
+    dst_files = [simudata_cache_file_in_directory(directory), exp_center_cache_file_in_directory(directory)]
+    if not force and is_up_to_date(log_process_manifest_file_in_directory(directory),
+                                   src_files, dst_files, _LOG_PROCESS_VERSION):
+        simudata_df, exp_center_df = load_frame(dst_files[0]), load_frame(dst_files[1])
+    else:
+        fingerprints = source_fingerprints(src_files)
+        simudata_df, exp_center_df = log_trans(directory)  # the cache files are always compact
+        if persist:
+            _LOG_WRITER.submit(_save_log_quietly, directory, simudata_df, exp_center_df, fingerprints)
+
+    return (simudata_df, exp_center_df) if compact else _full_log(simudata_df, exp_center_df)
+
 
-    simudata_pd, exp_center_pd = log_trans(directory)
-    simudata_pd.to_csv(simudata_file)
-    exp_center_pd.to_csv(exp_center_file)
+def wait_log_writes():
+    """
+    Wait until the cache files submitted by :func:`load_log` so far are written.
+    """
+    _LOG_WRITER.submit(lambda: None).result()
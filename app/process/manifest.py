@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+from functools import partial
+from typing import Iterable, Mapping, Optional, Callable
+
+_HASH_BLOCK = 1 << 20
+
+
+def hidden_file_of(path: str, suffix: str) -> str:
+    # hidden file next to ``path``, so that it is never matched by the ``simudata_*``-like globs
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, f'.{filename}.{suffix}')
+
+
+def manifest_file_of(path: str) -> str:
+    return hidden_file_of(path, 'manifest.json')
+
+
+def atomic_write(dst_file: str, write: Callable[[str], None], quiet: bool = False):
+    """
+    Call ``write`` on a temporary file (with the extension of ``dst_file``) which then replaces
+    ``dst_file``, so that readers never see a partially written file. With ``quiet``, an ``OSError``
+    (e.g. read-only log directory) is ignored, for the files which are just rebuilt when missing.
+    """
+    tmp_file = f'{dst_file}.{os.getpid()}.tmp{os.path.splitext(dst_file)[1]}'
+    try:
+        write(tmp_file)
+        os.replace(tmp_file, dst_file)
+    except OSError:
+        if not quiet:
+            raise
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def file_hash(src_file: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(src_file, 'rb') as f:
+        for block in iter(partial(f.read, _HASH_BLOCK), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_stamp(src_file: str) -> Mapping[str, int]:
+    stat = os.stat(src_file)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def source_fingerprints(src_files: Iterable[str], known: Optional[Mapping[str, Mapping[str, object]]] = None) \
+        -> Mapping[str, Mapping[str, object]]:
+    """
+    Size, modification time and content hash of ``src_files`` by file name. The hashes of ``known``
+    fingerprints whose size and modification time are unchanged are reused instead of reading the files.
+    """
+    known = known or {}
+    fingerprints = {}
+    for src_file in src_files:
+        name = os.path.basename(src_file)
+        stamp = file_stamp(src_file)
+        record = known.get(name)
+        if record is not None and all(record.get(key) == value for key, value in stamp.items()):
+            fingerprints[name] = dict(record)
+        else:
+            fingerprints[name] = {**stamp, 'hash': file_hash(src_file)}
+
+    return fingerprints
+
+
+def load_manifest(manifest_file: str) -> Optional[Mapping[str, object]]:
+    try:
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def save_manifest(manifest_file: str, fingerprints: Mapping[str, Mapping[str, object]], version: str, **extra):
+    def _write(tmp_file: str):
+        with open(tmp_file, 'w') as f:
+            json.dump({'version': version, 'sources': fingerprints, **extra}, f, indent=4, sort_keys=True)
+
+    atomic_write(manifest_file, _write, quiet=True)
+
+
+def check_fingerprints(src_files: Iterable[str], known: Mapping[str, Mapping[str, object]]) \
+        -> Optional[Mapping[str, Mapping[str, object]]]:
+    """
+    Current fingerprints of ``src_files`` when their content is the one of the ``known`` fingerprints,
+    otherwise ``None``. The files are hashed only when their size or modification time changed.
+    """
+    src_files = list(src_files)
+    if set(known) != {os.path.basename(src_file) for src_file in src_files}:
+        return None
+    if any(os.path.getsize(src_file) != known[os.path.basename(src_file)].get('size') for src_file in src_files):
+        return None  # no need to hash them
+
+    fingerprints = source_fingerprints(src_files, known)
+    if any(record['hash'] != known[name].get('hash') for name, record in fingerprints.items()):
+        return None
+    return fingerprints
+
+
+def is_up_to_date(manifest_file: str, src_files: Iterable[str], dst_files: Iterable[str], version: str) -> bool:
+    """
+    Whether ``dst_files`` exist and have been built by ``version`` from the current content of
+    ``src_files`` (see :func:`check_fingerprints`), according to ``manifest_file``. The manifest is
+    refreshed when the sources have only been touched.
+    """
+    manifest = load_manifest(manifest_file)
+    if manifest is None or manifest.get('version') != version or \
+            not all(os.path.exists(dst_file) for dst_file in dst_files):
+        return False
+
+    known = manifest.get('sources') or {}
+    fingerprints = check_fingerprints(src_files, known)
+    if fingerprints is None:
+        return False
+
+    if fingerprints != known:
+        save_manifest(manifest_file, fingerprints, version)
+    return True
+
+
+def build_if_stale(manifest_file: str, src_files: Iterable[str], dst_files: Iterable[str], version: str,
+                   build: Callable[[], None], force: bool = False) -> bool:
+    """
+    Call ``build`` to (re)build ``dst_files`` from ``src_files`` unless they are up to date according to
+    ``manifest_file`` (see :func:`is_up_to_date`), and record the fingerprints of the sources. Returns
+    whether ``build`` has been called.
+    """
+    src_files = list(src_files)
+    if not force and is_up_to_date(manifest_file, src_files, dst_files, version):
+        return False
+
+    fingerprints = source_fingerprints(src_files)  # before building, in case the sources change meanwhile
+    build()
+    save_manifest(manifest_file, fingerprints, version)
+    return True
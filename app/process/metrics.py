@@ -1,16 +1,19 @@
 import math
+import os
 from functools import lru_cache, partial
-from typing import List, Tuple, Optional, Mapping
+from typing import List, Tuple, Optional, Mapping, Iterator
 
 import numpy as np
 import pandas as pd
 
-from .exp_center import exp_center_file_in_directory
+from .exp_center import find_expdata_in_directory
 from .input import find_input_file_in_directory, get_input_values, _OUTPUT_NAMES
-from .log import log_process
+from .log import load_log, _LOG_PROCESS_VERSION
+from .manifest import manifest_file_of, load_manifest, save_manifest, check_fingerprints, source_fingerprints
 from .outformation import find_outformation_in_directory, load_outformation
-from .simudata import simudata_file_in_directory
-from .trans import ff, l2_distance, epsg4326_to_3857
+from .simudata import find_simudata_in_directory
+from .trajectory import TrajectoryIndex, TrajectoryTensor
+from .trans import ff, epsg4326_to_3857, time_ticks
 
 
 # K formation_num
@@ -51,89 +54,123 @@ def get_initial_reduce_and_final_total_size(outformation_data: List[Tuple[float,
     return first, final_total_size
 
 
-def get_dispersion(simudata: pd.DataFrame, exp_data: pd.DataFrame,
-                   outformation_data: List[Tuple[float, int, int]]) -> float:
-    aim_list = []
-    j = 0
-    for i in range(exp_data.shape[0]):
-        current_time = exp_data['time'][i]
-        while abs(outformation_data[j][0] - current_time) >= 1e-4 and \
-                outformation_data[j][0] <= current_time:
-            j += 1
+def _exp_ticks(exp_data: pd.DataFrame) -> np.ndarray:
+    return time_ticks(exp_data['time'].values)
 
-        if abs(outformation_data[j][0] - current_time) >= 1e-4:
-            continue
 
-        _, outformation_num, cur_total_size = outformation_data[j]
-        if (cur_total_size - outformation_num) >= 0.95 * cur_total_size:
-            distance_list = []
-            center = [exp_data['r_x'][i], exp_data['r_y'][i], exp_data['r_h'][i]]
-            tt = ff(exp_data['time'][i])
-            tmp_sim = simudata[(simudata['time'] < tt + 0.001) & (simudata['time'] > tt - 0.001)].reset_index(
-                drop=True)
-            if tmp_sim.shape[0] > 0:
-                for j in range(tmp_sim.shape[0]):
-                    distance_list.append(
-                        l2_distance(center, [tmp_sim['x'][j], tmp_sim['y'][j], tmp_sim['height'][j]]))
-                distance_list.sort()
-                distance_list = distance_list[0:int(0.9 * len(distance_list))]
-                aim_list.append(np.std(np.array(distance_list)) / np.mean(np.array(distance_list)))
-        else:
-            continue
+def _exp_centers(exp_data: pd.DataFrame) -> np.ndarray:
+    return exp_data[['r_x', 'r_y', 'r_h']].values.astype(np.float64)
+
+
+def _formation_rows(exp_data: pd.DataFrame, outformation_data: List[Tuple[float, int, int]],
+                    trajectory: TrajectoryIndex, first_row: int = 0) -> np.ndarray:
+    """
+    Rows of exp_data (from ``first_row``) whose frame has records, and whose outformation record at the
+    same time tick has at least 95% of the aircraft in formation.
+    """
+    exp_ticks = _exp_ticks(exp_data)
+    records = np.asarray(outformation_data, dtype=np.float64).reshape(-1, 3)
+    outformation_ticks = time_ticks(records[:, 0])
+    in_formation = (records[:, 2] - records[:, 1]) >= 0.95 * records[:, 2]
+    aligned = np.searchsorted(outformation_ticks, exp_ticks)[first_row:]  # first record not before the frame
+    if (aligned >= len(outformation_ticks)).any():
+        row = first_row + int(np.argmax(aligned >= len(outformation_ticks)))
+        raise IndexError(f'No outformation record for the frame at row {row} of exp_data.')
+
+    starts, ends = trajectory.frame_bounds(exp_ticks[first_row:])
+    selected = (outformation_ticks[aligned] == exp_ticks[first_row:]) & in_formation[aligned] & (ends > starts)
+    return first_row + np.flatnonzero(selected)
+
+
+# about this many distances are calculated at once by the batched metrics
+_BATCH_CELLS = 1 << 22
+
+
+def _frame_batches(trajectory: TrajectoryIndex, ticks: np.ndarray) \
+        -> Iterator[Tuple[slice, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Batches of the frames of ``ticks``, whose rows in ``trajectory`` are padded into ``[frames, width]``
+    arrays (``width`` is the size of the largest frame). Yields the slice of the batch in ``ticks``, the
+    rows, the mask of the actual records in the rows and the sizes of the frames.
+    """
+    starts, ends = trajectory.frame_bounds(ticks)
+    counts = ends - starts
+    width = int(counts.max()) if len(counts) > 0 else 0
+    columns = np.arange(width)
+    batch = max(1, _BATCH_CELLS // max(width, 1))
+    for i in range(0, len(counts), batch):
+        valid = columns < counts[i:i + batch, None]
+        yield slice(i, i + batch), np.where(valid, starts[i:i + batch, None] + columns, 0), valid, \
+            counts[i:i + batch]
+
+
+def _l2_distances(centers: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    # the same operations in the same order as l2_distance, so that the distances are exactly the same
+    diff = centers[:, None, :] - positions
+    return np.sqrt((diff[..., 0] ** 2 + diff[..., 1] ** 2) + diff[..., 2] ** 2)
+
+
+def get_dispersion(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                   outformation_data: List[Tuple[float, int, int]],
+                   trajectory: Optional[TrajectoryIndex] = None) -> float:
+    trajectory = TrajectoryIndex(simudata) if trajectory is None else trajectory
+    rows = _formation_rows(exp_data, outformation_data, trajectory)
+    if len(rows) == 0:
+        return -1
+
+    centers = _exp_centers(exp_data)[rows]
+    aim_list = np.full(len(rows), np.nan)  # nan for the frames without any kept distance
+    for batch, frame_rows, valid, counts in _frame_batches(trajectory, _exp_ticks(exp_data)[rows]):
+        distances = np.where(valid, _l2_distances(centers[batch], trajectory.positions[frame_rows]), np.inf)
+        distances = np.sort(distances, axis=1)
+        kept = (counts * 0.9).astype(np.int64)
+        aims = aim_list[batch]
+        for size in np.unique(kept[kept > 0]).tolist():  # the frames with the same count of kept distances
+            selected = kept == size
+            kept_distances = np.ascontiguousarray(distances[selected, :size])
+            aims[selected] = np.std(kept_distances, axis=1) / np.mean(kept_distances, axis=1)
 
     # noinspection PyTypeChecker
-    return -1 if len(aim_list) == 0 else np.mean(np.array(aim_list))
+    return np.mean(aim_list)
 
 
-def get_density(simudata: pd.DataFrame, exp_data: pd.DataFrame) -> float:
-    density = 0
-    for i in range(exp_data.shape[0]):
-        center = [exp_data['r_x'][i], exp_data['r_y'][i], exp_data['r_h'][i]]
-        tt = ff(exp_data['time'][i])
-        tmp_sim = simudata[(simudata['time'] < tt + 0.001) & (simudata['time'] > tt - 0.001)].reset_index(drop=True)
-        distances = []
-        for j in range(tmp_sim.shape[0]):
-            x = tmp_sim['x'][j]
-            y = tmp_sim['y'][j]
-            obj = [x, y, tmp_sim['height'][j]]
-            distances.append(l2_distance(center, obj))
-        distances.sort()
-        bias = int(len(distances) * 0.9)
-
-        r_value = distances[bias - 1]
-        res = 3 * bias / (4 * math.pi * (r_value ** 3))
-        density += res
-
-    return density / (exp_data.shape[0]) * (100 ** 3)
-
-
-def get_center_gap(simudata: pd.DataFrame, exp_data: pd.DataFrame) -> float:
-    center_avg_gap = 0
-    for i in range(exp_data.shape[0]):
-        tt = ff(exp_data['time'][i])
-        tmp_sim = simudata[(simudata['time'] < tt + 0.001) & (simudata['time'] > tt - 0.001)].reset_index(drop=True)
-        dist = 0
-        obj = [0, 0, 0]
-        for j in range(tmp_sim.shape[0]):
-            x = tmp_sim['x'][j]
-            y = tmp_sim['y'][j]
-            obj[0] += x
-            obj[1] += y
-            obj[2] += tmp_sim['height'][j]
-        center = [obj[0] / tmp_sim.shape[0], obj[1] / tmp_sim.shape[0], obj[2] / tmp_sim.shape[0]]
-        distances = []
-        for j in range(tmp_sim.shape[0]):
-            x = tmp_sim['x'][j]
-            y = tmp_sim['y'][j]
-            obj2 = [x, y, tmp_sim['height'][j]]
-            distances.append(l2_distance(center, obj2))
-        distances.sort()
-        distances = distances[0:int(len(distances) * 0.9)]
-        for d in distances:
-            dist += d
-        center_avg_gap += dist / len(distances)
-
-    return center_avg_gap / exp_data.shape[0]
+def get_density(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                trajectory: Optional[TrajectoryIndex] = None) -> float:
+    trajectory = TrajectoryIndex(simudata) if trajectory is None else trajectory
+    centers, results = _exp_centers(exp_data), []
+    for batch, frame_rows, valid, counts in _frame_batches(trajectory, _exp_ticks(exp_data)):
+        if (counts == 0).any():  # the errors of calculating the frames one by one
+            raise IndexError(f'No record in the frame at row {int(np.argmax(counts == 0))} of exp_data.')
+
+        distances = np.where(valid, _l2_distances(centers[batch], trajectory.positions[frame_rows]), np.inf)
+        bias = (counts * 0.9).astype(np.int64)
+        kth = np.where(bias > 0, bias - 1, counts - 1)  # i.e. distances[bias - 1] of the sorted distances
+        distances = np.partition(distances, np.unique(kth), axis=1)
+        r_values = np.take_along_axis(distances, kth[:, None], axis=1)[:, 0]
+        if (r_values == 0).any():
+            raise ZeroDivisionError(f'Zero radius in the frame at row {int(np.argmax(r_values == 0))} of exp_data.')
+        results.extend((3 * bias / (4 * math.pi * (r_values ** 3))).tolist())
+
+    return sum(results) / (exp_data.shape[0]) * (100 ** 3)
+
+
+def get_center_gap(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                   trajectory: Optional[TrajectoryIndex] = None) -> float:
+    trajectory = TrajectoryIndex(simudata) if trajectory is None else trajectory
+    results = []
+    for _, frame_rows, valid, counts in _frame_batches(trajectory, _exp_ticks(exp_data)):
+        positions = trajectory.positions[frame_rows]
+        kept = (counts * 0.9).astype(np.int64)
+        if (kept == 0).any():  # the error of calculating the frames one by one
+            raise ZeroDivisionError(f'Less than 2 records in the frame at row {int(np.argmax(kept == 0))} of exp_data.')
+
+        # sums in the order of the records, the padding zeros do not change them
+        sums = np.cumsum(np.where(valid[..., None], positions, 0.0), axis=1)[:, -1]
+        distances = np.sort(np.where(valid, _l2_distances(sums / counts[:, None], positions), np.inf), axis=1)
+        dist = np.cumsum(np.where(np.arange(distances.shape[1]) < kept[:, None], distances, 0.0), axis=1)[:, -1]
+        results.extend((dist / kept).tolist())
+
+    return sum(results) / exp_data.shape[0]
 
 
 def get_danger_frequency(outformation_data: List[Tuple[float, int, int]]) -> float:
@@ -159,52 +196,29 @@ def get_crash_probability(outformation_data: List[Tuple[float, int, int]]) -> fl
 
 
 def get_polarization(simudata: pd.DataFrame, exp_data: pd.DataFrame,
-                     outformation_data: List[Tuple[float, int, int]]) -> float:
-    aim_list = []
-    j = 0
-    for i in range(exp_data.shape[0]):
-        if i == 0:
-            continue
-
-        current_time = exp_data['time'][i]
-        while abs(outformation_data[j][0] - current_time) >= 1e-4 and \
-                outformation_data[j][0] <= current_time:
-            j += 1
-
-        if abs(outformation_data[j][0] - current_time) >= 1e-4:
-            continue
-
-        _, outformation_num, cur_total_size = outformation_data[j]
-        if (cur_total_size - outformation_num) >= 0.95 * cur_total_size:
-            ans = [0, 0, 0]
-            center = [exp_data['r_x'][i], exp_data['r_y'][i], exp_data['r_h'][i]]
-            tt = ff(exp_data['time'][i])
-            tmp_sim = simudata[(simudata['time'] < tt + 0.001) & (simudata['time'] > tt - 0.001)] \
-                .reset_index(drop=True)
-
-            pre_center = [exp_data['r_x'][i - 1], exp_data['r_y'][i - 1], exp_data['r_h'][i - 1]]
-            pre_tt = ff(exp_data['time'][i - 1])
-            pre_tmp_sim = simudata[
-                (simudata['time'] < pre_tt + 0.001) & (simudata['time'] > pre_tt - 0.001)] \
-                .reset_index(drop=True)
-
-            center_dir = [center[0] - pre_center[0], center[1] - pre_center[1], center[2] - pre_center[2]]
-
-            if tmp_sim.shape[0] > 0:
-                for j in range(tmp_sim.shape[0]):
-                    for k in range(pre_tmp_sim.shape[0]):
-                        if pre_tmp_sim['id'][k] == tmp_sim['id'][j]:
-                            item_dir = [tmp_sim['x'][j] - pre_tmp_sim['x'][k],
-                                        tmp_sim['y'][j] - pre_tmp_sim['y'][k],
-                                        tmp_sim['height'][j] - pre_tmp_sim['height'][k]]
-
-                            ans[0] += item_dir[0] - center_dir[0]
-                            ans[1] += item_dir[1] - center_dir[1]
-                            ans[2] += item_dir[2] - center_dir[2]
-                            break
-                aim_list.append(math.sqrt(np.sum(np.array(ans) ** 2)))
-
-    return -1 if len(aim_list) == 0 else np.mean(np.array(aim_list))
+                     outformation_data: List[Tuple[float, int, int]],
+                     trajectory: Optional[TrajectoryIndex] = None, tensor: Optional[TrajectoryTensor] = None) -> float:
+    trajectory = TrajectoryIndex(simudata) if trajectory is None else trajectory
+    rows = _formation_rows(exp_data, outformation_data, trajectory, first_row=1)
+    if len(rows) == 0:
+        return -1
+
+    tensor = TrajectoryTensor(simudata, trajectory) if tensor is None else tensor
+    exp_ticks, centers = _exp_ticks(exp_data), _exp_centers(exp_data)
+    center_dirs = centers[rows] - centers[rows - 1]
+    pre_frames = tensor.frames_of(exp_ticks[rows - 1])
+    aim_list = np.empty(len(rows))
+    for batch, frame_rows, valid, _ in _frame_batches(trajectory, exp_ticks[rows]):
+        # the aircraft of the frames, matched with their positions in the previous frames by their dense index
+        aircraft, pre = trajectory.aircraft[frame_rows], np.maximum(pre_frames[batch], 0)[:, None]
+        matched = valid & (pre_frames[batch] >= 0)[:, None] & tensor.mask[pre, aircraft]
+        item_dirs = trajectory.positions[frame_rows] - tensor.positions[pre, aircraft]
+
+        # summed in the order of the records, the zeros of the unmatched ones do not change the sums
+        ans = np.cumsum(np.where(matched[..., None], item_dirs - center_dirs[batch, None, :], 0.0), axis=1)[:, -1]
+        aim_list[batch] = np.sqrt(np.sum(ans ** 2, axis=1))
+
+    return np.mean(aim_list)
 
 
 @lru_cache()
@@ -312,23 +326,41 @@ _ALL_NAME_LIST = [
     *_ALL_METRICS_LIST,
 ]
 
-
-def get_all_metrics(directory: str, force: bool = False,
-                    shown_names: Optional[List[str]] = None):
+# bump the version of a metric when its calculation changes, so that its cached values are recalculated
+_METRIC_VERSIONS = {
+    'formation_num': 1,
+    'initial_reduce': 1,
+    'final_total_size': 1,
+    'dispersion': 2,
+    'density': 1,
+    'center_gap': 1,
+    'dangerous_frequency': 1,
+    'crash_probability': 1,
+    'polarization': 2,
+    'execute_time': 1,
+    'airway_bias': 1,
+    'loc_bias': 1,
+    'stable_time': 1,
+}
+
+
+def _as_float64(df: pd.DataFrame) -> pd.DataFrame:
+    # the metrics are calculated in double precision, whatever the stored precision of the columns
+    float32_columns = [name for name, dtype in df.dtypes.items() if dtype == np.float32]
+    return df.astype({name: np.float64 for name in float32_columns}) if float32_columns else df
+
+
+def compute_metrics(input_values: Mapping[str, object], simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                    outformation_data: List[Tuple[float, int, int]], shown_names: Optional[List[str]] = None,
+                    trajectory: Optional[TrajectoryIndex] = None,
+                    errors: Optional[Mapping[str, Tuple[type, ...]]] = None):
+    """
+    Metrics of ``shown_names``, ``trajectory`` is the index of ``simudata`` when already built. A metric
+    is ``nan`` instead when it raises one of its ``errors`` (e.g. on logs which are not complete yet).
+    """
     shown_names = shown_names or _ALL_NAME_LIST
-
-    input_file = find_input_file_in_directory(directory)
-    simudata_file = simudata_file_in_directory(directory)
-    exp_center_file = exp_center_file_in_directory(directory)
-    outformation_file = find_outformation_in_directory(directory)
-    log_process(directory, force)
-
-    input_values = get_input_values(input_file)
-    simudata = pd.read_csv(simudata_file)
-    exp_data = pd.read_csv(exp_center_file)
-    outformation_data = load_outformation(outformation_file)
-
-    irft = None
+    simudata, exp_data = _as_float64(simudata), _as_float64(exp_data)
+    irft, tensor = None, None
 
     def _get_irft() -> Tuple[float, float]:
         nonlocal irft
@@ -337,16 +369,31 @@ def get_all_metrics(directory: str, force: bool = False,
 
         return irft
 
+    def _get_trajectory() -> TrajectoryIndex:
+        nonlocal trajectory
+        if trajectory is None:
+            trajectory = TrajectoryIndex(simudata)
+
+        return trajectory
+
+    def _get_tensor() -> TrajectoryTensor:
+        nonlocal tensor
+        if tensor is None:
+            tensor = TrajectoryTensor(simudata, _get_trajectory())
+
+        return tensor
+
     data_map = {
         'formation_num': lambda: get_formation_num(outformation_data),
         'initial_reduce': lambda: _get_irft()[0],
         'final_total_size': lambda: _get_irft()[1],
-        'dispersion': lambda: get_dispersion(simudata, exp_data, outformation_data),
-        'density': lambda: get_density(simudata, exp_data),
-        'center_gap': lambda: get_center_gap(simudata, exp_data),
+        'dispersion': lambda: get_dispersion(simudata, exp_data, outformation_data, _get_trajectory()),
+        'density': lambda: get_density(simudata, exp_data, _get_trajectory()),
+        'center_gap': lambda: get_center_gap(simudata, exp_data, _get_trajectory()),
         'dangerous_frequency': lambda: get_danger_frequency(outformation_data),
         'crash_probability': lambda: get_crash_probability(outformation_data),
-        'polarization': lambda: get_polarization(simudata, exp_data, outformation_data),
+        'polarization': lambda: get_polarization(simudata, exp_data, outformation_data,
+                                                 _get_trajectory(), _get_tensor()),
         'execute_time': lambda: get_execute_time(input_values, outformation_data),
         'airway_bias': lambda: get_airway_bias(simudata, exp_data),
         'loc_bias': lambda: get_loc_bias(simudata, exp_data),
@@ -354,4 +401,65 @@ def get_all_metrics(directory: str, force: bool = False,
         'stable_time': lambda: get_stable_time(outformation_data),
         **{name: partial(input_values.__getitem__, name) for name in _OUTPUT_NAMES},
     }
-    return {name: data_map[name]() for name in shown_names}
+
+    def _compute(name: str):
+        try:
+            return data_map[name]()
+        except (errors or {}).get(name, ()):
+            return float('nan')
+
+    return {name: _compute(name) for name in shown_names}
+
+
+def metrics_cache_file_in_directory(directory: str) -> str:
+    return manifest_file_of(os.path.join(directory, 'metrics'))
+
+
+def _plain(value):
+    # numpy scalars to python ones, so that the cached values are the same as the calculated ones
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _load_cached_metrics(cache_file: str, src_files: List[str]) -> Tuple[Mapping[str, object], Mapping[str, object]]:
+    manifest = load_manifest(cache_file)
+    if manifest is None or manifest.get('version') != _LOG_PROCESS_VERSION:
+        return {}, {}
+
+    fingerprints = check_fingerprints(src_files, manifest.get('sources') or {})
+    if fingerprints is None:
+        return {}, {}
+
+    cached = {}
+    for name, item in (manifest.get('metrics') or {}).items():
+        if name in _METRIC_VERSIONS and isinstance(item, dict) and item.get('version') == _METRIC_VERSIONS[name]:
+            cached[name] = item.get('value')
+    return fingerprints, cached
+
+
+def get_all_metrics(directory: str, force: bool = False,
+                    shown_names: Optional[List[str]] = None, persist: bool = True):
+    """
+    Metrics of the log ``directory``, cached in a hidden file with the fingerprints of the logs and the
+    versions of the metrics, so that only the missing or outdated metrics are calculated.
+    """
+    shown_names = shown_names or _ALL_NAME_LIST
+    input_file = find_input_file_in_directory(directory)
+    outformation_file = find_outformation_in_directory(directory)
+    src_files = [input_file, outformation_file,
+                 find_simudata_in_directory(directory), find_expdata_in_directory(directory)]
+    input_values = get_input_values(input_file)
+
+    cache_file = metrics_cache_file_in_directory(directory)
+    fingerprints, cached = ({}, {}) if force else _load_cached_metrics(cache_file, src_files)
+    missing = [name for name in shown_names if name in _METRIC_VERSIONS and name not in cached]
+    if missing:
+        fingerprints = fingerprints or source_fingerprints(src_files)  # before calculating
+        simudata, exp_data = load_log(directory, force, persist)
+        outformation_data = load_outformation(outformation_file)
+        calculated = compute_metrics(input_values, simudata, exp_data, outformation_data, missing)
+        cached = {**cached, **{name: _plain(value) for name, value in calculated.items()}}
+        save_manifest(cache_file, fingerprints, _LOG_PROCESS_VERSION, metrics={
+            name: {'version': _METRIC_VERSIONS[name], 'value': value} for name, value in cached.items()
+        })
+
+    return {name: cached[name] if name in _METRIC_VERSIONS else input_values[name] for name in shown_names}
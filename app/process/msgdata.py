@@ -1,53 +1,93 @@
 import glob
 import os
+from typing import Iterator, Optional, Iterable
 
+import numpy as np
 import pandas as pd
 
 from app.proto import MpsReceiveMsg
+from .chunk import DEFAULT_CHUNK_ROWS, DatFollower
+from .frame import iter_dat_blocks, is_compressed
+from .index import DatIndex
+from .schema import RecordSchema, register_schema, schema_index, iter_records, records_trans, follow_records, \
+    decode_records
+
+MSGDATA_DTYPES = {
+    'time': np.float64,
+    'receive_id': np.uint32,
+    'send_id': np.uint32,
+    'type': np.uint32,
+}
+
+MSGDATA_COMPACT_DTYPES = {
+    'receive_id': np.uint16,
+    'send_id': np.uint16,
+    'type': np.uint8,
+}
 
 
 def find_msgdata_in_directory(directory: str):
-    matchings = glob.glob1(directory, 'msgData_*')
+    matchings = sorted(glob.glob1(directory, 'msgData_*'), key=is_compressed)  # plain logs first
     if matchings:
         return os.path.join(directory, matchings[0])
     else:
         raise FileNotFoundError(f'No msgdata file found in {repr(directory)}.')
 
 
-def msgdata_trans(src_file: str) -> pd.DataFrame:
-    mpa = MpsReceiveMsg()
-    data = {
-        'time': [],
-        'receive_id': [],
-        'send_id': [],
-        'type': [],
-    }
-
-    with open(src_file, 'rb') as f:
-        con = f.read()
-        index = 1
-        while index < len(con):
-            curindex = index
-            lbytes = []
-            while con[curindex] & 0x80:
-                lbytes.append(con[curindex] & ~0x80)
-                curindex += 1
-
-            if len(lbytes) < 5:
-                lbytes.append(con[curindex])
-
-            final_length = 0x00
-            for length in lbytes[::-1]:
-                final_length = (final_length << 7) | length
-            content = con[curindex + 1:curindex + 1 + final_length]
-            mpa.ParseFromString(content)
-
-            for msg in mpa.msginfo:
-                data['time'].append(mpa.time)
-                data['receive_id'].append(mpa.receiveID)
-                data['send_id'].append(msg.sendID)
-                data['type'].append(msg.msgtype)
-
-            index = curindex + 1 + final_length + 1
-
-        return pd.DataFrame(data)
+MSGDATA_SCHEMA = register_schema(RecordSchema(
+    'msgdata', MpsReceiveMsg, MSGDATA_DTYPES,
+    paths={
+        'time': 'time',
+        'receive_id': 'receiveID',
+        'send_id': 'msginfo.sendID',
+        'type': 'msginfo.msgtype',
+    },
+    repeated='msginfo',
+    compact_dtypes=MSGDATA_COMPACT_DTYPES,
+    id_columns=('receive_id', 'send_id'),
+))
+
+
+def msgdata_index(src_file: str) -> DatIndex:
+    # its ``ids`` are the participants of the messages, and its ``rows`` the count of messages
+    return schema_index(MSGDATA_SCHEMA, src_file)
+
+
+def iter_msgdata(src_file: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 t_start: Optional[float] = None, t_end: Optional[float] = None,
+                 participants: Optional[Iterable[int]] = None,
+                 workers: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Each ``MpsReceiveMsg`` record expands to one row per received message. With ``t_start`` / ``t_end``
+    and ``participants``, only the matching messages are decoded.
+    """
+    return iter_records(MSGDATA_SCHEMA, src_file, chunk_rows, include=_participants(participants),
+                        t_start=t_start, t_end=t_end, workers=workers)
+
+
+def _participants(participants: Optional[Iterable[int]]):
+    participants = None if participants is None else sorted(participants)
+    return {'receive_id': participants, 'send_id': participants}
+
+
+def msgdata_trans(src_file: str, t_start: Optional[float] = None, t_end: Optional[float] = None,
+                  participants: Optional[Iterable[int]] = None, workers: Optional[int] = None,
+                  compact: bool = True) -> pd.DataFrame:
+    return records_trans(MSGDATA_SCHEMA, src_file, include=_participants(participants),
+                         t_start=t_start, t_end=t_end, workers=workers, compact=compact)
+
+
+def follow_msgdata(src_file: str, participants: Optional[Iterable[int]] = None) -> DatFollower:
+    return follow_records(MSGDATA_SCHEMA, src_file, include=_participants(participants))
+
+
+def msgdata_senders(src_file: str) -> np.ndarray:
+    """
+    Sender ids of all messages (i.e. of all the rows of :func:`msgdata_trans`), without decoding the other
+    columns.
+    """
+    return np.concatenate([
+        np.zeros(0, dtype=np.uint32),
+        *(decode_records(MSGDATA_SCHEMA, buf, frames, columns=['send_id'])['send_id'].values
+          for buf, frames, _ in iter_dat_blocks(src_file)),
+    ])
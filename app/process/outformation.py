@@ -27,3 +27,23 @@ def load_outformation(outformation_file: str) -> List[Tuple[float, int, int]]:
 
 def load_outformation_in_directory(directory: str) -> List[Tuple[float, int, int]]:
     return load_outformation(find_outformation_in_directory(directory))
+
+
+class OutformationFollower:
+    """
+    Incremental reader of an outformation file which is still being written, only complete lines are parsed.
+    """
+
+    def __init__(self, outformation_file: str):
+        self.outformation_file = outformation_file
+        self.offset = 0
+
+    def poll(self) -> List[Tuple[float, int, int]]:
+        with open(self.outformation_file, 'rb') as f:
+            f.seek(self.offset)
+            content = f.read()
+
+        complete = content.rfind(b'\n') + 1
+        self.offset += complete
+        lines = content[:complete].decode().splitlines()
+        return [parse_outformation_line(line.strip()) for line in lines if line.strip()]
@@ -0,0 +1,206 @@
+from functools import partial, lru_cache
+from operator import attrgetter
+from typing import NamedTuple, Mapping, Optional, Callable, Tuple, Dict, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from .chunk import DEFAULT_CHUNK_ROWS, DatFollower, iter_decoded, concat_chunks, compact_frame
+from .frame import FrameIndex
+from .index import DatIndex, load_dat_index, select_spans
+from .wire import wire_decoder, where_mask, match_mask, repeated_spans
+
+# bump it when the decoded values of the registered schemas change, so that the processed logs are rebuilt
+DECODER_VERSION = 1
+
+_Filters = Optional[Mapping[str, Optional[Iterable[int]]]]
+
+
+class RecordSchema(NamedTuple):
+    """
+    Layout of the records of one kind of ``.dat`` log, the columns are read from ``paths`` of
+    ``message_class`` or computed by ``derive``. With ``repeated``, every record expands to one row per
+    item of this field. The distinct values of ``id_columns`` are kept in the sidecar index. Schemas are
+    pickled by their registered ``name``.
+    """
+    name: str
+    message_class: type
+    dtypes: Mapping[str, np.dtype]
+    paths: Mapping[str, str]
+    time_column: str = 'time'
+    skip_types: Tuple[int, ...] = ()
+    repeated: Optional[str] = None
+    derive: Optional[Callable[[Mapping[str, np.ndarray]], Mapping[str, np.ndarray]]] = None
+    compact_dtypes: Optional[Mapping[str, object]] = None
+    id_columns: Tuple[str, ...] = ()
+
+    def is_item_column(self, column: str) -> bool:
+        return self.repeated is not None and self.paths.get(column, '').startswith(f'{self.repeated}.')
+
+    def __reduce__(self):
+        return get_schema, (self.name,)
+
+
+_SCHEMAS: Dict[str, RecordSchema] = {}
+
+
+def register_schema(schema: RecordSchema) -> RecordSchema:
+    if schema.name in _SCHEMAS:
+        raise KeyError(f'Record schema {repr(schema.name)} already registered.')
+    _SCHEMAS[schema.name] = schema
+    return schema
+
+
+def get_schema(name: str) -> RecordSchema:
+    try:
+        return _SCHEMAS[name]
+    except KeyError:
+        raise KeyError(f'Unknown record schema - {repr(name)}.')
+
+
+def schema_index(schema: RecordSchema, src_file: str) -> DatIndex:
+    peek_ids = partial(decode_records, schema, columns=schema.id_columns) if schema.id_columns else None
+    return load_dat_index(src_file, schema.message_class, schema.paths[schema.time_column], schema.skip_types,
+                          peek_ids=peek_ids)
+
+
+@lru_cache()
+def _item_class(message_class, field: str) -> type:
+    return type(getattr(message_class(), field).add())
+
+
+def _parse_repeated(schema: RecordSchema, con, offsets: np.ndarray, lengths: np.ndarray,
+                    paths: Mapping[str, str]) -> Tuple[np.ndarray, Dict[str, list]]:
+    values = {column: [] for column in paths}
+    targets = [(values[column].append, attrgetter(path)) for column, path in paths.items()]
+
+    record = schema.message_class()
+    records = []
+    for i, (offset, length) in enumerate(zip(offsets.tolist(), lengths.tolist())):
+        record.ParseFromString(con[offset:offset + length])
+        for item in getattr(record, schema.repeated):
+            records.append(i)
+            for append, getter in targets:
+                append(getter(item))
+
+    return np.asarray(records, dtype=np.int64), values
+
+
+def _expand_repeated(schema: RecordSchema, con, offsets: np.ndarray, lengths: np.ndarray,
+                     item_columns: Iterable[str]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    # the items are walked and decoded in batch like the records, the records which can not be walked
+    # are parsed with the generated class
+    paths = {column: schema.paths[column][len(schema.repeated) + 1:] for column in item_columns}
+    if len(offsets) > 0:
+        number = schema.message_class.DESCRIPTOR.fields_by_name[schema.repeated].number
+        buf = np.frombuffer(con, dtype=np.uint8)
+        records, item_offsets, item_lengths, ok = repeated_spans(buf, offsets, lengths, number)
+        del buf
+        decoder = wire_decoder(_item_class(schema.message_class, schema.repeated))
+        decoded = decoder.decode(con, item_offsets, item_lengths, paths=list(paths.values())) if paths else {}
+        values = {column: decoded[path] for column, path in paths.items()}
+    else:
+        records, ok = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+        values = {column: np.zeros(0, dtype=schema.dtypes[column]) for column in paths}
+
+    fallback = np.nonzero(~ok)[0]
+    if len(fallback) > 0:
+        fallback_records, fallback_values = _parse_repeated(schema, con, offsets[fallback], lengths[fallback], paths)
+        order = np.argsort(np.concatenate([records, fallback[fallback_records]]), kind='stable')
+        records = np.concatenate([records, fallback[fallback_records]])[order]
+        values = {
+            column: np.concatenate([array, np.asarray(fallback_values[column], dtype=array.dtype)])[order]
+            for column, array in values.items()
+        }
+
+    counts = np.bincount(records, minlength=len(offsets)).astype(np.int64)
+    return counts, {column: np.asarray(array, dtype=schema.dtypes[column]) for column, array in values.items()}
+
+
+def decode_records(schema: RecordSchema, con, frames: FrameIndex,
+                   include: _Filters = None, exclude: _Filters = None,
+                   t_start: Optional[float] = None, t_end: Optional[float] = None,
+                   columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Decode the records of ``frames`` into the columns of ``schema`` (only the read ``columns`` when given).
+    Only the rows whose columns are in ``include``, not in ``exclude`` and whose time is within
+    ``[t_start, t_end]`` are kept, the conditions on record fields are checked by peeking before the
+    records are decoded.
+    """
+    include, exclude = dict(include or {}), dict(exclude or {})
+    offsets, lengths = frames.offsets, frames.lengths
+    if schema.skip_types:
+        records = ~np.isin(frames.types, schema.skip_types)
+        offsets, lengths = offsets[records], lengths[records]
+
+    def _record_paths(conditions):
+        return {schema.paths[column]: values for column, values in conditions.items()
+                if not schema.is_item_column(column)}
+
+    decoder = wire_decoder(schema.message_class)
+    keep = where_mask(decoder, con, offsets, lengths, _record_paths(include), _record_paths(exclude),
+                      {schema.paths[schema.time_column]: (t_start, t_end)})
+    if keep is not None:
+        offsets, lengths = offsets[keep], lengths[keep]
+
+    selected = list(schema.dtypes) if columns is None else list(columns)
+    read_columns = [column for column in schema.dtypes if column in schema.paths and
+                    (column in selected or column in include or column in exclude)]
+    record_columns = [column for column in read_columns if not schema.is_item_column(column)]
+    values = decoder.decode(con, offsets, lengths, paths=[schema.paths[column] for column in record_columns]) \
+        if record_columns else {}
+    columns = {column: values[schema.paths[column]] for column in record_columns}
+
+    if schema.repeated is not None:
+        item_columns = [column for column in read_columns if schema.is_item_column(column)]
+        counts, items = _expand_repeated(schema, con, offsets, lengths, item_columns)
+        columns = {column: np.repeat(array, counts) for column, array in columns.items()}
+        columns.update(items)
+
+        def _item_conditions(conditions):
+            return {column: values for column, values in conditions.items() if schema.is_item_column(column)}
+
+        keep = match_mask(columns, int(counts.sum()), _item_conditions(include), _item_conditions(exclude))
+        if keep is not None:
+            columns = {column: array[keep] for column, array in columns.items()}
+
+    if schema.derive is not None and any(column not in schema.paths for column in selected):
+        columns.update(schema.derive(columns))
+    return pd.DataFrame({
+        column: np.asarray(columns[column], dtype=dtype) for column, dtype in schema.dtypes.items()
+        if column in selected
+    }, copy=False)
+
+
+def iter_records(schema: RecordSchema, src_file: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 include: _Filters = None, exclude: _Filters = None,
+                 t_start: Optional[float] = None, t_end: Optional[float] = None,
+                 workers: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Decode ``src_file`` in chunks of ``chunk_rows`` frames with :func:`decode_records`, the blocks outside
+    of the time window are skipped with the sidecar index of ``src_file``.
+    """
+    decode = partial(decode_records, schema, include=include, exclude=exclude, t_start=t_start, t_end=t_end)
+    spans = select_spans(partial(schema_index, schema), src_file, t_start, t_end)
+    return iter_decoded(decode, src_file, chunk_rows, workers, spans)
+
+
+def records_trans(schema: RecordSchema, src_file: str, include: _Filters = None, exclude: _Filters = None,
+                  t_start: Optional[float] = None, t_end: Optional[float] = None,
+                  workers: Optional[int] = None, compact: bool = True) -> pd.DataFrame:
+    df = concat_chunks(
+        iter_records(schema, src_file, include=include, exclude=exclude,
+                     t_start=t_start, t_end=t_end, workers=workers),
+        schema.dtypes,
+    )
+    return compact_table(schema, df) if compact else df
+
+
+def compact_table(schema: RecordSchema, df: pd.DataFrame) -> pd.DataFrame:
+    return compact_frame(df, schema.compact_dtypes) if schema.compact_dtypes is not None else df
+
+
+def follow_records(schema: RecordSchema, src_file: str,
+                   include: _Filters = None, exclude: _Filters = None) -> DatFollower:
+    decode = partial(decode_records, schema, include=include, exclude=exclude)
+    return DatFollower(decode, src_file, schema.dtypes)
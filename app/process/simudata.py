@@ -1,14 +1,47 @@
 import glob
 import os
+from functools import partial
+from typing import Iterator, Optional, Iterable, Mapping
 
+import numpy as np
 import pandas as pd
 
 from app.proto import MpsProtoAircraft
-from .trans import epsg4326_to_3857
+from .chunk import DEFAULT_CHUNK_ROWS, DatFollower, chunks_to_csv
+from .frame import is_compressed
+from .index import DatIndex
+from .manifest import manifest_file_of, build_if_stale
+from .schema import DECODER_VERSION, RecordSchema, register_schema, schema_index, iter_records, records_trans, \
+    follow_records
+from .trans import epsg4326_to_3857, web_mercator
+
+SIMUDATA_DTYPES = {
+    'id': np.uint32,
+    'type': np.uint32,
+    'time': np.float64,
+    'lng': np.float64,
+    'lat': np.float64,
+    'height': np.float32,
+    'roll': np.float32,
+    'pitch': np.float32,
+    'yaw': np.float32,
+    'speed': np.float32,
+    'x': np.float64,
+    'y': np.float64,
+}
+SIMUDATA_COLUMNS = list(SIMUDATA_DTYPES)
+
+# dtypes of the whole decoded tables, the aircraft ids are narrowed only when they fit
+SIMUDATA_COMPACT_DTYPES = {
+    'id': np.uint16,
+    'type': 'category',
+}
+
+_EXCLUDED_TYPES = (7030102,)
 
 
 def find_simudata_in_directory(directory: str):
-    matchings = glob.glob1(directory, 'simudata_*')
+    matchings = sorted(glob.glob1(directory, 'simudata_*'), key=is_compressed)  # plain logs first
     if matchings:
         return os.path.join(directory, matchings[0])
     else:
@@ -19,6 +52,10 @@ def simudata_file_in_directory(directory: str) -> str:
     return os.path.join(directory, 'simudata.csv')
 
 
+def simudata_cache_file_in_directory(directory: str) -> str:
+    return os.path.join(directory, 'simudata.npz')
+
+
 def simudata_process_in_directory(directory: str, force: bool = False):
     return simudata_process(
         find_simudata_in_directory(directory),
@@ -27,66 +64,89 @@ def simudata_process_in_directory(directory: str, force: bool = False):
     )
 
 
-def simudata_trans(src_file: str) -> pd.DataFrame:
-    mpa = MpsProtoAircraft()
-    with open(src_file, 'rb') as f:
-        con = f.read()
-        index = 1
-        data = {
-            'id': [],
-            'type': [],
-            'time': [],
-            'lng': [],
-            'lat': [],
-            'height': [],
-            'roll': [],
-            'pitch': [],
-            'yaw': [],
-            'speed': [],
-            'x': [],
-            'y': [],
-        }
-        while index < len(con):
-            cur = index
-            lengths = []
-            while con[cur] >= 128:
-                lengths.append(con[cur] - 128)
-                cur += 1
-            if len(lengths) < 5:
-                lengths.append(con[cur])
-            lengths.reverse()
-
-            final_length = 0
-            for length in lengths:
-                final_length = final_length * 128 + length
-            content = con[cur + 1:cur + 1 + final_length]
-            mpa.ParseFromString(content)
-
-            if mpa.head.type != 7030102:
-                data['id'].append(mpa.head.id)
-                data['type'].append(mpa.head.type)
-                data['time'].append(mpa.head.time)
-                data['lng'].append(mpa.head.lng)
-                data['lat'].append(mpa.head.lat)
-                data['height'].append(mpa.head.h)
-                data['roll'].append(mpa.roll)
-                data['pitch'].append(mpa.pitch)
-                data['yaw'].append(mpa.yaw)
-                data['speed'].append(mpa.speed)
-
-                lng, lat = mpa.head.lng, mpa.head.lat
-                x, y = epsg4326_to_3857(lng, lat)
-                data['x'].append(x)
-                data['y'].append(y)
-
-            index = cur + 1 + final_length + 1
-
-        return pd.DataFrame(data)
-
-
-def simudata_process(src_file: str, dst_file: str, force: bool = False):
-    if not force and os.path.exists(dst_file):
-        return
-
-    df = simudata_trans(src_file)
-    df.to_csv(dst_file)
+def _project(columns: Mapping[str, np.ndarray], projection) -> Mapping[str, np.ndarray]:
+    x, y = projection(columns['lng'], columns['lat'])
+    return {'x': np.asarray(x, dtype=np.float64), 'y': np.asarray(y, dtype=np.float64)}
+
+
+SIMUDATA_SCHEMA = register_schema(RecordSchema(
+    'simudata', MpsProtoAircraft, SIMUDATA_DTYPES,
+    paths={
+        'id': 'head.id',
+        'type': 'head.type',
+        'time': 'head.time',
+        'lng': 'head.lng',
+        'lat': 'head.lat',
+        'height': 'head.h',
+        'roll': 'roll',
+        'pitch': 'pitch',
+        'yaw': 'yaw',
+        'speed': 'speed',
+    },
+    derive=partial(_project, projection=epsg4326_to_3857),
+    compact_dtypes=SIMUDATA_COMPACT_DTYPES,
+))
+# opt-in schema with x / y from the closed form web_mercator instead of pyproj
+SIMUDATA_WEB_MERCATOR_SCHEMA = register_schema(SIMUDATA_SCHEMA._replace(
+    name='simudata_web_mercator',
+    derive=partial(_project, projection=web_mercator),
+))
+
+_PROJECTION_SCHEMAS = {
+    'pyproj': SIMUDATA_SCHEMA,
+    'web_mercator': SIMUDATA_WEB_MERCATOR_SCHEMA,
+}
+
+
+def _simudata_schema(projection: str) -> RecordSchema:
+    try:
+        return _PROJECTION_SCHEMAS[projection]
+    except KeyError:
+        raise KeyError(f'Unknown projection - {repr(projection)}.')
+
+
+def simudata_index(src_file: str) -> DatIndex:
+    return schema_index(SIMUDATA_SCHEMA, src_file)
+
+
+def iter_simudata(src_file: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                  ids: Optional[Iterable[int]] = None, types: Optional[Iterable[int]] = None,
+                  exclude_types: Optional[Iterable[int]] = _EXCLUDED_TYPES,
+                  t_start: Optional[float] = None, t_end: Optional[float] = None,
+                  workers: Optional[int] = None, projection: str = 'pyproj') -> Iterator[pd.DataFrame]:
+    """
+    With ``t_start`` / ``t_end``, only the records in this (closed) time window are decoded, and the
+    sidecar index of ``src_file`` is used to skip the blocks outside of it. With ``projection`` set to
+    ``'web_mercator'``, ``x`` / ``y`` are computed with :func:`app.process.trans.web_mercator` instead
+    of pyproj.
+    """
+    return iter_records(_simudata_schema(projection), src_file, chunk_rows,
+                        include={'id': ids, 'type': types}, exclude={'type': exclude_types},
+                        t_start=t_start, t_end=t_end, workers=workers)
+
+
+def simudata_trans(src_file: str, ids: Optional[Iterable[int]] = None, types: Optional[Iterable[int]] = None,
+                   exclude_types: Optional[Iterable[int]] = _EXCLUDED_TYPES,
+                   t_start: Optional[float] = None, t_end: Optional[float] = None,
+                   workers: Optional[int] = None, compact: bool = True, projection: str = 'pyproj') -> pd.DataFrame:
+    """
+    With ``compact``, the columns are converted into :data:`SIMUDATA_COMPACT_DTYPES`, otherwise they
+    keep the full decoded :data:`SIMUDATA_DTYPES`. See :func:`iter_simudata` for ``projection``.
+    """
+    return records_trans(_simudata_schema(projection), src_file,
+                         include={'id': ids, 'type': types}, exclude={'type': exclude_types},
+                         t_start=t_start, t_end=t_end, workers=workers, compact=compact)
+
+
+def follow_simudata(src_file: str, ids: Optional[Iterable[int]] = None, types: Optional[Iterable[int]] = None,
+                    exclude_types: Optional[Iterable[int]] = _EXCLUDED_TYPES,
+                    projection: str = 'pyproj') -> DatFollower:
+    return follow_records(_simudata_schema(projection), src_file,
+                          include={'id': ids, 'type': types}, exclude={'type': exclude_types})
+
+
+def simudata_process(src_file: str, dst_file: str, force: bool = False) -> bool:
+    return build_if_stale(
+        manifest_file_of(dst_file), [src_file], [dst_file], str(DECODER_VERSION),
+        lambda: chunks_to_csv(iter_simudata(src_file), dst_file, SIMUDATA_DTYPES), force,
+    )
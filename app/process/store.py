@@ -0,0 +1,43 @@
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from .manifest import atomic_write
+
+_COLUMNS_KEY = 'columns'
+
+
+def _column_arrays(i: int, column: pd.Series) -> Mapping[str, np.ndarray]:
+    if isinstance(column.dtype, pd.CategoricalDtype):  # saved as codes, with the categories aside
+        return {f'column_{i}': column.cat.codes.values, f'categories_{i}': column.cat.categories.values}
+    else:
+        return {f'column_{i}': column.values}
+
+
+def save_frame(df: pd.DataFrame, dst_file: str):
+    """
+    Save the columns of ``df`` into an uncompressed ``.npz`` file, which keeps their dtypes (including
+    the categorical ones) and values exactly. The index is not saved, frames are loaded with a fresh
+    ``RangeIndex``.
+    """
+    arrays = {_COLUMNS_KEY: np.asarray(df.columns, dtype=str)}
+    for i, name in enumerate(df.columns):
+        arrays.update(_column_arrays(i, df[name]))
+
+    atomic_write(dst_file, lambda tmp_file: np.savez(tmp_file, **arrays))
+
+
+def _load_column(data, i: int):
+    values = data[f'column_{i}']
+    if f'categories_{i}' in data.files:
+        return pd.Categorical.from_codes(values, categories=data[f'categories_{i}'])
+    else:
+        return values
+
+
+def load_frame(src_file: str) -> pd.DataFrame:
+    with np.load(src_file) as data:
+        return pd.DataFrame({
+            name: _load_column(data, i) for i, name in enumerate(data[_COLUMNS_KEY].tolist())
+        }, copy=False)
@@ -0,0 +1,115 @@
+from typing import Optional, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .trans import time_ticks
+
+
+def _stack_columns(simudata: pd.DataFrame, columns: List[str], order: np.ndarray, dtype) -> np.ndarray:
+    return np.stack([np.asarray(simudata[column].values[order], dtype=dtype) for column in columns], axis=1) \
+        .reshape(-1, len(columns))
+
+
+class TrajectoryIndex:
+    """
+    Positions of simudata stably sorted by time ticks, so that the rows of a frame are a contiguous
+    range found by binary search. The ids are remapped to the dense indices of ``aircraft_ids``.
+    """
+
+    def __init__(self, simudata: pd.DataFrame):
+        self.order = np.zeros(0, dtype=np.int64)
+        self.ticks = np.zeros(0, dtype=np.int64)
+        self.times = np.zeros(0, dtype=np.float64)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.aircraft_ids = np.zeros(0, dtype=np.int64)
+        self.aircraft = np.zeros(0, dtype=np.int64)
+        self.positions = np.zeros((0, 3), dtype=np.float64)
+        self.extend(simudata)
+
+    def extend(self, simudata: pd.DataFrame):
+        """
+        Add the rows of ``simudata``, which follow the rows already indexed (e.g. the chunks of a followed
+        log), the index is then the same as the one built on all of them at once.
+        """
+        ticks = time_ticks(simudata['time'].values)
+        order = np.argsort(ticks, kind='stable')
+        at = np.searchsorted(self.ticks, ticks[order], side='right')  # after the indexed rows of the same tick
+
+        self.order = np.insert(self.order, at, order + len(self))
+        self.ticks = np.insert(self.ticks, at, ticks[order])
+        self.times = np.insert(self.times, at, np.asarray(simudata['time'].values[order], dtype=np.float64))
+        self.ids = np.insert(self.ids, at, np.asarray(simudata['id'].values[order], dtype=np.int64))
+        self.aircraft_ids = np.union1d(self.aircraft_ids, self.ids[at + np.arange(len(at))])
+        self.aircraft = np.searchsorted(self.aircraft_ids, self.ids)
+        self.positions = np.insert(self.positions, at,
+                                   _stack_columns(simudata, ['x', 'y', 'height'], order, np.float64), axis=0)
+
+    def __len__(self):
+        return len(self.times)
+
+    def frame(self, tick: int) -> slice:
+        start, end = np.searchsorted(self.ticks, [tick, tick + 1])
+        return slice(int(start), int(end))
+
+    def frame_bounds(self, ticks) -> Tuple[np.ndarray, np.ndarray]:
+        # starts and ends of the frames of all the ``ticks`` at once
+        ticks = np.asarray(ticks, dtype=np.int64)
+        return np.searchsorted(self.ticks, ticks), np.searchsorted(self.ticks, ticks + 1)
+
+
+class TrajectoryTensor:
+    """
+    Simudata pivoted into dense ``[frame, aircraft]`` arrays, the missing cells are ``False`` in
+    ``mask`` and ``nan`` in the others. The first record of an aircraft in a frame is kept.
+    """
+
+    def __init__(self, simudata: pd.DataFrame, trajectory: Optional[TrajectoryIndex] = None):
+        trajectory = TrajectoryIndex(simudata) if trajectory is None else trajectory
+        self.ticks, frames = np.unique(trajectory.ticks, return_inverse=True)
+        self.ids = trajectory.aircraft_ids
+        shape = (len(self.ticks), len(self.ids))
+
+        # written backwards, so that the first record of a cell is the one left
+        self._cells = frames.reshape(-1)[::-1], trajectory.aircraft[::-1]
+        self.mask = np.zeros(shape, dtype=bool)
+        self.mask[self._cells] = True
+        self.positions = self._pivot(trajectory.positions)
+
+        # not needed by the metrics, pivoted on first access
+        self._simudata, self._order = simudata, trajectory.order
+        self._attitudes, self._speeds = None, None
+
+    def _pivot(self, values: np.ndarray) -> np.ndarray:
+        tensor = np.full(self.shape + values.shape[1:], np.nan, dtype=values.dtype)
+        tensor[self._cells] = values[::-1]
+        return tensor
+
+    @property
+    def attitudes(self) -> np.ndarray:
+        if self._attitudes is None:
+            self._attitudes = self._pivot(_stack_columns(self._simudata, ['roll', 'pitch', 'yaw'], self._order,
+                                                         np.float32))
+        return self._attitudes
+
+    @property
+    def speeds(self) -> np.ndarray:
+        if self._speeds is None:
+            self._speeds = self._pivot(np.asarray(self._simudata['speed'].values[self._order], dtype=np.float32))
+        return self._speeds
+
+    @property
+    def shape(self):
+        return self.mask.shape
+
+    def frame_of(self, tick: int) -> Optional[int]:
+        index = int(np.searchsorted(self.ticks, tick))
+        return index if index < len(self.ticks) and self.ticks[index] == tick else None
+
+    def frames_of(self, ticks) -> np.ndarray:
+        # frames of all the ``ticks`` at once, -1 for the missing ones
+        ticks = np.asarray(ticks, dtype=np.int64)
+        frames = np.searchsorted(self.ticks, ticks)
+        found = frames < len(self.ticks)
+        found[found] = self.ticks[frames[found]] == ticks[found]
+        return np.where(found, frames, -1)
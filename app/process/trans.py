@@ -1,15 +1,35 @@
 import math
 
+import numpy as np
 from pyproj import Transformer
 
 _TRANSFORMER = Transformer.from_crs("epsg:4326", "epsg:3857")
+_EARTH_RADIUS = 6378137.0  # sphere of web mercator, i.e. the WGS 84 semi-major axis
 
 
 def epsg4326_to_3857(lng, lat):
+    # scalars or whole columns, arrays are projected in one call
     x, y = _TRANSFORMER.transform(lat, lng)
     return x, y
 
 
+def web_mercator(lng, lat):
+    # closed form of epsg4326_to_3857, agrees with pyproj within nanometers and is several times faster on arrays
+    x = _EARTH_RADIUS * np.radians(lng)
+    y = _EARTH_RADIUS * np.arctanh(np.sin(np.radians(lat)))
+    return x, y
+
+
+# the times of the logs are aligned on integer ticks of this resolution, which is the one of ff
+TIME_TICKS_PER_SECOND = 100
+
+
+def time_ticks(times, ticks_per_second: int = TIME_TICKS_PER_SECOND):
+    # scalars or whole columns, converted with one vectorized rounding instead of formatting
+    ticks = np.rint(np.asarray(times, dtype=np.float64) * ticks_per_second).astype(np.int64)
+    return ticks if ticks.ndim else int(ticks)
+
+
 def float_format(x):
     return float(format(x, '.4f'))
 
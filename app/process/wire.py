@@ -0,0 +1,368 @@
+from functools import lru_cache
+from typing import Dict, Tuple, Mapping, Optional, Iterable
+
+import numpy as np
+from google.protobuf.descriptor import FieldDescriptor
+
+_WIRE_VARINT = 0
+_WIRE_FIXED64 = 1
+_WIRE_LENGTH = 2
+_WIRE_FIXED32 = 5
+
+# field type -> (wire type, column dtype)
+_SCALAR_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: (_WIRE_FIXED64, np.dtype('<f8')),
+    FieldDescriptor.TYPE_FLOAT: (_WIRE_FIXED32, np.dtype('<f4')),
+    FieldDescriptor.TYPE_UINT32: (_WIRE_VARINT, np.dtype(np.uint32)),
+}
+_SKIPPED_TYPES = {FieldDescriptor.TYPE_STRING, FieldDescriptor.TYPE_BYTES}
+
+
+class _Field:
+    def __init__(self, path: str, code: int, wire_type: int, dtype: np.dtype = None, skip: bool = False):
+        self.path = path
+        self.code = code
+        self.wire_type = wire_type
+        self.dtype = dtype
+        self.skip = skip
+
+
+def _is_repeated(field) -> bool:
+    if hasattr(field, 'is_repeated'):
+        return field.is_repeated
+    else:
+        return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _flatten_fields(descriptor, prefix: str = '', parent: int = 0) -> Tuple[_Field, ...]:
+    """
+    Flatten the fields of a message into dotted paths, e.g. ``head.time``. Nested messages are only
+    supported one level deep, and a field is identified by ``parent field number * 32 + field number``.
+    Repeated fields, strings and deeper messages are length-delimited, they are skipped without a column.
+    """
+    fields = []
+    for field in descriptor.fields:
+        if field.number >= 16:
+            raise TypeError(f'Field {prefix}{field.name} is not supported by the wire decoder.')
+
+        code = parent * 32 + field.number
+        if _is_repeated(field) or field.type in _SKIPPED_TYPES or \
+                (field.type == FieldDescriptor.TYPE_MESSAGE and parent):
+            fields.append(_Field(prefix + field.name, code, _WIRE_LENGTH, skip=True))
+        elif field.type == FieldDescriptor.TYPE_MESSAGE:
+            fields.append(_Field(prefix + field.name, code, _WIRE_LENGTH))
+            fields.extend(_flatten_fields(field.message_type, f'{prefix}{field.name}.', field.number))
+        elif field.type in _SCALAR_TYPES:
+            wire_type, dtype = _SCALAR_TYPES[field.type]
+            fields.append(_Field(prefix + field.name, code, wire_type, dtype))
+        else:
+            raise TypeError(f'Field {prefix}{field.name} is not supported by the wire decoder.')
+
+    return tuple(fields)
+
+
+def _gather(buf: np.ndarray, positions: np.ndarray, size: int) -> np.ndarray:
+    index = positions[:, None] + np.arange(size)
+    np.minimum(index, len(buf) - 1, out=index)
+    return buf[index]
+
+
+def _read_varints(buf: np.ndarray, positions: np.ndarray, max_size: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read the varints starting at ``positions``, return their values and sizes (size ``0`` when the varint
+    is not terminated within ``max_size`` bytes).
+    """
+    raw = _gather(buf, positions, max_size).astype(np.uint64)
+    terminal = raw < 0x80
+    sizes = np.where(terminal.any(axis=1), terminal.argmax(axis=1) + 1, 0)
+    used = np.arange(max_size) < sizes[:, None]
+    shifts = np.arange(max_size, dtype=np.uint64) * np.uint64(7)
+    values = (np.where(used, raw & np.uint64(0x7f), np.uint64(0)) << shifts).sum(axis=1, dtype=np.uint64)
+    return values, sizes
+
+
+class WireDecoder:
+    """
+    Vectorized decoder of protobuf messages made of fixed-width scalars and at most one level of nested
+    messages, other fields are skipped. Records with an unexpected layout fall back to the generated
+    class, and the decoder disables itself when it does not match the generated class on a sample.
+    """
+
+    def __init__(self, message_class):
+        self.message_class = message_class
+        try:
+            self.fields = _flatten_fields(message_class.DESCRIPTOR)
+        except TypeError:
+            self.fields = ()
+            self.enabled = False
+        else:
+            self.enabled = self._self_check()
+
+    @property
+    def columns(self) -> Mapping[str, np.dtype]:
+        return {field.path: field.dtype for field in self.fields if field.dtype is not None}
+
+    def _sample(self):
+        message, expected = self.message_class(), {}
+        for i, field in enumerate(self.fields):
+            if field.dtype is None:
+                continue
+            value = (1 << min(7 * (i % 5 + 1), 32)) - 3 if field.dtype.kind == 'u' else (i + 1) * 0.1 - 100.5
+            value = field.dtype.type(value)
+            *parents, name = field.path.split('.')
+            target = message
+            for parent in parents:
+                target = getattr(target, parent)
+            setattr(target, name, value.item())
+            expected[field.path] = value
+
+        return message.SerializeToString(), expected
+
+    def _self_check(self) -> bool:
+        content, expected = self._sample()
+        columns, ok = self._decode_fast(np.frombuffer(content, dtype=np.uint8),
+                                        np.asarray([0], dtype=np.int64), np.asarray([len(content)], dtype=np.int64))
+        return bool(ok.all()) and all(columns[path][0] == value for path, value in expected.items())
+
+    def _decode_fast(self, buf: np.ndarray, offsets: np.ndarray, lengths: np.ndarray,
+                     paths: Optional[Iterable[str]] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        When ``paths`` is given, only these fields are stored and every record is walked just until the
+        fields following them in field number order, which is the order all protobuf serializers use. A
+        record which gets there before all these fields were seen (e.g. with the fields in another order,
+        or with a default value left out) is not ``ok``, so that it is decoded with the generated class.
+        """
+        n = len(offsets)
+        dtypes = self.columns
+        paths = list(dtypes) if paths is None else list(paths)
+        columns = {path: np.zeros(n, dtype=dtypes[path]) for path in paths}
+        limit = max(self._order(field) for field in self.fields if field.path in columns) \
+            if len(columns) < len(dtypes) else None
+        bits = {path: 1 << i for i, path in enumerate(columns)}
+        seen = np.zeros(n, dtype=np.int64)  # bits of the stored fields seen in each record
+
+        ok = np.ones(n, dtype=bool)
+        pos = offsets.astype(np.int64, copy=True)
+        ends = pos + lengths
+        parents = np.zeros(n, dtype=np.int64)  # number of the nested message we are in, 0 for top level
+        parent_ends = ends.copy()
+
+        active = np.nonzero(pos < ends)[0]
+        while len(active) > 0:
+            p = pos[active]
+            tags = buf[p].astype(np.int64)
+            codes = parents[active] * 32 + (tags >> 3)
+            wire_types = tags & 0x7
+            if limit is not None:
+                orders = np.where(parents[active] > 0, codes, (tags >> 3) * 32)
+                beyond = orders > limit
+                if beyond.any():
+                    ok[active[beyond & (seen[active] != (1 << len(columns)) - 1)]] = False
+                    active, p, tags, codes, wire_types = \
+                        active[~beyond], p[~beyond], tags[~beyond], codes[~beyond], wire_types[~beyond]
+            known = np.zeros(len(active), dtype=bool)
+
+            for field in self.fields:
+                mask = (codes == field.code) & (wire_types == field.wire_type) & (tags < 0x80)
+                if not mask.any():
+                    continue
+                known |= mask
+                rows, start = active[mask], p[mask] + 1
+                column = columns.get(field.path)
+                if column is not None:
+                    seen[rows] |= bits[field.path]
+
+                if field.wire_type == _WIRE_FIXED64:
+                    if column is not None:
+                        column[rows] = _gather(buf, start, 8).view('<f8').ravel()
+                    pos[rows] = start + 8
+                elif field.wire_type == _WIRE_FIXED32:
+                    if column is not None:
+                        column[rows] = _gather(buf, start, 4).view('<f4').ravel()
+                    pos[rows] = start + 4
+                elif field.wire_type == _WIRE_VARINT:
+                    values, sizes = _read_varints(buf, start)
+                    if column is not None:
+                        column[rows] = values.astype(np.uint32)
+                    ok[rows[sizes == 0]] = False
+                    pos[rows] = start + sizes
+                elif field.skip:
+                    sizes_, sizes = _read_varints(buf, start)
+                    ok[rows[sizes == 0]] = False
+                    pos[rows] = start + sizes + sizes_.astype(np.int64)
+                else:  # step into a nested message
+                    sizes_, sizes = _read_varints(buf, start)
+                    ok[rows[sizes == 0]] = False
+                    pos[rows] = start + sizes
+                    parents[rows] = field.code
+                    parent_ends[rows] = start + sizes + sizes_.astype(np.int64)
+
+            ok[active[~known]] = False
+            # leave the nested messages which are finished, and reject anything overrunning its bounds
+            nested = parents[active] > 0
+            ok[active[nested & (parent_ends[active] > ends[active])]] = False
+            ok[active[pos[active] > parent_ends[active]]] = False
+            finished = nested & (pos[active] == parent_ends[active])
+            parents[active[finished]] = 0
+            parent_ends[active[finished]] = ends[active[finished]]
+
+            active = active[ok[active] & (pos[active] < ends[active])]
+
+        if limit is None:
+            ok &= parents == 0
+        return columns, ok
+
+    @staticmethod
+    def _order(field: _Field) -> int:
+        return field.code if field.code >= 32 else field.code * 32
+
+    def _decode_slow(self, con, offsets: np.ndarray, lengths: np.ndarray,
+                     columns: Dict[str, np.ndarray], rows: np.ndarray):
+        message = self.message_class()
+        getters = [(path, path.split('.')) for path in columns]
+        for row, offset, length in zip(rows.tolist(), offsets[rows].tolist(), lengths[rows].tolist()):
+            message.ParseFromString(con[offset:offset + length])
+            for path, names in getters:
+                value = message
+                for name in names:
+                    value = getattr(value, name)
+                columns[path][row] = value
+
+    def decode(self, con, offsets: np.ndarray, lengths: np.ndarray,
+               paths: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Decode the records at ``offsets`` / ``lengths`` of ``con``, returns one array per (dotted) field path.
+        Only the fields in ``paths`` are decoded when given, which is cheap for the leading fields of a record.
+        """
+        paths = list(self.columns) if paths is None else list(paths)
+        if self.enabled and len(offsets) > 0:
+            buf = np.frombuffer(con, dtype=np.uint8)
+            columns, ok = self._decode_fast(buf, offsets, lengths, paths)
+            del buf
+            fallback = np.nonzero(~ok)[0]
+        else:
+            columns = {path: np.zeros(len(offsets), dtype=self.columns[path]) for path in paths}
+            fallback = np.arange(len(offsets)) if not self.enabled else np.zeros(0, dtype=np.int64)
+
+        if len(fallback) > 0:
+            self._decode_slow(con, offsets, lengths, columns, fallback)
+        return columns
+
+
+def repeated_spans(buf: np.ndarray, offsets: np.ndarray, lengths: np.ndarray, number: int) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Spans of the items of the top level length-delimited field ``number`` (e.g. ``MpsReceiveMsg.msginfo``)
+    of the records at ``offsets`` / ``lengths``, walked field by field like in :class:`WireDecoder`. Returns
+    the records, offsets and lengths of the items in the order of the records, and the mask of the records
+    which could be walked (the items of the others are left out).
+    """
+    ok = np.ones(len(offsets), dtype=bool)
+    pos = offsets.astype(np.int64, copy=True)
+    ends = pos + lengths
+    records, starts, sizes = [], [], []
+
+    active = np.nonzero(pos < ends)[0]
+    while len(active) > 0:
+        tags, tag_sizes = _read_varints(buf, pos[active])
+        start = pos[active] + tag_sizes
+        numbers, wire_types = (tags >> np.uint64(3)).astype(np.int64), (tags & np.uint64(0x7)).astype(np.int64)
+        steps = np.full(len(active), -1, dtype=np.int64)  # -1 for the fields which can not be walked
+        steps[wire_types == _WIRE_FIXED64] = 8
+        steps[wire_types == _WIRE_FIXED32] = 4
+
+        varint = wire_types == _WIRE_VARINT
+        _, value_sizes = _read_varints(buf, start[varint], max_size=10)
+        steps[varint] = np.where(value_sizes > 0, value_sizes, -1)
+        length = wire_types == _WIRE_LENGTH
+        values, value_sizes = _read_varints(buf, start[length])
+        steps[length] = np.where(value_sizes > 0, value_sizes + values.astype(np.int64), -1)
+
+        item = (numbers[length] == number) & (value_sizes > 0)
+        records.append(active[length][item])
+        starts.append(start[length][item] + value_sizes[item])
+        sizes.append(values[item].astype(np.int64))
+
+        ok[active[(tag_sizes == 0) | (steps < 0)]] = False
+        pos[active] = start + steps
+        ok[active[pos[active] > ends[active]]] = False
+        active = active[ok[active] & (pos[active] < ends[active])]
+
+    records = np.concatenate([np.zeros(0, dtype=np.int64), *records])
+    starts = np.concatenate([np.zeros(0, dtype=np.int64), *starts])
+    sizes = np.concatenate([np.zeros(0, dtype=np.int64), *sizes])
+    order = np.argsort(records, kind='stable')  # items were collected field by field
+    order = order[ok[records[order]]]
+    return records[order], starts[order], sizes[order], ok
+
+
+@lru_cache()
+def wire_decoder(message_class) -> WireDecoder:
+    return WireDecoder(message_class)
+
+
+def decode_where(decoder: WireDecoder, con, offsets: np.ndarray, lengths: np.ndarray,
+                 include: Optional[Mapping[str, Optional[Iterable[int]]]] = None,
+                 exclude: Optional[Mapping[str, Optional[Iterable[int]]]] = None,
+                 ranges: Optional[Mapping[str, Tuple[Optional[float], Optional[float]]]] = None,
+                 paths: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Decode only the records whose fields are in ``include``, not in ``exclude`` and within the closed
+    ``ranges`` (``None`` values and bounds are ignored). The filtered fields are peeked first, so the
+    rejected records are never decoded completely.
+    """
+    keep = where_mask(decoder, con, offsets, lengths, include, exclude, ranges)
+    if keep is not None:
+        offsets, lengths = offsets[keep], lengths[keep]
+
+    return decoder.decode(con, offsets, lengths, paths)
+
+
+def where_mask(decoder: WireDecoder, con, offsets: np.ndarray, lengths: np.ndarray,
+               include: Optional[Mapping[str, Optional[Iterable[int]]]] = None,
+               exclude: Optional[Mapping[str, Optional[Iterable[int]]]] = None,
+               ranges: Optional[Mapping[str, Tuple[Optional[float], Optional[float]]]] = None) \
+        -> Optional[np.ndarray]:
+    """
+    Mask of the records matching the conditions of :func:`decode_where`, ``None`` when there is no condition.
+    """
+    include, exclude, ranges = _conditions(include, exclude, ranges)
+    if not (include or exclude or ranges):
+        return None
+
+    keys = decoder.decode(con, offsets, lengths, paths=sorted({*include, *exclude, *ranges}))
+    return match_mask(keys, len(offsets), include, exclude, ranges)
+
+
+def _conditions(include, exclude, ranges):
+    include = {key: values for key, values in (include or {}).items() if values is not None}
+    exclude = {key: values for key, values in (exclude or {}).items() if values is not None}
+    ranges = {key: (lower, upper) for key, (lower, upper) in (ranges or {}).items()
+              if lower is not None or upper is not None}
+    return include, exclude, ranges
+
+
+def match_mask(columns: Mapping[str, np.ndarray], size: int,
+               include: Optional[Mapping[str, Optional[Iterable[int]]]] = None,
+               exclude: Optional[Mapping[str, Optional[Iterable[int]]]] = None,
+               ranges: Optional[Mapping[str, Tuple[Optional[float], Optional[float]]]] = None) \
+        -> Optional[np.ndarray]:
+    """
+    Mask of the ``size`` rows of already decoded ``columns`` matching the conditions of :func:`decode_where`,
+    ``None`` when there is no condition.
+    """
+    include, exclude, ranges = _conditions(include, exclude, ranges)
+    if not (include or exclude or ranges):
+        return None
+
+    keep = np.ones(size, dtype=bool)
+    for key, values in include.items():
+        keep &= np.isin(columns[key], list(values))
+    for key, values in exclude.items():
+        keep &= ~np.isin(columns[key], list(values))
+    for key, (lower, upper) in ranges.items():
+        if lower is not None:
+            keep &= columns[key] >= lower
+        if upper is not None:
+            keep &= columns[key] <= upper
+    return keep
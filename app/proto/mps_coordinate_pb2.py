@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mps_coordinate.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14mps_coordinate.proto\x12\x07MpsSimu\"[\n\x0cMpsProtoHead\x12\x0c\n\x04time\x18\x01 \x01(\x01\x12\n\n\x02id\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x0b\n\x03lng\x18\x04 \x01(\x01\x12\x0b\n\x03lat\x18\x05 \x01(\x01\x12\t\n\x01h\x18\x06 \x01(\x02\"\x80\x01\n\x10MpsProtoAircraft\x12#\n\x04head\x18\x01 \x01(\x0b\x32\x15.MpsSimu.MpsProtoHead\x12\x0c\n\x04roll\x18\x02 \x01(\x02\x12\r\n\x05pitch\x18\x03 \x01(\x02\x12\x0b\n\x03yaw\x18\x04 \x01(\x02\x12\r\n\x05speed\x18\x05 \x01(\x02\x12\x0e\n\x06remain\x18\x06 \x01(\x02\x42\x03\xf8\x01\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mps_coordinate_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\370\001\001'
+  _MPSPROTOHEAD._serialized_start=33
+  _MPSPROTOHEAD._serialized_end=124
+  _MPSPROTOAIRCRAFT._serialized_start=127
+  _MPSPROTOAIRCRAFT._serialized_end=255
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mps_evaluation.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14mps_evaluation.proto\x12\x07MpsEval\"[\n\x0cMpsProtoData\x12\x0c\n\x04time\x18\x01 \x01(\x01\x12\n\n\x02id\x18\x02 \x01(\r\x12\x0c\n\x04type\x18\x03 \x01(\r\x12\x0b\n\x03lng\x18\x04 \x01(\x01\x12\x0b\n\x03lat\x18\x05 \x01(\x01\x12\t\n\x01h\x18\x06 \x01(\x02\"/\n\x0eMpsGapTimeNode\x12\x0b\n\x03gap\x18\x01 \x01(\x01\x12\x10\n\x08timenode\x18\x02 \x01(\x01\"<\n\x0bMpsWayPoint\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\x12\x0c\n\x04time\x18\x04 \x01(\x01\"\xb8\x01\n\x07MpsHead\x12\x0f\n\x07simunum\x18\x01 \x01(\r\x12\x11\n\tswarmsize\x18\x02 \x01(\r\x12\x10\n\x08timestep\x18\x03 \x01(\x02\x12\x0c\n\x04time\x18\x04 \x01(\x02\x12\x11\n\tsafespace\x18\x05 \x01(\x01\x12\'\n\twayPoints\x18\x06 \x03(\x0b\x32\x14.MpsEval.MpsWayPoint\x12-\n\x0cgaptimenodes\x18\x07 \x03(\x0b\x32\x17.MpsEval.MpsGapTimeNodeB\x03\xf8\x01\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mps_evaluation_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\370\001\001'
+  _MPSPROTODATA._serialized_start=33
+  _MPSPROTODATA._serialized_end=124
+  _MPSGAPTIMENODE._serialized_start=126
+  _MPSGAPTIMENODE._serialized_end=173
+  _MPSWAYPOINT._serialized_start=175
+  _MPSWAYPOINT._serialized_end=235
+  _MPSHEAD._serialized_start=238
+  _MPSHEAD._serialized_end=422
+# @@protoc_insertion_point(module_scope)
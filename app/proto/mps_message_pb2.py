@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: mps_message.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11mps_message.proto\x12\x06MpsMsg\"\x1f\n\nMpsMsgHead\x12\x11\n\tswarmsize\x18\x01 \x01(\r\"-\n\nMpsMsgInfo\x12\x0e\n\x06sendID\x18\x01 \x01(\r\x12\x0f\n\x07msgtype\x18\x02 \x01(\r\"U\n\rMpsReceiveMsg\x12\x0c\n\x04time\x18\x01 \x01(\x01\x12\x11\n\treceiveID\x18\x02 \x01(\r\x12#\n\x07msginfo\x18\x03 \x03(\x0b\x32\x12.MpsMsg.MpsMsgInfoB\x03\xf8\x01\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mps_message_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\370\001\001'
+  _MPSMSGHEAD._serialized_start=29
+  _MPSMSGHEAD._serialized_end=60
+  _MPSMSGINFO._serialized_start=62
+  _MPSMSGINFO._serialized_end=107
+  _MPSRECEIVEMSG._serialized_start=109
+  _MPSRECEIVEMSG._serialized_end=194
+# @@protoc_insertion_point(module_scope)
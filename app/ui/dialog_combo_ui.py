@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'dialog_combo.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_dialog_combo(object):
+    def setupUi(self, dialog_combo):
+        dialog_combo.setObjectName("dialog_combo")
+        dialog_combo.resize(277, 134)
+        self.button_next = QtWidgets.QDialogButtonBox(dialog_combo)
+        self.button_next.setGeometry(QtCore.QRect(20, 90, 241, 32))
+        self.button_next.setOrientation(QtCore.Qt.Horizontal)
+        self.button_next.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.button_next.setObjectName("button_next")
+        self.combo_selection = QtWidgets.QComboBox(dialog_combo)
+        self.combo_selection.setGeometry(QtCore.QRect(20, 50, 241, 25))
+        self.combo_selection.setObjectName("combo_selection")
+        self.label_content = QtWidgets.QLabel(dialog_combo)
+        self.label_content.setGeometry(QtCore.QRect(20, 20, 241, 17))
+        self.label_content.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_content.setWordWrap(True)
+        self.label_content.setObjectName("label_content")
+
+        self.retranslateUi(dialog_combo)
+        self.button_next.accepted.connect(dialog_combo.accept) # type: ignore
+        self.button_next.rejected.connect(dialog_combo.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(dialog_combo)
+
+    def retranslateUi(self, dialog_combo):
+        _translate = QtCore.QCoreApplication.translate
+        dialog_combo.setWindowTitle(_translate("dialog_combo", "单选对话框"))
+        self.label_content.setText(_translate("dialog_combo", "TextLabel kdsjflkdjslf sdkfjlsdkfn sdfkjlkjlsdfjk  kadsjf asdlfkl;"))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'dialog_config.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_dialog_config(object):
+    def setupUi(self, dialog_config):
+        dialog_config.setObjectName("dialog_config")
+        dialog_config.resize(411, 119)
+        self.label_title = QtWidgets.QLabel(dialog_config)
+        self.label_title.setGeometry(QtCore.QRect(20, 20, 361, 18))
+        self.label_title.setObjectName("label_title")
+        self.label_author = QtWidgets.QLabel(dialog_config)
+        self.label_author.setGeometry(QtCore.QRect(20, 50, 361, 18))
+        self.label_author.setObjectName("label_author")
+        self.button_dialog = QtWidgets.QDialogButtonBox(dialog_config)
+        self.button_dialog.setGeometry(QtCore.QRect(210, 80, 181, 25))
+        self.button_dialog.setStandardButtons(QtWidgets.QDialogButtonBox.Ok)
+        self.button_dialog.setObjectName("button_dialog")
+
+        self.retranslateUi(dialog_config)
+        QtCore.QMetaObject.connectSlotsByName(dialog_config)
+
+    def retranslateUi(self, dialog_config):
+        _translate = QtCore.QCoreApplication.translate
+        dialog_config.setWindowTitle(_translate("dialog_config", "应用信息"))
+        self.label_title.setText(_translate("dialog_config", "TextLabel"))
+        self.label_author.setText(_translate("dialog_config", "TextLabel"))
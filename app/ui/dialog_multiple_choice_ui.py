@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'dialog_multiple_choice.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_dialog_multiple_choice(object):
+    def setupUi(self, dialog_multiple_choice):
+        dialog_multiple_choice.setObjectName("dialog_multiple_choice")
+        dialog_multiple_choice.resize(341, 293)
+        self.button_next = QtWidgets.QDialogButtonBox(dialog_multiple_choice)
+        self.button_next.setEnabled(True)
+        self.button_next.setGeometry(QtCore.QRect(60, 250, 261, 32))
+        self.button_next.setOrientation(QtCore.Qt.Horizontal)
+        self.button_next.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.button_next.setObjectName("button_next")
+        self.label_content = QtWidgets.QLabel(dialog_multiple_choice)
+        self.label_content.setGeometry(QtCore.QRect(20, 20, 301, 17))
+        self.label_content.setWordWrap(True)
+        self.label_content.setObjectName("label_content")
+        self.list_choices = QtWidgets.QListView(dialog_multiple_choice)
+        self.list_choices.setGeometry(QtCore.QRect(20, 50, 301, 192))
+        self.list_choices.setObjectName("list_choices")
+
+        self.retranslateUi(dialog_multiple_choice)
+        self.button_next.accepted.connect(dialog_multiple_choice.accept) # type: ignore
+        self.button_next.rejected.connect(dialog_multiple_choice.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(dialog_multiple_choice)
+
+    def retranslateUi(self, dialog_multiple_choice):
+        _translate = QtCore.QCoreApplication.translate
+        dialog_multiple_choice.setWindowTitle(_translate("dialog_multiple_choice", "多选对话框"))
+        self.label_content.setText(_translate("dialog_multiple_choice", "TextLabel"))
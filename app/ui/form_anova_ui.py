@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_anova.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_anova(object):
+    def setupUi(self, form_anova):
+        form_anova.setObjectName("form_anova")
+        form_anova.resize(1016, 576)
+        self.tabs_pages = QtWidgets.QTabWidget(form_anova)
+        self.tabs_pages.setGeometry(QtCore.QRect(17, 27, 981, 531))
+        self.tabs_pages.setObjectName("tabs_pages")
+        self.tab_data = QtWidgets.QWidget()
+        self.tab_data.setObjectName("tab_data")
+        self.table_data = QtWidgets.QTableView(self.tab_data)
+        self.table_data.setGeometry(QtCore.QRect(20, 20, 621, 421))
+        self.table_data.setObjectName("table_data")
+        self.button_open = QtWidgets.QPushButton(self.tab_data)
+        self.button_open.setGeometry(QtCore.QRect(370, 456, 271, 25))
+        self.button_open.setObjectName("button_open")
+        self.table_dependents = QtWidgets.QTableView(self.tab_data)
+        self.table_dependents.setGeometry(QtCore.QRect(660, 190, 301, 251))
+        self.table_dependents.setObjectName("table_dependents")
+        self.button_analysis = QtWidgets.QPushButton(self.tab_data)
+        self.button_analysis.setEnabled(False)
+        self.button_analysis.setGeometry(QtCore.QRect(770, 456, 191, 25))
+        self.button_analysis.setCheckable(False)
+        self.button_analysis.setChecked(False)
+        self.button_analysis.setObjectName("button_analysis")
+        self.table_independents = QtWidgets.QTableView(self.tab_data)
+        self.table_independents.setGeometry(QtCore.QRect(660, 20, 256, 151))
+        self.table_independents.setObjectName("table_independents")
+        self.button_ind_add = QtWidgets.QPushButton(self.tab_data)
+        self.button_ind_add.setEnabled(False)
+        self.button_ind_add.setGeometry(QtCore.QRect(930, 20, 31, 31))
+        self.button_ind_add.setText("")
+        self.button_ind_add.setObjectName("button_ind_add")
+        self.button_ind_del = QtWidgets.QPushButton(self.tab_data)
+        self.button_ind_del.setEnabled(False)
+        self.button_ind_del.setGeometry(QtCore.QRect(930, 60, 31, 31))
+        self.button_ind_del.setText("")
+        self.button_ind_del.setObjectName("button_ind_del")
+        self.button_ind_clear = QtWidgets.QPushButton(self.tab_data)
+        self.button_ind_clear.setEnabled(False)
+        self.button_ind_clear.setGeometry(QtCore.QRect(930, 100, 31, 31))
+        self.button_ind_clear.setText("")
+        self.button_ind_clear.setObjectName("button_ind_clear")
+        self.tabs_pages.addTab(self.tab_data, "")
+        self.tab_analysis = QtWidgets.QWidget()
+        self.tab_analysis.setObjectName("tab_analysis")
+        self.table_analysis = QtWidgets.QTableView(self.tab_analysis)
+        self.table_analysis.setGeometry(QtCore.QRect(20, 20, 941, 431))
+        self.table_analysis.setObjectName("table_analysis")
+        self.button_export = QtWidgets.QPushButton(self.tab_analysis)
+        self.button_export.setEnabled(False)
+        self.button_export.setGeometry(QtCore.QRect(670, 460, 291, 25))
+        self.button_export.setObjectName("button_export")
+        self.tabs_pages.addTab(self.tab_analysis, "")
+
+        self.retranslateUi(form_anova)
+        self.tabs_pages.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(form_anova)
+
+    def retranslateUi(self, form_anova):
+        _translate = QtCore.QCoreApplication.translate
+        form_anova.setWindowTitle(_translate("form_anova", "方差显著性分析"))
+        self.button_open.setText(_translate("form_anova", "打开..."))
+        self.button_open.setShortcut(_translate("form_anova", "Ctrl+O"))
+        self.button_analysis.setText(_translate("form_anova", "分析"))
+        self.button_analysis.setShortcut(_translate("form_anova", "Return"))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_data), _translate("form_anova", "数据"))
+        self.button_export.setText(_translate("form_anova", "导出分析结果"))
+        self.button_export.setShortcut(_translate("form_anova", "Ctrl+S"))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_analysis), _translate("form_anova", "分析面板"))
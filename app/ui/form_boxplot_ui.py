@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_boxplot.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_boxplot(object):
+    def setupUi(self, form_boxplot):
+        form_boxplot.setObjectName("form_boxplot")
+        form_boxplot.resize(1016, 576)
+        self.tabs_pages = QtWidgets.QTabWidget(form_boxplot)
+        self.tabs_pages.setGeometry(QtCore.QRect(17, 27, 981, 531))
+        self.tabs_pages.setObjectName("tabs_pages")
+        self.tab_data = QtWidgets.QWidget()
+        self.tab_data.setObjectName("tab_data")
+        self.table_data = QtWidgets.QTableView(self.tab_data)
+        self.table_data.setGeometry(QtCore.QRect(20, 20, 941, 431))
+        self.table_data.setObjectName("table_data")
+        self.button_open = QtWidgets.QPushButton(self.tab_data)
+        self.button_open.setGeometry(QtCore.QRect(690, 460, 271, 25))
+        self.button_open.setObjectName("button_open")
+        self.tabs_pages.addTab(self.tab_data, "")
+        self.tab_display = QtWidgets.QWidget()
+        self.tab_display.setObjectName("tab_display")
+        self.button_export = QtWidgets.QPushButton(self.tab_display)
+        self.button_export.setEnabled(False)
+        self.button_export.setGeometry(QtCore.QRect(670, 460, 291, 25))
+        self.button_export.setObjectName("button_export")
+        self.widget_graph = QtWidgets.QWidget(self.tab_display)
+        self.widget_graph.setGeometry(QtCore.QRect(19, 19, 621, 461))
+        self.widget_graph.setStyleSheet("border: 2px dashed grey")
+        self.widget_graph.setObjectName("widget_graph")
+        self.group_display = QtWidgets.QGroupBox(self.tab_display)
+        self.group_display.setGeometry(QtCore.QRect(660, 20, 301, 161))
+        self.group_display.setAlignment(QtCore.Qt.AlignCenter)
+        self.group_display.setObjectName("group_display")
+        self.button_display = QtWidgets.QPushButton(self.group_display)
+        self.button_display.setEnabled(False)
+        self.button_display.setGeometry(QtCore.QRect(20, 120, 261, 25))
+        self.button_display.setCheckable(False)
+        self.button_display.setChecked(False)
+        self.button_display.setObjectName("button_display")
+        self.combo_x = QtWidgets.QComboBox(self.group_display)
+        self.combo_x.setEnabled(False)
+        self.combo_x.setGeometry(QtCore.QRect(80, 40, 201, 25))
+        self.combo_x.setObjectName("combo_x")
+        self.label_x = QtWidgets.QLabel(self.group_display)
+        self.label_x.setGeometry(QtCore.QRect(23, 44, 67, 17))
+        self.label_x.setObjectName("label_x")
+        self.combo_y = QtWidgets.QComboBox(self.group_display)
+        self.combo_y.setEnabled(False)
+        self.combo_y.setGeometry(QtCore.QRect(80, 80, 201, 25))
+        self.combo_y.setObjectName("combo_y")
+        self.label_y = QtWidgets.QLabel(self.group_display)
+        self.label_y.setGeometry(QtCore.QRect(23, 84, 67, 17))
+        self.label_y.setObjectName("label_y")
+        self.label_x.raise_()
+        self.button_display.raise_()
+        self.combo_x.raise_()
+        self.combo_y.raise_()
+        self.label_y.raise_()
+        self.group_info = QtWidgets.QGroupBox(self.tab_display)
+        self.group_info.setGeometry(QtCore.QRect(660, 190, 301, 251))
+        self.group_info.setAlignment(QtCore.Qt.AlignCenter)
+        self.group_info.setObjectName("group_info")
+        self.label_valid_total = QtWidgets.QLabel(self.group_info)
+        self.label_valid_total.setGeometry(QtCore.QRect(20, 50, 261, 17))
+        self.label_valid_total.setObjectName("label_valid_total")
+        self.label_max = QtWidgets.QLabel(self.group_info)
+        self.label_max.setGeometry(QtCore.QRect(20, 70, 261, 17))
+        self.label_max.setObjectName("label_max")
+        self.label_min = QtWidgets.QLabel(self.group_info)
+        self.label_min.setGeometry(QtCore.QRect(20, 90, 261, 17))
+        self.label_min.setObjectName("label_min")
+        self.label_mean = QtWidgets.QLabel(self.group_info)
+        self.label_mean.setGeometry(QtCore.QRect(20, 110, 261, 17))
+        self.label_mean.setObjectName("label_mean")
+        self.label_std = QtWidgets.QLabel(self.group_info)
+        self.label_std.setGeometry(QtCore.QRect(20, 130, 261, 17))
+        self.label_std.setObjectName("label_std")
+        self.label_qs = QtWidgets.QLabel(self.group_info)
+        self.label_qs.setGeometry(QtCore.QRect(20, 150, 261, 17))
+        self.label_qs.setObjectName("label_qs")
+        self.label_bound = QtWidgets.QLabel(self.group_info)
+        self.label_bound.setGeometry(QtCore.QRect(20, 170, 261, 17))
+        self.label_bound.setObjectName("label_bound")
+        self.label_errors = QtWidgets.QLabel(self.group_info)
+        self.label_errors.setGeometry(QtCore.QRect(20, 190, 261, 17))
+        self.label_errors.setObjectName("label_errors")
+        self.label_x_value = QtWidgets.QLabel(self.group_info)
+        self.label_x_value.setGeometry(QtCore.QRect(20, 30, 261, 17))
+        self.label_x_value.setObjectName("label_x_value")
+        self.button_show_errors = QtWidgets.QPushButton(self.group_info)
+        self.button_show_errors.setEnabled(False)
+        self.button_show_errors.setGeometry(QtCore.QRect(160, 212, 131, 25))
+        self.button_show_errors.setObjectName("button_show_errors")
+        self.tabs_pages.addTab(self.tab_display, "")
+
+        self.retranslateUi(form_boxplot)
+        self.tabs_pages.setCurrentIndex(1)
+        QtCore.QMetaObject.connectSlotsByName(form_boxplot)
+
+    def retranslateUi(self, form_boxplot):
+        _translate = QtCore.QCoreApplication.translate
+        form_boxplot.setWindowTitle(_translate("form_boxplot", "箱线图分布可视化"))
+        self.button_open.setText(_translate("form_boxplot", "打开..."))
+        self.button_open.setShortcut(_translate("form_boxplot", "Ctrl+O"))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_data), _translate("form_boxplot", "数据"))
+        self.button_export.setText(_translate("form_boxplot", "图像导出"))
+        self.button_export.setShortcut(_translate("form_boxplot", "Ctrl+S"))
+        self.group_display.setTitle(_translate("form_boxplot", "可视化选项"))
+        self.button_display.setText(_translate("form_boxplot", "显示"))
+        self.button_display.setShortcut(_translate("form_boxplot", "Return"))
+        self.label_x.setText(_translate("form_boxplot", "X轴 :"))
+        self.label_y.setText(_translate("form_boxplot", "Y轴 :"))
+        self.group_info.setTitle(_translate("form_boxplot", "数据信息"))
+        self.label_valid_total.setText(_translate("form_boxplot", "有效 / 总量: "))
+        self.label_max.setText(_translate("form_boxplot", "最大值: "))
+        self.label_min.setText(_translate("form_boxplot", "最小值: "))
+        self.label_mean.setText(_translate("form_boxplot", "均值: "))
+        self.label_std.setText(_translate("form_boxplot", "标准差: "))
+        self.label_qs.setText(_translate("form_boxplot", "一分 / 二分 / 三分: "))
+        self.label_bound.setText(_translate("form_boxplot", "下界 / 上界: "))
+        self.label_errors.setText(_translate("form_boxplot", "异常值数量:"))
+        self.label_x_value.setText(_translate("form_boxplot", "x值: "))
+        self.button_show_errors.setText(_translate("form_boxplot", "异常值..."))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_display), _translate("form_boxplot", "可视化面板"))
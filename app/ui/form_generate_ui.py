@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_generate.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_generate(object):
+    def setupUi(self, form_generate):
+        form_generate.setObjectName("form_generate")
+        form_generate.resize(1054, 555)
+        self.edit_control_num = QtWidgets.QLineEdit(form_generate)
+        self.edit_control_num.setGeometry(QtCore.QRect(150, 320, 231, 25))
+        self.edit_control_num.setAlignment(QtCore.Qt.AlignCenter)
+        self.edit_control_num.setReadOnly(True)
+        self.edit_control_num.setObjectName("edit_control_num")
+        self.label_control_num = QtWidgets.QLabel(form_generate)
+        self.label_control_num.setGeometry(QtCore.QRect(20, 322, 121, 17))
+        self.label_control_num.setObjectName("label_control_num")
+        self.table_control_type = QtWidgets.QTableWidget(form_generate)
+        self.table_control_type.setGeometry(QtCore.QRect(20, 373, 361, 171))
+        self.table_control_type.setColumnCount(2)
+        self.table_control_type.setObjectName("table_control_type")
+        self.table_control_type.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_control_type.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_control_type.setHorizontalHeaderItem(1, item)
+        self.label_control_type = QtWidgets.QLabel(form_generate)
+        self.label_control_type.setGeometry(QtCore.QRect(20, 352, 351, 17))
+        self.label_control_type.setObjectName("label_control_type")
+        self.table_result = QtWidgets.QTableWidget(form_generate)
+        self.table_result.setGeometry(QtCore.QRect(390, 30, 651, 471))
+        self.table_result.setObjectName("table_result")
+        self.table_result.setColumnCount(7)
+        self.table_result.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(5, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_result.setHorizontalHeaderItem(6, item)
+        self.label_status = QtWidgets.QLabel(form_generate)
+        self.label_status.setGeometry(QtCore.QRect(730, 520, 301, 20))
+        self.label_status.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_status.setObjectName("label_status")
+        self.button_generate = QtWidgets.QToolButton(form_generate)
+        self.button_generate.setGeometry(QtCore.QRect(390, 510, 301, 31))
+        self.button_generate.setObjectName("button_generate")
+        self.widget_properties = QtWidgets.QWidget(form_generate)
+        self.widget_properties.setGeometry(QtCore.QRect(10, 10, 371, 301))
+        self.widget_properties.setObjectName("widget_properties")
+
+        self.retranslateUi(form_generate)
+        QtCore.QMetaObject.connectSlotsByName(form_generate)
+
+    def retranslateUi(self, form_generate):
+        _translate = QtCore.QCoreApplication.translate
+        form_generate.setWindowTitle(_translate("form_generate", "测试数据生成"))
+        self.edit_control_num.setText(_translate("form_generate", "0"))
+        self.edit_control_num.setPlaceholderText(_translate("form_generate", "angle_err"))
+        self.label_control_num.setText(_translate("form_generate", "control_num"))
+        item = self.table_control_type.horizontalHeaderItem(0)
+        item.setText(_translate("form_generate", "time"))
+        item = self.table_control_type.horizontalHeaderItem(1)
+        item.setText(_translate("form_generate", "control"))
+        self.label_control_type.setText(_translate("form_generate", "control_type (双击编辑)"))
+        item = self.table_result.horizontalHeaderItem(0)
+        item.setText(_translate("form_generate", "initial_num"))
+        item = self.table_result.horizontalHeaderItem(1)
+        item.setText(_translate("form_generate", "loc_offset"))
+        item = self.table_result.horizontalHeaderItem(2)
+        item.setText(_translate("form_generate", "loc_err"))
+        item = self.table_result.horizontalHeaderItem(3)
+        item.setText(_translate("form_generate", "angle_err"))
+        item = self.table_result.horizontalHeaderItem(4)
+        item.setText(_translate("form_generate", "perception"))
+        item = self.table_result.horizontalHeaderItem(5)
+        item.setText(_translate("form_generate", "lost_possibility"))
+        item = self.table_result.horizontalHeaderItem(6)
+        item.setText(_translate("form_generate", "control_num"))
+        self.label_status.setText(_translate("form_generate", "已完成"))
+        self.button_generate.setText(_translate("form_generate", "生成数据"))
+        self.button_generate.setShortcut(_translate("form_generate", "Return"))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_log_process.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_log_process(object):
+    def setupUi(self, form_log_process):
+        form_log_process.setObjectName("form_log_process")
+        form_log_process.resize(571, 436)
+        self.table_processing = QtWidgets.QTableView(form_log_process)
+        self.table_processing.setGeometry(QtCore.QRect(15, 41, 411, 331))
+        self.table_processing.setObjectName("table_processing")
+        self.progress_status = QtWidgets.QProgressBar(form_log_process)
+        self.progress_status.setGeometry(QtCore.QRect(15, 400, 411, 23))
+        self.progress_status.setProperty("value", 0)
+        self.progress_status.setObjectName("progress_status")
+        self.label_status = QtWidgets.QLabel(form_log_process)
+        self.label_status.setGeometry(QtCore.QRect(23, 376, 401, 20))
+        self.label_status.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_status.setObjectName("label_status")
+        self.button_open = QtWidgets.QPushButton(form_log_process)
+        self.button_open.setGeometry(QtCore.QRect(440, 20, 121, 25))
+        self.button_open.setObjectName("button_open")
+        self.button_start = QtWidgets.QPushButton(form_log_process)
+        self.button_start.setEnabled(False)
+        self.button_start.setGeometry(QtCore.QRect(440, 60, 121, 25))
+        self.button_start.setObjectName("button_start")
+        self.check_csv = QtWidgets.QCheckBox(form_log_process)
+        self.check_csv.setGeometry(QtCore.QRect(440, 100, 121, 25))
+        self.check_csv.setObjectName("check_csv")
+        self.label_path = QtWidgets.QLabel(form_log_process)
+        self.label_path.setGeometry(QtCore.QRect(19, 16, 401, 20))
+        self.label_path.setObjectName("label_path")
+
+        self.retranslateUi(form_log_process)
+        QtCore.QMetaObject.connectSlotsByName(form_log_process)
+
+    def retranslateUi(self, form_log_process):
+        _translate = QtCore.QCoreApplication.translate
+        form_log_process.setWindowTitle(_translate("form_log_process", "日志路径处理"))
+        self.label_status.setText(_translate("form_log_process", "已完成"))
+        self.button_open.setText(_translate("form_log_process", "打开..."))
+        self.button_open.setShortcut(_translate("form_log_process", "Ctrl+O"))
+        self.button_start.setText(_translate("form_log_process", "开始处理"))
+        self.button_start.setShortcut(_translate("form_log_process", "Return"))
+        self.check_csv.setText(_translate("form_log_process", "导出CSV文件"))
+        self.label_path.setText(_translate("form_log_process", "(暂无路径)"))
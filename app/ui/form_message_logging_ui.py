@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_message_logging.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_message_logging(object):
+    def setupUi(self, form_message_logging):
+        form_message_logging.setObjectName("form_message_logging")
+        form_message_logging.resize(971, 603)
+        self.slider_start_time = QtWidgets.QSlider(form_message_logging)
+        self.slider_start_time.setEnabled(False)
+        self.slider_start_time.setGeometry(QtCore.QRect(128, 30, 411, 21))
+        self.slider_start_time.setTracking(True)
+        self.slider_start_time.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_start_time.setInvertedAppearance(False)
+        self.slider_start_time.setInvertedControls(False)
+        self.slider_start_time.setTickPosition(QtWidgets.QSlider.TicksAbove)
+        self.slider_start_time.setObjectName("slider_start_time")
+        self.slider_end_time = QtWidgets.QSlider(form_message_logging)
+        self.slider_end_time.setEnabled(False)
+        self.slider_end_time.setGeometry(QtCore.QRect(128, 70, 411, 21))
+        self.slider_end_time.setOrientation(QtCore.Qt.Horizontal)
+        self.slider_end_time.setTickPosition(QtWidgets.QSlider.TicksAbove)
+        self.slider_end_time.setObjectName("slider_end_time")
+        self.button_open = QtWidgets.QPushButton(form_message_logging)
+        self.button_open.setGeometry(QtCore.QRect(710, 110, 241, 25))
+        self.button_open.setObjectName("button_open")
+        self.list_items = QtWidgets.QListView(form_message_logging)
+        self.list_items.setGeometry(QtCore.QRect(710, 150, 241, 391))
+        self.list_items.setObjectName("list_items")
+        self.edit_start_time = QtWidgets.QLineEdit(form_message_logging)
+        self.edit_start_time.setEnabled(False)
+        self.edit_start_time.setGeometry(QtCore.QRect(560, 30, 121, 25))
+        self.edit_start_time.setAlignment(QtCore.Qt.AlignCenter)
+        self.edit_start_time.setReadOnly(True)
+        self.edit_start_time.setObjectName("edit_start_time")
+        self.edit_end_time = QtWidgets.QLineEdit(form_message_logging)
+        self.edit_end_time.setEnabled(False)
+        self.edit_end_time.setGeometry(QtCore.QRect(560, 70, 121, 25))
+        self.edit_end_time.setAlignment(QtCore.Qt.AlignCenter)
+        self.edit_end_time.setReadOnly(True)
+        self.edit_end_time.setObjectName("edit_end_time")
+        self.label_start_time = QtWidgets.QLabel(form_message_logging)
+        self.label_start_time.setGeometry(QtCore.QRect(28, 33, 91, 20))
+        self.label_start_time.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_start_time.setObjectName("label_start_time")
+        self.label_end_time = QtWidgets.QLabel(form_message_logging)
+        self.label_end_time.setGeometry(QtCore.QRect(28, 73, 91, 20))
+        self.label_end_time.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_end_time.setObjectName("label_end_time")
+        self.table_messages = QtWidgets.QTableView(form_message_logging)
+        self.table_messages.setGeometry(QtCore.QRect(30, 120, 651, 421))
+        self.table_messages.setObjectName("table_messages")
+        self.button_logging = QtWidgets.QPushButton(form_message_logging)
+        self.button_logging.setEnabled(False)
+        self.button_logging.setGeometry(QtCore.QRect(710, 560, 241, 25))
+        self.button_logging.setObjectName("button_logging")
+        self.button_export = QtWidgets.QPushButton(form_message_logging)
+        self.button_export.setEnabled(False)
+        self.button_export.setGeometry(QtCore.QRect(438, 560, 241, 25))
+        self.button_export.setObjectName("button_export")
+        self.progress_status = QtWidgets.QProgressBar(form_message_logging)
+        self.progress_status.setGeometry(QtCore.QRect(37, 560, 371, 23))
+        self.progress_status.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.progress_status.setProperty("value", 24)
+        self.progress_status.setTextVisible(True)
+        self.progress_status.setInvertedAppearance(False)
+        self.progress_status.setObjectName("progress_status")
+
+        self.retranslateUi(form_message_logging)
+        QtCore.QMetaObject.connectSlotsByName(form_message_logging)
+
+    def retranslateUi(self, form_message_logging):
+        _translate = QtCore.QCoreApplication.translate
+        form_message_logging.setWindowTitle(_translate("form_message_logging", "日志消息查询"))
+        self.button_open.setText(_translate("form_message_logging", "打开..."))
+        self.button_open.setShortcut(_translate("form_message_logging", "Ctrl+O"))
+        self.label_start_time.setText(_translate("form_message_logging", "开始时间"))
+        self.label_end_time.setText(_translate("form_message_logging", "结束时间"))
+        self.button_logging.setText(_translate("form_message_logging", "查询消息"))
+        self.button_export.setText(_translate("form_message_logging", "消息导出"))
+        self.button_export.setShortcut(_translate("form_message_logging", "Ctrl+S"))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_metrics.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_metrics(object):
+    def setupUi(self, form_metrics):
+        form_metrics.setObjectName("form_metrics")
+        form_metrics.resize(987, 533)
+        self.table_result = QtWidgets.QTableView(form_metrics)
+        self.table_result.setGeometry(QtCore.QRect(20, 50, 731, 401))
+        self.table_result.setObjectName("table_result")
+        self.button_open = QtWidgets.QPushButton(form_metrics)
+        self.button_open.setGeometry(QtCore.QRect(770, 30, 201, 25))
+        self.button_open.setObjectName("button_open")
+        self.button_start = QtWidgets.QPushButton(form_metrics)
+        self.button_start.setEnabled(False)
+        self.button_start.setGeometry(QtCore.QRect(770, 70, 201, 25))
+        self.button_start.setObjectName("button_start")
+        self.label_status = QtWidgets.QLabel(form_metrics)
+        self.label_status.setGeometry(QtCore.QRect(26, 460, 721, 20))
+        self.label_status.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_status.setObjectName("label_status")
+        self.label_path = QtWidgets.QLabel(form_metrics)
+        self.label_path.setGeometry(QtCore.QRect(26, 23, 721, 20))
+        self.label_path.setObjectName("label_path")
+        self.progress_status = QtWidgets.QProgressBar(form_metrics)
+        self.progress_status.setGeometry(QtCore.QRect(17, 490, 731, 23))
+        self.progress_status.setProperty("value", 0)
+        self.progress_status.setObjectName("progress_status")
+        self.button_export = QtWidgets.QPushButton(form_metrics)
+        self.button_export.setEnabled(False)
+        self.button_export.setGeometry(QtCore.QRect(770, 110, 201, 25))
+        self.button_export.setObjectName("button_export")
+        self.list_metrics = QtWidgets.QListWidget(form_metrics)
+        self.list_metrics.setGeometry(QtCore.QRect(770, 211, 201, 241))
+        self.list_metrics.setObjectName("list_metrics")
+
+        self.retranslateUi(form_metrics)
+        QtCore.QMetaObject.connectSlotsByName(form_metrics)
+
+    def retranslateUi(self, form_metrics):
+        _translate = QtCore.QCoreApplication.translate
+        form_metrics.setWindowTitle(_translate("form_metrics", "日志指标计算"))
+        self.button_open.setText(_translate("form_metrics", "打开..."))
+        self.button_open.setShortcut(_translate("form_metrics", "Ctrl+O"))
+        self.button_start.setText(_translate("form_metrics", "开始计算"))
+        self.button_start.setShortcut(_translate("form_metrics", "Return"))
+        self.label_status.setText(_translate("form_metrics", "已完成"))
+        self.label_path.setText(_translate("form_metrics", "(暂无路径)"))
+        self.button_export.setText(_translate("form_metrics", "结果导出"))
+        self.list_metrics.setSortingEnabled(False)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_scatter.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_scatter(object):
+    def setupUi(self, form_scatter):
+        form_scatter.setObjectName("form_scatter")
+        form_scatter.resize(1016, 576)
+        self.tabs_pages = QtWidgets.QTabWidget(form_scatter)
+        self.tabs_pages.setGeometry(QtCore.QRect(17, 27, 981, 531))
+        self.tabs_pages.setObjectName("tabs_pages")
+        self.tab_data = QtWidgets.QWidget()
+        self.tab_data.setObjectName("tab_data")
+        self.table_data = QtWidgets.QTableView(self.tab_data)
+        self.table_data.setGeometry(QtCore.QRect(20, 20, 941, 431))
+        self.table_data.setObjectName("table_data")
+        self.button_open = QtWidgets.QPushButton(self.tab_data)
+        self.button_open.setGeometry(QtCore.QRect(690, 460, 271, 25))
+        self.button_open.setObjectName("button_open")
+        self.tabs_pages.addTab(self.tab_data, "")
+        self.tab_display = QtWidgets.QWidget()
+        self.tab_display.setObjectName("tab_display")
+        self.button_export = QtWidgets.QPushButton(self.tab_display)
+        self.button_export.setEnabled(False)
+        self.button_export.setGeometry(QtCore.QRect(670, 460, 291, 25))
+        self.button_export.setObjectName("button_export")
+        self.widget_graph = QtWidgets.QWidget(self.tab_display)
+        self.widget_graph.setGeometry(QtCore.QRect(19, 19, 621, 461))
+        self.widget_graph.setStyleSheet("border: 2px dashed grey")
+        self.widget_graph.setObjectName("widget_graph")
+        self.group_display = QtWidgets.QGroupBox(self.tab_display)
+        self.group_display.setGeometry(QtCore.QRect(660, 20, 301, 171))
+        self.group_display.setAlignment(QtCore.Qt.AlignCenter)
+        self.group_display.setObjectName("group_display")
+        self.button_display = QtWidgets.QPushButton(self.group_display)
+        self.button_display.setEnabled(False)
+        self.button_display.setGeometry(QtCore.QRect(20, 130, 261, 25))
+        self.button_display.setCheckable(False)
+        self.button_display.setChecked(False)
+        self.button_display.setObjectName("button_display")
+        self.combo_x = QtWidgets.QComboBox(self.group_display)
+        self.combo_x.setEnabled(False)
+        self.combo_x.setGeometry(QtCore.QRect(80, 40, 201, 25))
+        self.combo_x.setObjectName("combo_x")
+        self.label_x = QtWidgets.QLabel(self.group_display)
+        self.label_x.setGeometry(QtCore.QRect(23, 44, 67, 17))
+        self.label_x.setObjectName("label_x")
+        self.combo_y = QtWidgets.QComboBox(self.group_display)
+        self.combo_y.setEnabled(False)
+        self.combo_y.setGeometry(QtCore.QRect(80, 80, 201, 25))
+        self.combo_y.setObjectName("combo_y")
+        self.label_y = QtWidgets.QLabel(self.group_display)
+        self.label_y.setGeometry(QtCore.QRect(23, 84, 67, 17))
+        self.label_y.setObjectName("label_y")
+        self.label_x.raise_()
+        self.button_display.raise_()
+        self.combo_x.raise_()
+        self.combo_y.raise_()
+        self.label_y.raise_()
+        self.group_info = QtWidgets.QGroupBox(self.tab_display)
+        self.group_info.setGeometry(QtCore.QRect(660, 210, 301, 231))
+        self.group_info.setAlignment(QtCore.Qt.AlignCenter)
+        self.group_info.setObjectName("group_info")
+        self.label_valid_total = QtWidgets.QLabel(self.group_info)
+        self.label_valid_total.setGeometry(QtCore.QRect(20, 40, 261, 17))
+        self.label_valid_total.setObjectName("label_valid_total")
+        self.table_selected = QtWidgets.QTableView(self.group_info)
+        self.table_selected.setGeometry(QtCore.QRect(20, 72, 261, 141))
+        self.table_selected.setObjectName("table_selected")
+        self.tabs_pages.addTab(self.tab_display, "")
+
+        self.retranslateUi(form_scatter)
+        self.tabs_pages.setCurrentIndex(1)
+        QtCore.QMetaObject.connectSlotsByName(form_scatter)
+
+    def retranslateUi(self, form_scatter):
+        _translate = QtCore.QCoreApplication.translate
+        form_scatter.setWindowTitle(_translate("form_scatter", "散点图可视化"))
+        self.button_open.setText(_translate("form_scatter", "打开..."))
+        self.button_open.setShortcut(_translate("form_scatter", "Ctrl+O"))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_data), _translate("form_scatter", "数据"))
+        self.button_export.setText(_translate("form_scatter", "图像导出"))
+        self.button_export.setShortcut(_translate("form_scatter", "Ctrl+S"))
+        self.group_display.setTitle(_translate("form_scatter", "可视化选项"))
+        self.button_display.setText(_translate("form_scatter", "显示"))
+        self.button_display.setShortcut(_translate("form_scatter", "Return"))
+        self.label_x.setText(_translate("form_scatter", "X轴 :"))
+        self.label_y.setText(_translate("form_scatter", "Y轴 :"))
+        self.group_info.setTitle(_translate("form_scatter", "点信息"))
+        self.label_valid_total.setText(_translate("form_scatter", "有效 / 总量: "))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_display), _translate("form_scatter", "可视化面板"))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'form_spearmanr.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_form_spearmanr(object):
+    def setupUi(self, form_spearmanr):
+        form_spearmanr.setObjectName("form_spearmanr")
+        form_spearmanr.resize(1016, 576)
+        self.tabs_pages = QtWidgets.QTabWidget(form_spearmanr)
+        self.tabs_pages.setGeometry(QtCore.QRect(17, 27, 981, 531))
+        self.tabs_pages.setObjectName("tabs_pages")
+        self.tab_data = QtWidgets.QWidget()
+        self.tab_data.setObjectName("tab_data")
+        self.table_data = QtWidgets.QTableView(self.tab_data)
+        self.table_data.setGeometry(QtCore.QRect(20, 20, 651, 461))
+        self.table_data.setObjectName("table_data")
+        self.button_open = QtWidgets.QPushButton(self.tab_data)
+        self.button_open.setGeometry(QtCore.QRect(690, 20, 271, 25))
+        self.button_open.setObjectName("button_open")
+        self.table_items = QtWidgets.QTableView(self.tab_data)
+        self.table_items.setGeometry(QtCore.QRect(690, 130, 271, 311))
+        self.table_items.setObjectName("table_items")
+        self.button_analysis = QtWidgets.QPushButton(self.tab_data)
+        self.button_analysis.setEnabled(False)
+        self.button_analysis.setGeometry(QtCore.QRect(690, 456, 271, 25))
+        self.button_analysis.setCheckable(False)
+        self.button_analysis.setChecked(False)
+        self.button_analysis.setObjectName("button_analysis")
+        self.tabs_pages.addTab(self.tab_data, "")
+        self.tab_analysis = QtWidgets.QWidget()
+        self.tab_analysis.setObjectName("tab_analysis")
+        self.table_analysis = QtWidgets.QTableView(self.tab_analysis)
+        self.table_analysis.setGeometry(QtCore.QRect(20, 20, 941, 431))
+        self.table_analysis.setObjectName("table_analysis")
+        self.button_export = QtWidgets.QPushButton(self.tab_analysis)
+        self.button_export.setEnabled(False)
+        self.button_export.setGeometry(QtCore.QRect(670, 460, 291, 25))
+        self.button_export.setObjectName("button_export")
+        self.tabs_pages.addTab(self.tab_analysis, "")
+
+        self.retranslateUi(form_spearmanr)
+        self.tabs_pages.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(form_spearmanr)
+
+    def retranslateUi(self, form_spearmanr):
+        _translate = QtCore.QCoreApplication.translate
+        form_spearmanr.setWindowTitle(_translate("form_spearmanr", "Spearmanr相关性分析"))
+        self.button_open.setText(_translate("form_spearmanr", "打开..."))
+        self.button_open.setShortcut(_translate("form_spearmanr", "Ctrl+O"))
+        self.button_analysis.setText(_translate("form_spearmanr", "数据分析"))
+        self.button_analysis.setShortcut(_translate("form_spearmanr", "Return"))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_data), _translate("form_spearmanr", "数据"))
+        self.button_export.setText(_translate("form_spearmanr", "分析结果导出"))
+        self.button_export.setShortcut(_translate("form_spearmanr", "Ctrl+S"))
+        self.tabs_pages.setTabText(self.tabs_pages.indexOf(self.tab_analysis), _translate("form_spearmanr", "分析面板"))
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_main_window(object):
+    def setupUi(self, main_window):
+        main_window.setObjectName("main_window")
+        main_window.resize(1080, 678)
+        self.centralwidget = QtWidgets.QWidget(main_window)
+        self.centralwidget.setObjectName("centralwidget")
+        self.mdi_area = QtWidgets.QMdiArea(self.centralwidget)
+        self.mdi_area.setGeometry(QtCore.QRect(9, 69, 881, 471))
+        self.mdi_area.setViewMode(QtWidgets.QMdiArea.SubWindowView)
+        self.mdi_area.setObjectName("mdi_area")
+        main_window.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(main_window)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1080, 28))
+        self.menubar.setObjectName("menubar")
+        self.menu_feature = QtWidgets.QMenu(self.menubar)
+        self.menu_feature.setObjectName("menu_feature")
+        self.menu_About = QtWidgets.QMenu(self.menubar)
+        self.menu_About.setObjectName("menu_About")
+        main_window.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(main_window)
+        self.statusbar.setObjectName("statusbar")
+        main_window.setStatusBar(self.statusbar)
+        self.action_application = QtWidgets.QAction(main_window)
+        self.action_application.setObjectName("action_application")
+        self.action_data_generation = QtWidgets.QAction(main_window)
+        self.action_data_generation.setObjectName("action_data_generation")
+        self.actionData_Visualization = QtWidgets.QAction(main_window)
+        self.actionData_Visualization.setObjectName("actionData_Visualization")
+        self.action_data_visualization = QtWidgets.QAction(main_window)
+        self.action_data_visualization.setObjectName("action_data_visualization")
+        self.action_result_metrics = QtWidgets.QAction(main_window)
+        self.action_result_metrics.setObjectName("action_result_metrics")
+        self.action_log_processing = QtWidgets.QAction(main_window)
+        self.action_log_processing.setObjectName("action_log_processing")
+        self.action_message_logging = QtWidgets.QAction(main_window)
+        self.action_message_logging.setObjectName("action_message_logging")
+        self.action_spearman = QtWidgets.QAction(main_window)
+        self.action_spearman.setObjectName("action_spearman")
+        self.action_anova = QtWidgets.QAction(main_window)
+        self.action_anova.setObjectName("action_anova")
+        self.action_scatter = QtWidgets.QAction(main_window)
+        self.action_scatter.setObjectName("action_scatter")
+        self.action_boxplot = QtWidgets.QAction(main_window)
+        self.action_boxplot.setObjectName("action_boxplot")
+        self.menu_feature.addAction(self.action_data_generation)
+        self.menu_feature.addSeparator()
+        self.menu_feature.addAction(self.action_log_processing)
+        self.menu_feature.addAction(self.action_result_metrics)
+        self.menu_feature.addAction(self.action_message_logging)
+        self.menu_feature.addSeparator()
+        self.menu_feature.addAction(self.action_spearman)
+        self.menu_feature.addAction(self.action_anova)
+        self.menu_feature.addSeparator()
+        self.menu_feature.addAction(self.action_scatter)
+        self.menu_feature.addAction(self.action_boxplot)
+        self.menu_About.addAction(self.action_application)
+        self.menubar.addAction(self.menu_feature.menuAction())
+        self.menubar.addAction(self.menu_About.menuAction())
+
+        self.retranslateUi(main_window)
+        QtCore.QMetaObject.connectSlotsByName(main_window)
+
+    def retranslateUi(self, main_window):
+        _translate = QtCore.QCoreApplication.translate
+        main_window.setWindowTitle(_translate("main_window", "测试数据生成与分析工具"))
+        self.menu_feature.setTitle(_translate("main_window", "功能(&F)"))
+        self.menu_About.setTitle(_translate("main_window", "关于(&A)"))
+        self.action_application.setText(_translate("main_window", "当前软件(&S)"))
+        self.action_data_generation.setText(_translate("main_window", "测试数据生成(&G)"))
+        self.actionData_Visualization.setText(_translate("main_window", "Data &Visualization"))
+        self.action_data_visualization.setText(_translate("main_window", "Data &Visualization"))
+        self.action_result_metrics.setText(_translate("main_window", "日志指标计算(&M)"))
+        self.action_log_processing.setText(_translate("main_window", "日志路径处理(&L)"))
+        self.action_message_logging.setText(_translate("main_window", "日志消息查询(&Q)"))
+        self.action_spearman.setText(_translate("main_window", "Spearmanr相关性分析(&S)"))
+        self.action_anova.setText(_translate("main_window", "方差显著性分析(&A)"))
+        self.action_scatter.setText(_translate("main_window", "散点图可视化(&P)"))
+        self.action_boxplot.setText(_translate("main_window", "箱线图分布可视化(&B)"))
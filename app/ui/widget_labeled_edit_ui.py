@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'widget_labeled_edit.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LabeledEdit(object):
+    def setupUi(self, LabeledEdit):
+        LabeledEdit.setObjectName("LabeledEdit")
+        LabeledEdit.resize(312, 38)
+        self.edit_name = QtWidgets.QLabel(LabeledEdit)
+        self.edit_name.setGeometry(QtCore.QRect(5, 10, 121, 17))
+        self.edit_name.setObjectName("edit_name")
+        self.edit_content = QtWidgets.QLineEdit(LabeledEdit)
+        self.edit_content.setGeometry(QtCore.QRect(136, 6, 171, 25))
+        self.edit_content.setAlignment(QtCore.Qt.AlignCenter)
+        self.edit_content.setObjectName("edit_content")
+
+        self.retranslateUi(LabeledEdit)
+        QtCore.QMetaObject.connectSlotsByName(LabeledEdit)
+
+    def retranslateUi(self, LabeledEdit):
+        _translate = QtCore.QCoreApplication.translate
+        LabeledEdit.setWindowTitle(_translate("LabeledEdit", "Form"))
+        self.edit_name.setText(_translate("LabeledEdit", "TextLabel"))
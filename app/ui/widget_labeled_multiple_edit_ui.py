@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'widget_labeled_multiple_edit.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_LabeledMultipleEdit(object):
+    def setupUi(self, LabeledMultipleEdit):
+        LabeledMultipleEdit.setObjectName("LabeledMultipleEdit")
+        LabeledMultipleEdit.resize(312, 38)
+        self.edit_name = QtWidgets.QLabel(LabeledMultipleEdit)
+        self.edit_name.setGeometry(QtCore.QRect(5, 10, 121, 17))
+        self.edit_name.setObjectName("edit_name")
+        self.edit_content = QtWidgets.QLineEdit(LabeledMultipleEdit)
+        self.edit_content.setGeometry(QtCore.QRect(136, 6, 141, 25))
+        self.edit_content.setAlignment(QtCore.Qt.AlignCenter)
+        self.edit_content.setReadOnly(True)
+        self.edit_content.setObjectName("edit_content")
+        self.edit_edit = QtWidgets.QPushButton(LabeledMultipleEdit)
+        self.edit_edit.setGeometry(QtCore.QRect(277, 6, 30, 25))
+        self.edit_edit.setObjectName("edit_edit")
+
+        self.retranslateUi(LabeledMultipleEdit)
+        QtCore.QMetaObject.connectSlotsByName(LabeledMultipleEdit)
+
+    def retranslateUi(self, LabeledMultipleEdit):
+        _translate = QtCore.QCoreApplication.translate
+        LabeledMultipleEdit.setWindowTitle(_translate("LabeledMultipleEdit", "Form"))
+        self.edit_name.setText(_translate("LabeledMultipleEdit", "TextLabel"))
+        self.edit_edit.setText(_translate("LabeledMultipleEdit", "..."))
@@ -14,6 +14,7 @@ from statsmodels.stats.anova import anova_lm
 
 from .dialog_multiple_choice import DialogMultipleChoice
 from .models import DependentNameStatus
+from ..process import load_metrics_table
 from ..ui import UIFormANOVA
 
 
@@ -64,9 +65,9 @@ class FormANOVA(QWidget, UIFormANOVA):
     def _init_open_csv(self):
         def _open():
             filename, _ = QFileDialog.getOpenFileName(
-                self, '加载数据', filter='*.csv', initialFilter='*.csv')
+                self, '加载数据', filter='*.csv *.sqlite3', initialFilter='*.csv *.sqlite3')
             if filename:
-                df = pd.read_csv(filename)
+                df = load_metrics_table(filename)
 
                 n = len(df)
                 names = [name for name in df.columns]
@@ -12,6 +12,7 @@ from PyQt5 import QtGui
 from PyQt5.Qt import QPointF, QRectF, Qt, pyqtSignal, QWidget, QFileDialog, QStandardItemModel, QStandardItem, \
     QMessageBox
 
+from ..process import load_metrics_table
 from ..ui import UIFormBoxplot
 
 
@@ -165,13 +166,13 @@ class FormBoxplot(QWidget, UIFormBoxplot):
     def _init_button_open(self):
         def _open():
             filename, _ = QFileDialog.getOpenFileName(
-                self, '数据加载', filter='*.csv', initialFilter='*.csv')
+                self, '数据加载', filter='*.csv *.sqlite3', initialFilter='*.csv *.sqlite3')
             if filename:
                 with self.__lock:
                     self.button_open.setEnabled(False)
                     self.button_display.setEnabled(False)
 
-                    df = pd.read_csv(filename)
+                    df = load_metrics_table(filename)
 
                     n = len(df)
                     names = [name for name in df.columns]
@@ -71,11 +71,12 @@ class FormLogProcess(QWidget, UIFormLogProcess):
             after_loop = pyqtSignal(int, int, QStandardItemModel)
             deinit = pyqtSignal(int)
 
-            def __init__(self, parent, directory: str, total_count: int, model: QStandardItemModel):
+            def __init__(self, parent, directory: str, total_count: int, model: QStandardItemModel, csv: bool):
                 QThread.__init__(self, parent)
                 self.directory = directory
                 self.total_count = total_count
                 self.model = model
+                self.csv = csv
 
             def run(self) -> None:
                 self.init.emit(self.total_count, self.model)
@@ -84,7 +85,7 @@ class FormLogProcess(QWidget, UIFormLogProcess):
 
                     relpath = self.model.item(i, 0).text()
                     path = os.path.join(self.directory, relpath)
-                    log_process(path, force=True)
+                    log_process(path, csv=self.csv)
 
                     self.after_loop.emit(i, self.total_count, self.model)
 
@@ -93,6 +94,7 @@ class FormLogProcess(QWidget, UIFormLogProcess):
         def _init(total_count, model):
             self.button_open.setEnabled(False)
             self.button_start.setEnabled(False)
+            self.check_csv.setEnabled(False)
             self.table_processing.setSortingEnabled(False)
 
             for i in range(total_count):
@@ -122,6 +124,7 @@ class FormLogProcess(QWidget, UIFormLogProcess):
             self.label_status.setText('已完成')
             self.button_open.setEnabled(True)
             self.button_start.setEnabled(True)
+            self.check_csv.setEnabled(True)
             self.table_processing.setSortingEnabled(True)
             QMessageBox.information(self, '日志数据处理', '处理完毕！')
 
@@ -130,7 +133,7 @@ class FormLogProcess(QWidget, UIFormLogProcess):
             total_count = self.table_processing.property('total_count')
             model = self.table_processing.model()
 
-            thread = _ProcessThread(self, directory, total_count, model)
+            thread = _ProcessThread(self, directory, total_count, model, self.check_csv.isChecked())
             thread.init.connect(_init)
             thread.before_loop.connect(_before_loop)
             thread.after_loop.connect(_after_loop)
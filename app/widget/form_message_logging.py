@@ -8,7 +8,7 @@ from PyQt5.Qt import QWidget, Qt, QFileDialog, QStandardItemModel, QStandardItem
 from hbutils.color import Color, rnd_colors
 
 from .models import MessageType
-from ..process import msgdata_trans
+from ..process import msgdata_trans, msgdata_index
 from ..ui import UIFormMessageLogging
 
 
@@ -45,12 +45,10 @@ class FormMessageLogging(QWidget, UIFormMessageLogging):
             )
             if filename:
                 with self.__lock:
-                    df = msgdata_trans(filename)
-                    rows = len(df)
-
-                    receivers = set(df['receive_id'])
-                    senders = set(df['send_id'])
-                    participants = sorted(receivers | senders)
+                    # the time range, participants and count of messages are kept in the sidecar index,
+                    # the messages themselves are decoded for the chosen time window when logging
+                    index = msgdata_index(filename)
+                    time_range, rows, participants = index.time_range, index.rows, index.ids.tolist()
 
                     model = QStandardItemModel(0, 1)
                     model.setHorizontalHeaderLabels(["参与者列表"])
@@ -64,11 +62,11 @@ class FormMessageLogging(QWidget, UIFormMessageLogging):
 
                     self.list_items.setModel(model)
 
-                    data_okay = (rows > 0) and (len(participants) > 0)
+                    data_okay = (rows > 0) and (len(participants) > 0) and time_range is not None
                     self.button_logging.setEnabled(data_okay)
                     if data_okay:
-                        max_time = math.ceil(max(df['time']))
-                        min_time = math.floor(min(df['time']))
+                        max_time = math.ceil(time_range[1])
+                        min_time = math.floor(time_range[0])
 
                         self.slider_start_time.setEnabled(True)
                         self.slider_start_time.setMinimum(min_time)
@@ -99,7 +97,7 @@ class FormMessageLogging(QWidget, UIFormMessageLogging):
                         self.edit_end_time.setEnabled(False)
                         self.edit_end_time.setText('')
 
-                    self.setProperty('data', df)
+                    self.setProperty('filename', filename)
                     QMessageBox.information(self, '打开消息日志文件',
                                             f'加载完毕!\n'
                                             f'已检测并加载{rows}条消息，包含{len(participants)}个参与实体。')
@@ -214,9 +212,8 @@ class FormMessageLogging(QWidget, UIFormMessageLogging):
             pid_set = set(pids)
             start_time, end_time = _get_start_and_end()
 
-            df: pd.DataFrame = self.property('data')
-            dfc = df[(df['time'] >= start_time) & (df['time'] <= end_time)
-                     & (df['send_id'].isin(pid_set)) & (df['receive_id'].isin(pid_set))]
+            filename: str = self.property('filename')
+            dfc = msgdata_trans(filename, t_start=start_time, t_end=end_time, participants=pid_set)
             self.table_messages.setProperty('data', dfc)
 
             model = QStandardItemModel(0, 4)
@@ -1,5 +1,7 @@
 import csv
 import os
+import sqlite3
+import time
 from types import MethodType
 from typing import List
 
@@ -7,7 +9,8 @@ from PyQt5.Qt import QWidget, Qt, QStandardItemModel, QFileDialog, QStandardItem
     QListWidgetItem, QListWidget, QColor
 
 from .models import ProcessingStatus
-from ..process import _ALL_NAME_LIST, walk_log_directories, get_all_metrics, _ALL_METRICS_LIST
+from ..process import _ALL_NAME_LIST, walk_log_directories, get_all_metrics, _ALL_METRICS_LIST, \
+    catalog_file_in_directory, open_catalog, record_run
 from ..ui import UIFormMetrics
 
 
@@ -115,13 +118,30 @@ class FormMetrics(QWidget, UIFormMetrics):
 
             def run(self) -> None:
                 self.init.emit(self.total_count, self.model)
-                for i in range(self.total_count):
-                    self.before_loop.emit(i, self.total_count, self.model)
-
-                    relpath = self.model.item(i, 0).text()
-                    result = get_all_metrics(os.path.join(self.directory, relpath), shown_names=self.metrics)
+                try:
+                    catalog = open_catalog(catalog_file_in_directory(self.directory))
+                except (sqlite3.Error, OSError):  # e.g. read-only campaign directory, the metrics are still shown
+                    catalog = None
 
-                    self.after_loop.emit(i, self.total_count, self.model, result)
+                try:
+                    for i in range(self.total_count):
+                        self.before_loop.emit(i, self.total_count, self.model)
+
+                        relpath = self.model.item(i, 0).text()
+                        path = os.path.join(self.directory, relpath)
+                        start_time = time.time()
+                        result = get_all_metrics(path, shown_names=self.metrics)
+                        if catalog is not None:
+                            try:
+                                record_run(catalog, self.directory, path, result, time.time() - start_time)
+                            except (sqlite3.Error, OSError):
+                                catalog.close()
+                                catalog = None
+
+                        self.after_loop.emit(i, self.total_count, self.model, result)
+                finally:
+                    if catalog is not None:
+                        catalog.close()
 
                 self.deinit.emit(self.total_count)
 
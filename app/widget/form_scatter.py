@@ -1,11 +1,11 @@
 from threading import Lock
 
-import pandas as pd
 import pyqtgraph as pg
 import pyqtgraph.exporters
 from PyQt5.Qt import QWidget, Qt, QFileDialog, QStandardItemModel, QStandardItem, QMessageBox, QModelIndex, \
     QHeaderView
 
+from ..process import load_metrics_table
 from ..ui import UIFormScatter
 
 
@@ -38,13 +38,13 @@ class FormScatter(QWidget, UIFormScatter):
     def _init_button_open(self):
         def _open():
             filename, _ = QFileDialog.getOpenFileName(
-                self, '加载数据', filter='*.csv', initialFilter='*.csv')
+                self, '加载数据', filter='*.csv *.sqlite3', initialFilter='*.csv *.sqlite3')
             if filename:
                 with self.__lock:
                     self.button_open.setEnabled(False)
                     self.button_display.setEnabled(False)
 
-                    df = pd.read_csv(filename)
+                    df = load_metrics_table(filename)
 
                     n = len(df)
                     names = [name for name in df.columns]
@@ -4,7 +4,6 @@ from threading import Lock
 from types import MethodType
 
 import pandas
-import pandas as pd
 import scipy.stats
 from PyQt5.Qt import QWidget, Qt, QFileDialog, QStandardItemModel, QStandardItem, QMessageBox, QHeaderView, \
     QModelIndex, QTableView, QThread, pyqtSignal, QBrush, QColor
@@ -12,6 +11,7 @@ from hbutils.color import Color
 from hbutils.reflection import nested_for
 
 from .models import NameStatus
+from ..process import load_metrics_table
 from ..ui import UIFormSpearmanr
 
 
@@ -68,9 +68,9 @@ class FormSpearmanr(QWidget, UIFormSpearmanr):
     def _init_open_csv(self):
         def _open():
             filename, _ = QFileDialog.getOpenFileName(
-                self, '加载数据', filter='*.csv', initialFilter='*.csv')
+                self, '加载数据', filter='*.csv *.sqlite3', initialFilter='*.csv *.sqlite3')
             if filename:
-                df = pd.read_csv(filename)
+                df = load_metrics_table(filename)
 
                 n = len(df)
                 names = [name for name in df.columns]
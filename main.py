@@ -1,4 +1,7 @@
+from multiprocessing import freeze_support
+
 from app import run_app
 
 if __name__ == '__main__':
+    freeze_support()
     run_app()
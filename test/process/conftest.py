@@ -0,0 +1,11 @@
+import pytest
+
+from .dat import make_log_directory
+
+
+@pytest.fixture()
+def log_directory(tmp_path, request):
+    # the keyword arguments of make_log_directory can be given with an indirect parametrization
+    directory = str(tmp_path / 'run')
+    make_log_directory(directory, **getattr(request, 'param', {}))
+    return directory
@@ -0,0 +1,79 @@
+import os
+import random
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.process.chunk import compact_frame
+from app.proto import MpsProtoAircraft, MpsProtoData, MpsReceiveMsg, MpsHead
+
+
+def varint(value: int) -> bytes:
+    result = bytearray()
+    while value >= 0x80:
+        result.append((value & 0x7f) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def frame(type_: int, payload: bytes) -> bytes:
+    return bytes([type_]) + varint(len(payload)) + payload
+
+
+def make_log_directory(directory: str, frames: int = 50, size: int = 20, seed: int = 0):
+    rnd = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+
+    simudata, expdata, msgdata, outformation = bytearray(), bytearray(), bytearray(), []
+    expdata += frame(1, MpsHead(simunum=1, swarmsize=size, timestep=0.1, time=frames / 10).SerializeToString())
+    alive = size
+    for k in range(1, frames + 1):
+        time_ = round(k * 0.1, 2)
+        lng, lat = 13.15 + k * 1e-4, 43.66 + k * 1e-4
+        for id_ in range(1, alive + 1):
+            mpa = MpsProtoAircraft(roll=rnd.uniform(-5, 5), pitch=rnd.uniform(-5, 5),
+                                   yaw=rnd.uniform(0, 360), speed=rnd.uniform(100, 200))
+            mpa.head.time, mpa.head.id, mpa.head.type = time_, id_, 7030101
+            mpa.head.lng = lng + rnd.uniform(-1e-3, 1e-3)
+            mpa.head.lat = lat + rnd.uniform(-1e-3, 1e-3)
+            mpa.head.h = 2000 + rnd.uniform(-50, 50)
+            simudata += frame(2, mpa.SerializeToString())
+        if k % 7 == 0:
+            mpa = MpsProtoAircraft()
+            mpa.head.time, mpa.head.id, mpa.head.type = time_, 9999, 7030102
+            simudata += frame(2, mpa.SerializeToString())
+
+        for id_ in (20000, 20001, 5):
+            mpd = MpsProtoData(time=time_, id=id_, type=3, lng=lng, lat=lat, h=2000.0)
+            expdata += frame(2, mpd.SerializeToString())
+
+        for id_ in range(1, size + 1, 3):
+            msg = MpsReceiveMsg(time=time_, receiveID=id_)
+            for _ in range(rnd.randint(0, 3)):
+                info = msg.msginfo.add()
+                info.sendID, info.msgtype = rnd.randint(1, size), rnd.randint(0, 2)
+            msgdata += frame(3, msg.SerializeToString())
+
+        if k == frames // 2:
+            alive = size - 1
+        outformation.append(f'time:{time_} outFormation:{rnd.randint(0, 2) if k > 10 else 5} totalsize:{alive}')
+
+    with open(os.path.join(directory, 'simudata_1.dat'), 'wb') as f:
+        f.write(simudata)
+    with open(os.path.join(directory, 'expdata_1.dat'), 'wb') as f:
+        f.write(expdata)
+    with open(os.path.join(directory, 'msgData_1.dat'), 'wb') as f:
+        f.write(msgdata)
+    with open(os.path.join(directory, 'outformation_1.txt'), 'w') as f:
+        f.write('\n'.join(outformation) + '\n')
+    with open(os.path.join(directory, 'input.csv'), 'w') as f:
+        f.write('20,1,0.5,2,0.8,0.1,3,3,2,1,1,2,3,6,2,1,1,2,3\n')
+
+
+def read_exported_csv(src_file: str, dtypes: Mapping[str, np.dtype],
+                      compact_dtypes: Optional[Mapping[str, object]] = None) -> pd.DataFrame:
+    # a csv file of log_process, with the decoded dtypes and its index
+    df = pd.read_csv(src_file, index_col=0, dtype=dtypes).rename_axis(None)
+    return compact_frame(df, compact_dtypes) if compact_dtypes is not None else df
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from app.process.catalog import catalog_file_in_directory, open_catalog, record_run, load_catalog, \
+    load_metrics_table
+from app.process.input import _INPUT_NAMES_AND_TYPES
+from app.process.metrics import get_all_metrics, _ALL_NAME_LIST
+from .dat import make_log_directory
+
+
+@pytest.fixture()
+def campaign(tmp_path):
+    root = str(tmp_path)
+    make_log_directory(os.path.join(root, 'a', 'run'), seed=0)
+    make_log_directory(os.path.join(root, 'b'), seed=1)
+    with open(os.path.join(root, 'b', 'input.csv'), 'w') as f:
+        f.write('20,1,0.5,2,0.3,0.1,3,3,2,1,1,2,3,6,2,1,1,2,3\n')
+    return root
+
+
+@pytest.mark.unittest
+class TestProcessCatalog:
+    def test_record_run(self, campaign):
+        catalog_file = catalog_file_in_directory(campaign)
+        metrics = {}
+        conn = open_catalog(catalog_file)
+        try:
+            for relpath in ('b', os.path.join('a', 'run')):
+                directory = os.path.join(campaign, relpath)
+                metrics[relpath] = get_all_metrics(directory)
+                record_run(conn, campaign, directory, metrics[relpath], elapsed=1.5)
+        finally:
+            conn.close()
+
+        df = load_catalog(catalog_file)
+        assert list(df.columns) == ['Path', *_ALL_NAME_LIST]
+        assert df['Path'].tolist() == [os.path.join('a', 'run'), 'b']
+        for _, row in df.iterrows():
+            expected = metrics[row['Path']]
+            for name in _ALL_NAME_LIST:
+                assert row[name] == pytest.approx(expected[name], nan_ok=True)
+
+        df = load_catalog(catalog_file, '"perception" >= ?', [0.5])
+        assert df['Path'].tolist() == [os.path.join('a', 'run')]
+
+    def test_update(self, campaign):
+        catalog_file = catalog_file_in_directory(campaign)
+        directory = os.path.join(campaign, 'b')
+        conn = open_catalog(catalog_file)
+        try:
+            record_run(conn, campaign, directory, get_all_metrics(directory, shown_names=['density']))
+            record_run(conn, campaign, directory,
+                       get_all_metrics(directory, shown_names=['loc_offset', 'polarization']))
+        finally:
+            conn.close()
+
+        df = load_catalog(catalog_file)
+        assert len(df) == 1
+        assert df['density'][0] == pytest.approx(get_all_metrics(directory)['density'])
+        assert df['polarization'][0] == pytest.approx(get_all_metrics(directory)['polarization'])
+        assert df['stable_time'].isnull().all()
+
+    def test_update_changed_logs(self, campaign):
+        catalog_file = catalog_file_in_directory(campaign)
+        directory = os.path.join(campaign, 'b')
+        conn = open_catalog(catalog_file)
+        try:
+            record_run(conn, campaign, directory, get_all_metrics(directory, shown_names=['density']))
+            make_log_directory(directory, frames=40, seed=2)
+            record_run(conn, campaign, directory, get_all_metrics(directory, shown_names=['polarization']))
+        finally:
+            conn.close()
+
+        df = load_catalog(catalog_file)
+        assert len(df) == 1
+        assert df['density'].isnull().all()
+        assert df['polarization'][0] == pytest.approx(get_all_metrics(directory)['polarization'])
+
+    def test_open_catalog(self, campaign):
+        catalog_file = catalog_file_in_directory(campaign)
+        with closing(sqlite3.connect(catalog_file)) as conn:  # catalog of an older version
+            conn.execute('CREATE TABLE runs (path TEXT PRIMARY KEY, "density" REAL)')
+            conn.execute('INSERT INTO runs (path, "density") VALUES (?, ?)', ['b', 1.0])
+            conn.commit()
+
+        conn = open_catalog(catalog_file)
+        try:
+            columns = [row[1] for row in conn.execute('PRAGMA table_info(runs)')]
+            indexes = [row[0] for row in conn.execute("SELECT sql FROM sqlite_master WHERE type = 'index' "
+                                                      "AND tbl_name = 'runs' AND name LIKE 'runs_input_%'")]
+        finally:
+            conn.close()
+        assert set(columns) >= {'path', 'updated_at', *_ALL_NAME_LIST}
+        assert len(indexes) == len(_INPUT_NAMES_AND_TYPES)
+        assert load_catalog(catalog_file)['density'].tolist() == [1.0]
+
+    def test_load_metrics_table(self, campaign):
+        catalog_file = catalog_file_in_directory(campaign)
+        directory = os.path.join(campaign, 'b')
+        conn = open_catalog(catalog_file)
+        try:
+            record_run(conn, campaign, directory, get_all_metrics(directory))
+        finally:
+            conn.close()
+
+        csv_file = os.path.join(campaign, 'metrics.csv')
+        load_catalog(catalog_file).to_csv(csv_file, index=False)
+        assert list(load_metrics_table(csv_file).columns) == list(load_metrics_table(catalog_file).columns)
+        assert load_metrics_table(csv_file)['Path'].tolist() == ['b']
@@ -0,0 +1,193 @@
+import gzip
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.process.chunk import compact_frame
+from app.process.exp_center import exp_center_trans, iter_exp_center, EXP_CENTER_DTYPES, EXP_CENTER_COMPACT_DTYPES
+from app.process.log import log_trans, log_process, _center_means, _join_centers
+from app.process.msgdata import msgdata_trans, iter_msgdata, msgdata_senders
+from app.process.simudata import simudata_trans, iter_simudata, SIMUDATA_DTYPES, SIMUDATA_COMPACT_DTYPES
+from .dat import read_exported_csv
+
+_DAT_FILES = ['simudata_1.dat', 'expdata_1.dat', 'msgData_1.dat']
+
+
+@pytest.mark.unittest
+class TestProcessDecode:
+    def test_trans(self, log_directory):
+        simudata = simudata_trans(os.path.join(log_directory, 'simudata_1.dat'))
+        assert len(simudata) == 975
+        assert set(simudata['id']) == set(range(1, 21))
+        assert (simudata['type'] != 7030102).all()
+
+        exp_center = exp_center_trans(os.path.join(log_directory, 'expdata_1.dat'))
+        assert len(exp_center) == 50
+        assert (exp_center['id'] == 20000).all()
+
+        msgdata = msgdata_trans(os.path.join(log_directory, 'msgData_1.dat'))
+        assert list(msgdata.columns) == ['time', 'receive_id', 'send_id', 'type']
+        assert set(msgdata['receive_id']) <= set(range(1, 21, 3))
+
+    def test_trans_filter(self, log_directory):
+        src_file = os.path.join(log_directory, 'expdata_1.dat')
+        assert set(exp_center_trans(src_file, ids=None)['id']) == {5, 20000, 20001}
+        assert set(exp_center_trans(src_file, ids=[5, 20001])['id']) == {5, 20001}
+        assert len(exp_center_trans(src_file, types=[4])) == 0
+
+        src_file = os.path.join(log_directory, 'simudata_1.dat')
+        assert set(simudata_trans(src_file, exclude_types=None)['id']) == {*range(1, 21), 9999}
+        assert set(simudata_trans(src_file, ids=[3, 4, 9999])['id']) == {3, 4}
+
+    def test_trans_window(self, log_directory):
+        src_file = os.path.join(log_directory, 'msgData_1.dat')
+        full = msgdata_trans(src_file)
+        window = msgdata_trans(src_file, t_start=1.0, t_end=2.5, participants={1, 4, 7, 8, 9, 10})
+        expected = full[(full['time'] >= 1.0) & (full['time'] <= 2.5) &
+                        full['send_id'].isin({1, 4, 7, 8, 9, 10}) & full['receive_id'].isin({1, 4, 7, 8, 9, 10})]
+        assert len(window) > 0
+        pd.testing.assert_frame_equal(window.reset_index(drop=True), expected.reset_index(drop=True))
+        assert len(msgdata_trans(src_file, t_start=100.0)) == 0
+        assert msgdata_senders(src_file).tolist() == full['send_id'].tolist()
+
+        src_file = os.path.join(log_directory, 'simudata_1.dat')
+        full = simudata_trans(src_file)
+        window = simudata_trans(src_file, t_start=3.0, t_end=3.2, ids=[1, 2])
+        expected = full[(full['time'] >= 3.0) & (full['time'] <= 3.2) & full['id'].isin([1, 2])]
+        pd.testing.assert_frame_equal(window.reset_index(drop=True), expected.reset_index(drop=True))
+
+    @pytest.mark.parametrize('chunk_rows', [1, 7, 100])
+    def test_iter(self, log_directory, chunk_rows):
+        for iter_func, trans_func, filename in [
+            (iter_simudata, simudata_trans, 'simudata_1.dat'),
+            (iter_exp_center, exp_center_trans, 'expdata_1.dat'),
+            (iter_msgdata, msgdata_trans, 'msgData_1.dat'),
+        ]:
+            src_file = os.path.join(log_directory, filename)
+            chunks = list(iter_func(src_file, chunk_rows=chunk_rows))
+            assert all(len(chunk) > 0 for chunk in chunks)
+            pd.testing.assert_frame_equal(pd.concat(chunks), trans_func(src_file, compact=False))
+
+    def test_workers(self, log_directory):
+        for iter_func, trans_func, filename in [
+            (iter_simudata, simudata_trans, 'simudata_1.dat'),
+            (iter_exp_center, exp_center_trans, 'expdata_1.dat'),
+            (iter_msgdata, msgdata_trans, 'msgData_1.dat'),
+        ]:
+            src_file = os.path.join(log_directory, filename)
+            pd.testing.assert_frame_equal(
+                pd.concat(iter_func(src_file, chunk_rows=40, workers=2)),
+                trans_func(src_file, compact=False),
+            )
+
+    def test_projection(self, log_directory):
+        src_file = os.path.join(log_directory, 'simudata_1.dat')
+        simudata = simudata_trans(src_file)
+        projected = simudata_trans(src_file, projection='web_mercator', workers=2)
+        pd.testing.assert_frame_equal(projected.drop(columns=['x', 'y']), simudata.drop(columns=['x', 'y']))
+        assert projected['x'].values == pytest.approx(simudata['x'].values, abs=1e-6)
+        assert projected['y'].values == pytest.approx(simudata['y'].values, abs=1e-6)
+        with pytest.raises(KeyError):
+            simudata_trans(src_file, projection='epsg:900913')
+
+    def test_dtypes(self, log_directory):
+        simudata = simudata_trans(os.path.join(log_directory, 'simudata_1.dat'), compact=False)
+        assert dict(simudata.dtypes) == {name: np.dtype(dtype) for name, dtype in SIMUDATA_DTYPES.items()}
+        empty_file = os.path.join(log_directory, 'simudata_2.dat')
+        open(empty_file, 'wb').close()
+        empty = simudata_trans(empty_file, compact=False)
+        assert len(empty) == 0
+        assert dict(empty.dtypes) == dict(simudata.dtypes)
+
+    def test_compact_dtypes(self, log_directory):
+        full = simudata_trans(os.path.join(log_directory, 'simudata_1.dat'), compact=False)
+        simudata = simudata_trans(os.path.join(log_directory, 'simudata_1.dat'))
+        assert simudata['id'].dtype == np.uint16
+        assert isinstance(simudata['type'].dtype, pd.CategoricalDtype)
+        assert simudata['height'].dtype == np.float32
+        assert simudata.memory_usage().sum() < full.memory_usage().sum()
+        pd.testing.assert_frame_equal(simudata.astype(SIMUDATA_DTYPES), full)
+
+        msgdata = msgdata_trans(os.path.join(log_directory, 'msgData_1.dat'))
+        assert dict(msgdata.dtypes) == {'time': np.float64, 'receive_id': np.uint16,
+                                        'send_id': np.uint16, 'type': np.uint8}
+
+        # the ids which do not fit are not narrowed
+        exp_center = exp_center_trans(os.path.join(log_directory, 'expdata_1.dat'), ids=None)
+        assert exp_center['id'].dtype == np.uint16
+        assert compact_frame(exp_center.astype({'id': np.uint32}).assign(id=lambda df: df['id'] * 4),
+                             EXP_CENTER_COMPACT_DTYPES)['id'].dtype == np.uint32
+
+        empty_file = os.path.join(log_directory, 'simudata_2.dat')
+        open(empty_file, 'wb').close()
+        assert dict(simudata_trans(empty_file).dtypes.astype(str)) == dict(simudata.dtypes.astype(str))
+
+    def test_log_process(self, log_directory):
+        simudata, exp_center = log_trans(log_directory)
+        assert (exp_center['r_x'] != -1).all()
+        first = simudata[simudata['time'] == exp_center['time'][0]]
+        assert exp_center['r_x'][0] == pytest.approx(first['x'].mean())
+        assert exp_center['r_h'][0] == pytest.approx(first['height'].mean())
+        for i in range(len(exp_center)):  # exactly the original centroids
+            frame = simudata[simudata['time'] == exp_center['time'][i]]
+            assert exp_center['r_x'][i] == np.mean(np.asarray(frame['x'].tolist()))
+            assert exp_center['r_y'][i] == np.mean(np.asarray(frame['y'].tolist()))
+            assert exp_center['r_h'][i] == np.mean(np.asarray(frame['height'].tolist()))
+
+        log_process(log_directory, csv=True)
+        simudata_file = os.path.join(log_directory, 'simudata.csv')
+        exp_center_file = os.path.join(log_directory, 'exp_center.csv')
+        pd.testing.assert_frame_equal(
+            read_exported_csv(simudata_file, SIMUDATA_DTYPES, SIMUDATA_COMPACT_DTYPES), simudata)
+        pd.testing.assert_frame_equal(
+            read_exported_csv(exp_center_file, EXP_CENTER_DTYPES, EXP_CENTER_COMPACT_DTYPES), exp_center)
+        pd.testing.assert_frame_equal(
+            read_exported_csv(simudata_file, SIMUDATA_DTYPES), log_trans(log_directory, compact=False)[0])
+        # as float64, like the tools which do not know the dtypes
+        exported = pd.read_csv(os.path.join(log_directory, 'simudata.csv'), float_precision='round_trip')
+        assert exported['height'].tolist() == simudata['height'].astype(np.float64).tolist()
+
+    def test_center_join(self):
+        simudata = pd.DataFrame({
+            'time': [0.1 + 0.2, 0.3, 0.3, 0.4],
+            'x': [1.0, 2.0, 6.0, 5.0],
+            'y': [0.0, 3.0, 3.0, 1.0],
+            'height': np.array([100, 200, 300, 400], dtype=np.float32),
+        })
+        exp_center = _join_centers(pd.DataFrame({'time': [0.3, 0.4, 0.5]}), _center_means(simudata))
+        assert exp_center['r_x'].tolist() == [3.0, 5.0, -1]
+        assert exp_center['r_y'].tolist() == [2.0, 1.0, -1]
+        assert exp_center['r_h'].tolist() == [200.0, 400.0, -1]
+
+    @pytest.mark.parametrize('workers', [None, 2])
+    def test_compressed(self, log_directory, tmp_path, workers):
+        packed = str(tmp_path / 'packed')
+        shutil.copytree(log_directory, packed)
+        for filename in _DAT_FILES:
+            with open(os.path.join(packed, filename), 'rb') as f:
+                data = f.read()
+            with gzip.open(os.path.join(packed, f'{filename}.gz'), 'wb') as f:
+                f.write(data)
+            os.remove(os.path.join(packed, filename))
+
+        for iter_func, trans_func, filename in [
+            (iter_simudata, simudata_trans, 'simudata_1.dat'),
+            (iter_exp_center, exp_center_trans, 'expdata_1.dat'),
+            (iter_msgdata, msgdata_trans, 'msgData_1.dat'),
+        ]:
+            pd.testing.assert_frame_equal(
+                pd.concat(iter_func(os.path.join(packed, f'{filename}.gz'), chunk_rows=40, workers=workers)),
+                trans_func(os.path.join(log_directory, filename), compact=False),
+            )
+
+        src_file = os.path.join(packed, 'msgData_1.dat.gz')
+        pd.testing.assert_frame_equal(
+            msgdata_trans(src_file, t_start=1.0, t_end=2.5, participants={1, 4, 7}),
+            msgdata_trans(os.path.join(log_directory, 'msgData_1.dat'), t_start=1.0, t_end=2.5, participants={1, 4, 7}),
+        )
+
+        for expected, actual in zip(log_trans(log_directory), log_trans(packed)):
+            pd.testing.assert_frame_equal(actual, expected)
@@ -0,0 +1,114 @@
+import math
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from app.process.chunk import concat_chunks
+from app.process.exp_center import exp_center_cache_file_in_directory, EXP_CENTER_DTYPES, EXP_CENTER_COMPACT_DTYPES
+from app.process.follow import LogFollower
+from app.process.log import log_trans, load_log, log_process_manifest_file_in_directory, _log_sources, \
+    _LOG_PROCESS_VERSION
+from app.process.input import get_input_values_from_directory
+from app.process.manifest import is_up_to_date
+from app.process.metrics import compute_metrics, _ALL_NAME_LIST
+from app.process.outformation import load_outformation_in_directory
+from app.process.simudata import follow_simudata, simudata_trans, simudata_cache_file_in_directory, \
+    SIMUDATA_DTYPES, SIMUDATA_COMPACT_DTYPES
+from .dat import make_log_directory, read_exported_csv
+
+_LOG_FILES = ['simudata_1.dat', 'expdata_1.dat', 'msgData_1.dat', 'outformation_1.txt']
+
+
+@pytest.fixture()
+def log_directories(tmp_path):
+    src, dst = str(tmp_path / 'src'), str(tmp_path / 'dst')
+    make_log_directory(src)
+    os.makedirs(dst)
+    shutil.copy(os.path.join(src, 'input.csv'), dst)
+    for name in _LOG_FILES:
+        open(os.path.join(dst, name), 'wb').close()
+    return src, dst
+
+
+def _write_parts(src, dst, parts):
+    contents = {}
+    for name in _LOG_FILES:
+        with open(os.path.join(src, name), 'rb') as f:
+            contents[name] = f.read()
+
+    for i in range(1, parts + 1):
+        for name, content in contents.items():
+            with open(os.path.join(dst, name), 'wb') as f:
+                f.write(content[:len(content) * i // parts])  # cut in the middle of frames and lines
+        yield i
+
+
+@pytest.mark.unittest
+class TestProcessFollow:
+    def test_follow_simudata(self, log_directories):
+        src, dst = log_directories
+        follower = follow_simudata(os.path.join(dst, 'simudata_1.dat'))
+        chunks = [follower.poll() for _ in _write_parts(src, dst, 7)]
+        assert len(follower.poll()) == 0
+
+        expected = simudata_trans(os.path.join(src, 'simudata_1.dat'), compact=False)
+        pd.testing.assert_frame_equal(concat_chunks(chunks, SIMUDATA_DTYPES), expected)
+
+        with open(os.path.join(dst, 'simudata_1.dat'), 'wb'):
+            pass
+        with pytest.raises(ValueError):
+            follower.poll()
+
+    def test_log_follower(self, log_directories):
+        src, dst = log_directories
+        follower = LogFollower(dst)
+        for _ in _write_parts(src, dst, 5):
+            follower.poll()
+        follower.poll(final=True)
+
+        simudata, exp_center = log_trans(src)
+        pd.testing.assert_frame_equal(follower.simudata, simudata)
+        pd.testing.assert_frame_equal(follower.exp_center, exp_center)
+        pd.testing.assert_frame_equal(
+            read_exported_csv(os.path.join(dst, 'simudata.csv'), SIMUDATA_DTYPES, SIMUDATA_COMPACT_DTYPES), simudata)
+        pd.testing.assert_frame_equal(
+            read_exported_csv(os.path.join(dst, 'exp_center.csv'), EXP_CENTER_DTYPES, EXP_CENTER_COMPACT_DTYPES),
+            exp_center)
+
+        # the cache files of load_log are written by the final poll
+        assert is_up_to_date(log_process_manifest_file_in_directory(dst), _log_sources(dst),
+                             [simudata_cache_file_in_directory(dst), exp_center_cache_file_in_directory(dst)],
+                             _LOG_PROCESS_VERSION)
+        for actual, expected_ in zip(load_log(dst, persist=False), (simudata, exp_center)):
+            pd.testing.assert_frame_equal(actual, expected_)
+
+        expected = compute_metrics(get_input_values_from_directory(src), simudata, exp_center,
+                                   load_outformation_in_directory(src))
+        actual = follower.metrics()
+        assert actual.keys() == expected.keys()
+        for name, value in expected.items():
+            if isinstance(value, float) and math.isnan(value):
+                assert math.isnan(actual[name])
+            else:
+                assert actual[name] == value, name
+
+    def test_log_follower_partial(self, log_directories):
+        src, dst = log_directories
+        follower = LogFollower(dst, write_csv=False)
+        assert all(math.isnan(value) for name, value in follower.metrics(['density', 'center_gap']).items())
+
+        parts = _write_parts(src, dst, 2)
+        next(parts)
+        follower.poll()
+        assert not os.path.exists(os.path.join(dst, 'simudata.csv'))
+        assert 0 < len(follower.exp_center) < len(log_trans(src)[1])
+        assert (follower.exp_center['time'] < follower.simudata['time'].max()).all()
+        assert set(follower.metrics()) == set(_ALL_NAME_LIST)
+
+        next(parts)
+        follower.poll()  # the trajectory of the metrics is extended
+        names = ['density', 'center_gap']
+        assert follower.metrics(names) == \
+            compute_metrics({}, follower.simudata, follower.exp_center, follower.outformation_data, names)
@@ -0,0 +1,71 @@
+import gzip
+
+import numpy as np
+import pytest
+import zstandard
+
+from app.process.frame import index_frames, open_dat, iter_dat_blocks, is_compressed
+from .dat import frame as _frame
+
+
+@pytest.mark.unittest
+class TestProcessFrame:
+    def test_index_frames(self):
+        payloads = [b'a' * 5, b'', b'b' * 300, b'c' * 20000]
+        buf = b''.join(_frame(i + 1, p) for i, p in enumerate(payloads))
+        frames = index_frames(buf)
+
+        assert len(frames) == 4
+        assert frames.types.tolist() == [1, 2, 3, 4]
+        assert frames.lengths.tolist() == [5, 0, 300, 20000]
+        assert [buf[o:o + l] for o, l in zip(frames.offsets.tolist(), frames.lengths.tolist())] == payloads
+        assert frames.end == len(buf)
+
+    def test_index_frames_partial(self):
+        buf = _frame(1, b'abc') + _frame(2, b'defg')
+        for cut in range(len(buf) - 1, len(_frame(1, b'abc')) - 1, -1):
+            frames = index_frames(buf[:cut])
+            assert len(frames) == 1
+            assert frames.end == len(_frame(1, b'abc'))
+
+        assert len(index_frames(b'')) == 0
+        assert index_frames(b'').end == 0
+        assert len(index_frames(buf, start=frames.end)) == 1
+
+    def test_open_dat(self, tmp_path):
+        buf = _frame(1, b'abc') + _frame(2, b'defg')
+        file = tmp_path / 'simudata_1.dat'
+        file.write_bytes(buf)
+        with open_dat(str(file)) as con:
+            frames = index_frames(con)
+            assert [bytes(con[o:o + l]) for o, l in zip(frames.offsets.tolist(), frames.lengths.tolist())] == \
+                   [b'abc', b'defg']
+
+        empty = tmp_path / 'simudata_2.dat'
+        empty.write_bytes(b'')
+        with open_dat(str(empty)) as con:
+            assert len(index_frames(con)) == 0
+
+    @pytest.mark.parametrize('suffix, compress', [
+        ('.gz', gzip.compress),
+        ('.zst', lambda data: zstandard.ZstdCompressor().compress(data)),
+    ])
+    def test_iter_dat_blocks(self, tmp_path, suffix, compress):
+        buf = b''.join(_frame(i % 3, bytes([i]) * (i * 37 % 500)) for i in range(200))
+        plain, packed = tmp_path / 'simudata_1.dat', tmp_path / f'simudata_1.dat{suffix}'
+        plain.write_bytes(buf)
+        packed.write_bytes(compress(buf))
+        assert not is_compressed(str(plain))
+        assert is_compressed(str(packed))
+
+        expected = index_frames(buf)
+        blocks = list(iter_dat_blocks(str(packed), block_size=1000))
+        assert len(blocks) > 1
+        np.testing.assert_array_equal(np.concatenate([frames.offsets + base for _, frames, base in blocks]),
+                                      expected.offsets)
+        assert [bytes(con[o:o + l]) for con, frames, _ in blocks
+                for o, l in zip(frames.offsets.tolist(), frames.lengths.tolist())] == \
+               [buf[o:o + l] for o, l in zip(expected.offsets.tolist(), expected.lengths.tolist())]
+
+        with open_dat(str(packed)) as con:
+            assert bytes(con) == buf
@@ -0,0 +1,76 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from app.process.exp_center import expdata_index
+from app.process.frame import open_dat, index_frames
+from app.process.index import dat_index_file, load_dat_index
+from app.process.log import is_log_directory
+from app.process.msgdata import msgdata_index, msgdata_trans
+from app.process.simudata import simudata_index, find_simudata_in_directory
+from app.process.wire import wire_decoder
+from app.proto import MpsProtoData
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize('log_directory', [{'frames': 200}], indirect=True)
+class TestProcessIndex:
+    def test_sidecar(self, log_directory):
+        src_file = os.path.join(log_directory, 'simudata_1.dat')
+        index = simudata_index(src_file)
+        assert os.path.exists(dat_index_file(src_file))
+        assert find_simudata_in_directory(log_directory) == src_file
+        assert is_log_directory(log_directory)
+
+        assert len(index.block_offsets) == -(-(200 * 20 - 100 + 200 // 7) // index.block_frames)
+        assert index.block_offsets[0] == 0
+        assert index.end == os.path.getsize(src_file)
+        assert index.time_range == pytest.approx((0.1, 20.0))
+        assert np.all(np.diff(index.block_min_times) >= 0)
+
+        loaded = simudata_index(src_file)
+        assert np.array_equal(loaded.block_offsets, index.block_offsets)
+        assert np.array_equal(loaded.block_max_times, index.block_max_times)
+
+    def test_ids(self, log_directory):
+        src_file = os.path.join(log_directory, 'msgData_1.dat')
+        msgdata = msgdata_trans(src_file)
+        for index in [msgdata_index(src_file), msgdata_index(src_file)]:  # built, then loaded
+            assert index.ids.tolist() == sorted(set(msgdata['receive_id']) | set(msgdata['send_id']))
+            assert index.rows == len(msgdata)
+        assert simudata_index(os.path.join(log_directory, 'simudata_1.dat')).ids is None
+
+    def test_invalidate(self, log_directory):
+        src_file = os.path.join(log_directory, 'msgData_1.dat')
+        index = msgdata_index(src_file)
+        with open_dat(src_file) as con:
+            frames = index_frames(con)
+        with open(src_file, 'ab') as f:
+            f.write(open(src_file, 'rb').read()[:frames.offsets[3] + frames.lengths[3]])
+        os.utime(src_file, (time.time() + 10, time.time() + 10))
+        assert msgdata_index(src_file).end == index.end + frames.offsets[3] + frames.lengths[3]
+
+    def test_select(self, log_directory):
+        src_file = os.path.join(log_directory, 'expdata_1.dat')
+        assert expdata_index(src_file).time_range == pytest.approx((0.1, 20.0))
+
+        index = load_dat_index(src_file, MpsProtoData, 'time', skip_types=(1,), block_frames=16)
+        assert np.isnan(index.block_min_times).sum() == 0
+        assert index.select().tolist() == [[0, index.end]]
+        assert len(index.select(100.0, None)) == 0
+
+        selected = index.select(5.0, 6.0)
+        assert len(selected) == 1 and 0 < selected[0, 1] - selected[0, 0] < index.end
+        decoder = wire_decoder(MpsProtoData)
+        with open_dat(src_file) as con:
+            frames = index_frames(con)
+            frames = frames.take(frames.types != 1)
+            times = decoder.decode(con, frames.offsets, frames.lengths)['time']
+            start, stop = selected[0]
+            selected = index_frames(con[:stop], start=int(start))
+            assert selected.end == stop
+            selected_times = decoder.decode(con, selected.offsets, selected.lengths)['time']
+        expected = times[(times >= 5.0) & (times <= 6.0)]
+        assert np.array_equal(selected_times[(selected_times >= 5.0) & (selected_times <= 6.0)], expected)
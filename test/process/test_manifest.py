@@ -0,0 +1,116 @@
+import json
+import os
+
+import pytest
+
+import app.process.log
+import app.process.manifest
+import app.process.metrics
+from app.process.log import log_process, log_process_manifest_file_in_directory
+from app.process.metrics import get_all_metrics, _ALL_METRICS_LIST
+from app.process.simudata import simudata_process
+from .dat import frame
+
+
+@pytest.fixture()
+def hash_calls(monkeypatch):
+    calls = []
+    file_hash = app.process.manifest.file_hash
+
+    def _file_hash(src_file):
+        calls.append(os.path.basename(src_file))
+        return file_hash(src_file)
+
+    monkeypatch.setattr(app.process.manifest, 'file_hash', _file_hash)
+    return calls
+
+
+@pytest.mark.unittest
+class TestProcessManifest:
+    def test_log_process(self, log_directory, hash_calls):
+        assert log_process(log_directory)
+        assert sorted(hash_calls) == ['expdata_1.dat', 'simudata_1.dat']
+        with open(log_process_manifest_file_in_directory(log_directory)) as f:
+            assert set(json.load(f)['sources']) == {'expdata_1.dat', 'simudata_1.dat'}
+
+        hash_calls.clear()
+        assert not log_process(log_directory)
+        assert hash_calls == []
+        assert log_process(log_directory, force=True)
+
+        # touched, but not changed
+        src_file = os.path.join(log_directory, 'simudata_1.dat')
+        stat = os.stat(src_file)
+        os.utime(src_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        hash_calls.clear()
+        assert not log_process(log_directory)
+        assert hash_calls == ['simudata_1.dat']
+        hash_calls.clear()
+        assert not log_process(log_directory)
+        assert hash_calls == []
+
+        with open(src_file, 'r+b') as f:  # same size, different content
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 1]))
+        os.utime(src_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        assert log_process(log_directory)
+        assert not log_process(log_directory)
+
+        with open(os.path.join(log_directory, 'expdata_1.dat'), 'ab') as f:
+            f.write(frame(2, b''))
+        assert log_process(log_directory)
+
+    def test_log_process_outputs(self, log_directory, monkeypatch):
+        assert log_process(log_directory)
+        assert log_process(log_directory, csv=True)
+        assert not log_process(log_directory, csv=True)
+        assert not log_process(log_directory)
+
+        os.remove(os.path.join(log_directory, 'exp_center.npz'))
+        assert log_process(log_directory)
+
+        monkeypatch.setattr(app.process.log, '_LOG_PROCESS_VERSION', 'newer')
+        assert log_process(log_directory)
+        assert not log_process(log_directory)
+
+    def test_simudata_process(self, log_directory):
+        src_file = os.path.join(log_directory, 'simudata_1.dat')
+        dst_file = os.path.join(log_directory, 'simudata.csv')
+        assert simudata_process(src_file, dst_file)
+        assert not simudata_process(src_file, dst_file)
+        assert os.path.exists(os.path.join(log_directory, '.simudata.csv.manifest.json'))
+
+        with open(src_file, 'ab') as f:
+            f.write(frame(2, b''))
+        assert simudata_process(src_file, dst_file)
+
+    def test_metrics_cache(self, log_directory, monkeypatch):
+        calls = []
+        compute_metrics = app.process.metrics.compute_metrics
+
+        def _compute_metrics(*args):
+            calls.append(list(args[-1]))
+            return compute_metrics(*args)
+
+        monkeypatch.setattr(app.process.metrics, 'compute_metrics', _compute_metrics)
+        assert get_all_metrics(log_directory, shown_names=['density', 'loc_offset']).keys() == \
+               {'density', 'loc_offset'}
+        assert calls == [['density']]
+
+        expected = get_all_metrics(log_directory)
+        assert calls[1:] == [[name for name in _ALL_METRICS_LIST if name != 'density']]
+        assert get_all_metrics(log_directory) == expected
+        assert len(calls) == 2
+        assert get_all_metrics(log_directory, force=True) == expected
+        assert calls[2:] == [_ALL_METRICS_LIST]
+
+        monkeypatch.setitem(app.process.metrics._METRIC_VERSIONS, 'center_gap', 2)
+        assert get_all_metrics(log_directory) == expected
+        assert calls[3:] == [['center_gap']]
+
+        with open(os.path.join(log_directory, 'outformation_1.txt'), 'a') as f:
+            f.write('time:5.1 outFormation:0 totalsize:19\n')
+        assert get_all_metrics(log_directory)['formation_num'] != expected['formation_num']
+        assert calls[4:] == [_ALL_METRICS_LIST]
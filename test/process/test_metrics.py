@@ -0,0 +1,212 @@
+import math
+import os
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app.process.metrics
+from app.process.log import log_trans
+from app.process.metrics import get_density, get_center_gap, get_dispersion, get_polarization, compute_metrics
+from app.process.outformation import load_outformation
+from app.process.trans import ff, l2_distance
+from .dat import make_log_directory
+
+
+def _frame(simudata: pd.DataFrame, time_: float) -> pd.DataFrame:
+    tt = ff(time_)
+    return simudata[(simudata['time'] < tt + 0.001) & (simudata['time'] > tt - 0.001)].reset_index(drop=True)
+
+
+def _reference_density(simudata: pd.DataFrame, exp_data: pd.DataFrame) -> float:
+    density = 0
+    for i in range(exp_data.shape[0]):
+        center = [exp_data['r_x'][i], exp_data['r_y'][i], exp_data['r_h'][i]]
+        tmp_sim = _frame(simudata, exp_data['time'][i])
+        distances = sorted(l2_distance(center, [tmp_sim['x'][j], tmp_sim['y'][j], tmp_sim['height'][j]])
+                           for j in range(tmp_sim.shape[0]))
+        bias = int(len(distances) * 0.9)
+        density += 3 * bias / (4 * math.pi * (distances[bias - 1] ** 3))
+
+    return density / (exp_data.shape[0]) * (100 ** 3)
+
+
+def _reference_center_gap(simudata: pd.DataFrame, exp_data: pd.DataFrame) -> float:
+    center_avg_gap = 0
+    for i in range(exp_data.shape[0]):
+        tmp_sim = _frame(simudata, exp_data['time'][i])
+        obj = [0, 0, 0]
+        for j in range(tmp_sim.shape[0]):
+            obj[0] += tmp_sim['x'][j]
+            obj[1] += tmp_sim['y'][j]
+            obj[2] += tmp_sim['height'][j]
+        center = [obj[0] / tmp_sim.shape[0], obj[1] / tmp_sim.shape[0], obj[2] / tmp_sim.shape[0]]
+        distances = sorted(l2_distance(center, [tmp_sim['x'][j], tmp_sim['y'][j], tmp_sim['height'][j]])
+                           for j in range(tmp_sim.shape[0]))
+        distances = distances[0:int(len(distances) * 0.9)]
+        dist = 0
+        for d in distances:
+            dist += d
+        center_avg_gap += dist / len(distances)
+
+    return center_avg_gap / exp_data.shape[0]
+
+
+def _reference_formation_frames(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                                outformation_data: List[Tuple[float, int, int]], first_row: int = 0) -> List[int]:
+    rows = []
+    for i in range(first_row, exp_data.shape[0]):
+        current_time = exp_data['time'][i]
+        records = [item for item in outformation_data if abs(item[0] - current_time) < 1e-4]
+        if not records:
+            continue
+
+        _, outformation_num, cur_total_size = records[0]
+        if (cur_total_size - outformation_num) >= 0.95 * cur_total_size and _frame(simudata, current_time).shape[0] > 0:
+            rows.append(i)
+
+    return rows
+
+
+def _legacy_formation_frames(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                             outformation_data: List[Tuple[float, int, int]], first_row: int = 0) -> List[int]:
+    # the frames calculated by the original loops, whose reuse of ``j`` skipped some of them
+    rows, j = [], 0
+    for i in range(first_row, exp_data.shape[0]):
+        current_time = exp_data['time'][i]
+        while abs(outformation_data[j][0] - current_time) >= 1e-4 and outformation_data[j][0] <= current_time:
+            j += 1
+        if abs(outformation_data[j][0] - current_time) >= 1e-4:
+            continue
+
+        _, outformation_num, cur_total_size = outformation_data[j]
+        size = _frame(simudata, current_time).shape[0]
+        if (cur_total_size - outformation_num) >= 0.95 * cur_total_size and size > 0:
+            rows.append(i)
+            j = size - 1
+
+    return rows
+
+
+def _reference_dispersion(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                          outformation_data: List[Tuple[float, int, int]],
+                          formation_frames=_reference_formation_frames) -> float:
+    aim_list = []
+    for i in formation_frames(simudata, exp_data, outformation_data):
+        center = [exp_data['r_x'][i], exp_data['r_y'][i], exp_data['r_h'][i]]
+        tmp_sim = _frame(simudata, exp_data['time'][i])
+        distances = sorted(l2_distance(center, [tmp_sim['x'][j], tmp_sim['y'][j], tmp_sim['height'][j]])
+                           for j in range(tmp_sim.shape[0]))
+        distances = distances[0:int(0.9 * len(distances))]
+        aim_list.append(np.std(np.array(distances)) / np.mean(np.array(distances)))
+
+    return -1 if len(aim_list) == 0 else np.mean(np.array(aim_list))
+
+
+def _reference_polarization(simudata: pd.DataFrame, exp_data: pd.DataFrame,
+                            outformation_data: List[Tuple[float, int, int]],
+                            formation_frames=_reference_formation_frames) -> float:
+    aim_list = []
+    for i in formation_frames(simudata, exp_data, outformation_data, first_row=1):
+        tmp_sim, pre_tmp_sim = _frame(simudata, exp_data['time'][i]), _frame(simudata, exp_data['time'][i - 1])
+        center_dir = [exp_data['r_x'][i] - exp_data['r_x'][i - 1], exp_data['r_y'][i] - exp_data['r_y'][i - 1],
+                      exp_data['r_h'][i] - exp_data['r_h'][i - 1]]
+        ans = [0, 0, 0]
+        for j in range(tmp_sim.shape[0]):
+            for k in range(pre_tmp_sim.shape[0]):
+                if pre_tmp_sim['id'][k] == tmp_sim['id'][j]:
+                    ans[0] += (tmp_sim['x'][j] - pre_tmp_sim['x'][k]) - center_dir[0]
+                    ans[1] += (tmp_sim['y'][j] - pre_tmp_sim['y'][k]) - center_dir[1]
+                    ans[2] += (tmp_sim['height'][j] - pre_tmp_sim['height'][k]) - center_dir[2]
+                    break
+        aim_list.append(math.sqrt(np.sum(np.array(ans) ** 2)))
+
+    return -1 if len(aim_list) == 0 else np.mean(np.array(aim_list))
+
+
+@pytest.fixture()
+def log_data(tmp_path):
+    directory = str(tmp_path / 'run')
+    make_log_directory(directory, frames=40, size=23)
+    simudata, exp_data = log_trans(directory)
+    return simudata.astype({'height': np.float64}), exp_data
+
+
+@pytest.fixture()
+def outformation_data(tmp_path, log_data):
+    return load_outformation(os.path.join(str(tmp_path / 'run'), 'outformation_1.txt'))
+
+
+@pytest.mark.unittest
+class TestProcessMetrics:
+    @pytest.mark.parametrize('batch_cells', [1, 50, 1 << 22])
+    def test_density_and_center_gap(self, log_data, monkeypatch, batch_cells):
+        simudata, exp_data = log_data
+        monkeypatch.setattr(app.process.metrics, '_BATCH_CELLS', batch_cells)
+        assert get_density(simudata, exp_data) == _reference_density(simudata, exp_data)
+        assert get_center_gap(simudata, exp_data) == _reference_center_gap(simudata, exp_data)
+
+        # frames with uneven sizes, not in the order of time
+        simudata = simudata.drop(index=np.random.RandomState(0).choice(len(simudata), 200, replace=False)) \
+            .iloc[::-1].reset_index(drop=True)
+        assert get_density(simudata, exp_data) == _reference_density(simudata, exp_data)
+        assert get_center_gap(simudata, exp_data) == _reference_center_gap(simudata, exp_data)
+
+    @pytest.mark.parametrize('batch_cells', [1, 50, 1 << 22])
+    def test_dispersion_and_polarization(self, log_data, outformation_data, monkeypatch, batch_cells):
+        simudata, exp_data = log_data
+        monkeypatch.setattr(app.process.metrics, '_BATCH_CELLS', batch_cells)
+        assert get_dispersion(simudata, exp_data, outformation_data) == \
+               _reference_dispersion(simudata, exp_data, outformation_data)
+        assert get_polarization(simudata, exp_data, outformation_data) == \
+               _reference_polarization(simudata, exp_data, outformation_data)
+
+        # frames with uneven sizes (and a missing one), not in the order of time, all in formation
+        simudata = simudata.drop(index=np.random.RandomState(0).choice(len(simudata), 200, replace=False))
+        simudata = simudata[simudata['time'] != exp_data['time'][25]].iloc[::-1].reset_index(drop=True)
+        outformation_data = [(time_, 0, total) for time_, _, total in outformation_data]
+        assert get_dispersion(simudata, exp_data, outformation_data) == \
+               _reference_dispersion(simudata, exp_data, outformation_data)
+        assert get_polarization(simudata, exp_data, outformation_data) == \
+               _reference_polarization(simudata, exp_data, outformation_data)
+
+    def test_legacy_frames(self, log_data, outformation_data):
+        simudata, exp_data = log_data
+        # the reuse of ``j`` by the original loops skipped the frames whose outformation record comes before
+        # the one at (size of the previous frame - 1), i.e. the first ones
+        assert _legacy_formation_frames(simudata, exp_data, outformation_data) != \
+               _reference_formation_frames(simudata, exp_data, outformation_data)
+
+        exp_data = exp_data.iloc[23:].reset_index(drop=True)
+        assert _legacy_formation_frames(simudata, exp_data, outformation_data) == \
+               _reference_formation_frames(simudata, exp_data, outformation_data)
+        assert get_dispersion(simudata, exp_data, outformation_data) == \
+               _reference_dispersion(simudata, exp_data, outformation_data, _legacy_formation_frames)
+        assert get_polarization(simudata, exp_data, outformation_data) == \
+               _reference_polarization(simudata, exp_data, outformation_data, _legacy_formation_frames)
+
+    def test_not_in_formation(self, log_data, outformation_data):
+        simudata, exp_data = log_data
+        outformation_data = [(time_, total, total) for time_, _, total in outformation_data]
+        assert get_dispersion(simudata, exp_data, outformation_data) == -1
+        assert get_polarization(simudata, exp_data, outformation_data) == -1
+
+    def test_errors(self, log_data):
+        simudata, exp_data = log_data
+        single = simudata.drop_duplicates('time').reset_index(drop=True)
+        with pytest.raises(ZeroDivisionError):
+            get_center_gap(single, exp_data)
+
+        missing = simudata[simudata['time'] != exp_data['time'][5]].reset_index(drop=True)
+        with pytest.raises(IndexError):
+            get_density(missing, exp_data)
+        with pytest.raises(ZeroDivisionError):
+            get_center_gap(missing, exp_data)
+
+        result = compute_metrics({}, missing, exp_data, [], ['density', 'center_gap', 'loc_bias'],
+                                 errors={'density': (IndexError,), 'center_gap': (ZeroDivisionError,)})
+        assert math.isnan(result['density']) and math.isnan(result['center_gap'])
+        assert result['loc_bias'] == compute_metrics({}, simudata, exp_data, [], ['loc_bias'])['loc_bias']
+        with pytest.raises(ZeroDivisionError):
+            compute_metrics({}, missing, exp_data, [], ['center_gap'], errors={'density': (IndexError,)})
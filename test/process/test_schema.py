@@ -0,0 +1,75 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from app.process.exp_center import EXP_CENTER_SCHEMA, exp_center_trans
+from app.process.msgdata import MSGDATA_SCHEMA, msgdata_trans
+from app.process.schema import RecordSchema, register_schema, get_schema, records_trans
+from app.process.simudata import SIMUDATA_SCHEMA
+from app.proto import MpsProtoData, MpsReceiveMsg
+from .dat import frame
+
+
+def _altitude(columns):
+    return {'km': columns['height'] / 1000.0}
+
+
+_ALTITUDE_SCHEMA = register_schema(RecordSchema(
+    'test_altitude', MpsProtoData, {'id': np.uint32, 'time': np.float64, 'height': np.float32, 'km': np.float64},
+    paths={'id': 'id', 'time': 'time', 'height': 'h'},
+    skip_types=(1,),
+    derive=_altitude,
+))
+
+
+@pytest.mark.unittest
+class TestProcessSchema:
+    def test_registry(self):
+        assert get_schema('simudata') is SIMUDATA_SCHEMA
+        assert get_schema('exp_center') is EXP_CENTER_SCHEMA
+        assert pickle.loads(pickle.dumps(MSGDATA_SCHEMA)) is MSGDATA_SCHEMA
+        with pytest.raises(KeyError):
+            get_schema('nothing')
+        with pytest.raises(KeyError):
+            register_schema(SIMUDATA_SCHEMA._replace(paths={}))
+
+    def test_custom(self, log_directory):
+        src_file = os.path.join(log_directory, 'expdata_1.dat')
+        altitude = records_trans(_ALTITUDE_SCHEMA, src_file, include={'id': [5]}, t_start=1.0, t_end=2.0)
+        assert list(altitude.columns) == ['id', 'time', 'height', 'km']
+        assert (altitude['id'] == 5).all()
+        assert altitude['time'].between(1.0, 2.0).all()
+        assert (altitude['km'] == 2.0).all()
+
+        expected = exp_center_trans(src_file, ids=[5])
+        np.testing.assert_array_equal(
+            records_trans(_ALTITUDE_SCHEMA, src_file, include={'id': [5]}, workers=2)['time'], expected['time'])
+
+    def test_repeated(self, log_directory):
+        src_file = os.path.join(log_directory, 'msgData_1.dat')
+        msgdata = msgdata_trans(src_file)
+        filtered = records_trans(MSGDATA_SCHEMA, src_file, include={'receive_id': [1, 4]}, exclude={'type': [0]})
+        expected = msgdata[msgdata['receive_id'].isin([1, 4]) & (msgdata['type'] != 0)]
+        np.testing.assert_array_equal(filtered.values, expected.values)
+
+    def test_repeated_fallback(self, tmp_path):
+        messages = []
+        for i in range(6):
+            msg = MpsReceiveMsg(time=0.1 * i, receiveID=i)
+            for j in range(i % 3):
+                info = msg.msginfo.add()
+                info.sendID, info.msgtype = 10 * i + j, j
+            messages.append(msg.SerializeToString())
+        messages[2] += b'\x7b\x08\x01\x7c'  # unknown group, which can not be walked without parsing
+        items = MpsReceiveMsg(msginfo=MpsReceiveMsg.FromString(messages[4]).msginfo)
+        messages[4] = items.SerializeToString() + MpsReceiveMsg(time=0.4, receiveID=4).SerializeToString()
+        src_file = str(tmp_path / 'msgData_1.dat')
+        with open(src_file, 'wb') as f:
+            f.write(b''.join(frame(3, message) for message in messages))
+
+        expected = [(MpsReceiveMsg.FromString(message).receiveID, info.sendID, info.msgtype)
+                    for message in messages for info in MpsReceiveMsg.FromString(message).msginfo]
+        msgdata = msgdata_trans(src_file)
+        assert list(zip(msgdata['receive_id'], msgdata['send_id'], msgdata['type'])) == expected
@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import app.process.log
+
+from app.process.chunk import empty_frame
+from app.process.log import log_trans, log_process, load_log, wait_log_writes
+from app.process.simudata import SIMUDATA_DTYPES
+from app.process.store import save_frame, load_frame
+from .dat import make_log_directory
+
+
+@pytest.mark.unittest
+class TestProcessStore:
+    def test_save_frame(self, tmp_path):
+        df = pd.DataFrame({
+            'id': np.array([1, 2, 3], dtype=np.uint32),
+            'time': np.array([0.1, 0.2, 1 / 3]),
+            'height': np.array([2000.1, np.nan, -1.5], dtype=np.float32),
+            'x': np.array([1e-300, np.inf, 1.2345678901234567e6]),
+        })
+        dst_file = str(tmp_path / 'frame.npz')
+        save_frame(df, dst_file)
+        pd.testing.assert_frame_equal(load_frame(dst_file), df, check_exact=True)
+        assert os.listdir(str(tmp_path)) == ['frame.npz']
+
+        save_frame(empty_frame(SIMUDATA_DTYPES), dst_file)
+        pd.testing.assert_frame_equal(load_frame(dst_file), empty_frame(SIMUDATA_DTYPES))
+
+    def test_log_process(self, tmp_path):
+        directory = str(tmp_path / 'run')
+        make_log_directory(directory)
+        simudata, exp_center = log_trans(directory)
+
+        log_process(directory)
+        assert os.path.exists(os.path.join(directory, 'simudata.npz'))
+        assert os.path.exists(os.path.join(directory, 'exp_center.npz'))
+        assert not os.path.exists(os.path.join(directory, 'simudata.csv'))
+        assert not os.path.exists(os.path.join(directory, 'exp_center.csv'))
+
+        loaded_simudata, loaded_exp_center = load_log(directory)
+        pd.testing.assert_frame_equal(loaded_simudata, simudata, check_exact=True)
+        pd.testing.assert_frame_equal(loaded_exp_center, exp_center, check_exact=True)
+
+        log_process(directory, csv=True)
+        assert os.path.exists(os.path.join(directory, 'simudata.csv'))
+        assert os.path.exists(os.path.join(directory, 'exp_center.csv'))
+
+    def test_load_log(self, tmp_path, monkeypatch):
+        directory = str(tmp_path / 'run')
+        make_log_directory(directory)
+        simudata, exp_center = log_trans(directory)
+
+        calls = []
+        monkeypatch.setattr(app.process.log, 'log_trans', lambda d: calls.append(d) or log_trans(d))
+        decoded_simudata, decoded_exp_center = load_log(directory, persist=False)
+        pd.testing.assert_frame_equal(decoded_simudata, simudata, check_exact=True)
+        pd.testing.assert_frame_equal(decoded_exp_center, exp_center, check_exact=True)
+        wait_log_writes()
+        assert not os.path.exists(os.path.join(directory, 'simudata.npz'))
+        assert len(calls) == 1
+
+        load_log(directory)
+        wait_log_writes()
+        assert os.path.exists(os.path.join(directory, 'simudata.npz'))
+        assert os.path.exists(os.path.join(directory, 'exp_center.npz'))
+        assert len(calls) == 2
+
+        loaded_simudata, loaded_exp_center = load_log(directory)
+        pd.testing.assert_frame_equal(loaded_simudata, simudata, check_exact=True)
+        pd.testing.assert_frame_equal(loaded_exp_center, exp_center, check_exact=True)
+        assert not log_process(directory)
+        assert len(calls) == 2
@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.process.chunk import empty_frame
+from app.process.simudata import simudata_trans, SIMUDATA_DTYPES
+from app.process.trajectory import TrajectoryIndex, TrajectoryTensor
+from app.process.trans import ff, time_ticks
+from .dat import make_log_directory
+
+
+@pytest.mark.unittest
+class TestProcessTrajectory:
+    def test_frame(self, tmp_path):
+        directory = str(tmp_path / 'run')
+        make_log_directory(directory, frames=20)
+        simudata = simudata_trans(os.path.join(directory, 'simudata_1.dat'))
+        simudata = simudata.iloc[np.random.RandomState(0).permutation(len(simudata))].reset_index(drop=True)
+
+        trajectory = TrajectoryIndex(simudata)
+        assert len(trajectory) == len(simudata)
+        for time_ in [0.0, *sorted(set(simudata['time'])), 2.15, 100.0]:
+            tt = ff(time_)
+            expected = simudata[(simudata['time'] < tt + 0.001) & (simudata['time'] > tt - 0.001)]
+            rows = trajectory.frame(time_ticks(time_))
+            assert trajectory.ids[rows].tolist() == expected['id'].tolist()
+            np.testing.assert_array_equal(trajectory.times[rows], expected['time'].values)
+            np.testing.assert_array_equal(trajectory.positions[rows],
+                                          expected[['x', 'y', 'height']].values.astype(np.float64))
+
+    def test_extend(self, tmp_path):
+        directory = str(tmp_path / 'run')
+        make_log_directory(directory, frames=20)
+        simudata = simudata_trans(os.path.join(directory, 'simudata_1.dat'))
+        simudata = pd.concat([simudata, simudata.iloc[::7].assign(id=30)], ignore_index=True)  # late records
+
+        expected = TrajectoryIndex(simudata)
+        bounds = [0, 100, 101, 250, len(simudata) - 20, len(simudata)]
+        trajectory = TrajectoryIndex(simudata.iloc[:0])
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            trajectory.extend(simudata.iloc[start:end])
+        for name in ['order', 'ticks', 'times', 'ids', 'aircraft_ids', 'aircraft', 'positions']:
+            np.testing.assert_array_equal(getattr(trajectory, name), getattr(expected, name))
+
+    def test_tensor(self, tmp_path):
+        directory = str(tmp_path / 'run')
+        make_log_directory(directory, frames=20, size=10)
+        simudata = simudata_trans(os.path.join(directory, 'simudata_1.dat'))
+        simudata = pd.concat([simudata, simudata.iloc[[3]].assign(x=0.0)], ignore_index=True)  # duplicated record
+
+        tensor = TrajectoryTensor(simudata)
+        assert tensor._attitudes is None and tensor._speeds is None  # pivoted on first access
+        assert tensor.shape == (20, 10)
+        assert tensor.positions.shape == tensor.attitudes.shape == (20, 10, 3)
+        assert tensor.speeds.shape == (20, 10)
+        assert tensor.ids.tolist() == list(range(1, 11))
+        assert tensor.mask[:10].all() and tensor.mask[10:, :9].all() and not tensor.mask[10:, 9].any()
+        assert np.isnan(tensor.positions[10:, 9]).all() and np.isnan(tensor.speeds[10:, 9]).all()
+
+        for _, row in simudata.iloc[:-1].iterrows():
+            frame, aircraft = tensor.frame_of(time_ticks(row['time'])), int(row['id']) - 1
+            assert tensor.positions[frame, aircraft].tolist() == [row['x'], row['y'], float(row['height'])]
+            assert tensor.attitudes[frame, aircraft].tolist() == [row['roll'], row['pitch'], row['yaw']]
+            assert tensor.speeds[frame, aircraft] == row['speed']
+        assert tensor.frame_of(time_ticks(100.0)) is None
+
+    def test_empty(self):
+        simudata = empty_frame(SIMUDATA_DTYPES)
+        trajectory = TrajectoryIndex(simudata)
+        assert len(trajectory) == 0
+        assert trajectory.positions.shape == (0, 3)
+        assert trajectory.frame(100) == slice(0, 0)
+
+        tensor = TrajectoryTensor(simudata, trajectory)
+        assert tensor.shape == (0, 0)
+        assert tensor.positions.shape == (0, 0, 3)
+        assert tensor.frame_of(100) is None
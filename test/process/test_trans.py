@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from app.process.trans import epsg4326_to_3857, web_mercator, time_ticks, ff
+
+
+@pytest.mark.unittest
+class TestProcessTrans:
+    def test_epsg4326_to_3857(self):
+        rnd = np.random.RandomState(0)
+        lng, lat = rnd.uniform(-180, 180, 10000), rnd.uniform(-85, 85, 10000)
+        x, y = epsg4326_to_3857(lng, lat)
+        assert x.shape == y.shape == (10000,)
+
+        for i in range(0, 10000, 1000):
+            xi, yi = epsg4326_to_3857(float(lng[i]), float(lat[i]))
+            assert (xi, yi) == (x[i], y[i])
+
+    def test_web_mercator(self):
+        rnd = np.random.RandomState(0)
+        lng, lat = rnd.uniform(-180, 180, 10000), rnd.uniform(-85, 85, 10000)
+        lng[:2], lat[:2] = [13.15, 0.0], [43.66, 0.0]
+
+        x, y = web_mercator(lng, lat)
+        expected_x, expected_y = epsg4326_to_3857(lng, lat)
+        np.testing.assert_allclose(x, expected_x, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(y, expected_y, rtol=0, atol=1e-6)
+
+        assert web_mercator(13.15, 43.66) == pytest.approx(epsg4326_to_3857(13.15, 43.66), abs=1e-6)
+        assert web_mercator(0.0, 0.0) == (0.0, 0.0)
+
+    def test_time_ticks(self):
+        times = np.arange(0, 3000) / 10
+        assert time_ticks(times).tolist() == [int(round(ff(time_) * 100)) for time_ in times]
+        assert time_ticks(0.1 + 0.2) == time_ticks(0.3) == 30
+        assert time_ticks([0.1 + 0.2, 1e-6], 10 ** 6).tolist() == [300000, 1]
@@ -0,0 +1,128 @@
+import random
+
+import numpy as np
+import pytest
+
+from app.process.wire import wire_decoder, decode_where, repeated_spans
+from app.proto import MpsProtoAircraft, MpsProtoData, MpsReceiveMsg, MpsMsgInfo
+
+
+def _random_aircraft(rnd: random.Random) -> MpsProtoAircraft:
+    mpa = MpsProtoAircraft()
+    if rnd.random() < 0.9:
+        mpa.head.time = rnd.choice([0.0, rnd.uniform(0, 1000)])
+        mpa.head.id = rnd.choice([0, rnd.randint(1, 127), rnd.randint(128, (1 << 32) - 1)])
+        mpa.head.type = rnd.choice([0, 7030101, 7030102])
+        mpa.head.lng = rnd.uniform(-180, 180)
+        mpa.head.lat = rnd.choice([0.0, rnd.uniform(-90, 90)])
+        mpa.head.h = rnd.uniform(0, 3000)
+    mpa.roll = rnd.choice([0.0, rnd.uniform(-5, 5)])
+    mpa.pitch = rnd.uniform(-5, 5)
+    mpa.yaw = rnd.choice([0.0, rnd.uniform(0, 360)])
+    mpa.speed = rnd.uniform(0, 300)
+    return mpa
+
+
+@pytest.mark.unittest
+class TestProcessWire:
+    def test_enabled(self):
+        assert wire_decoder(MpsProtoAircraft).enabled
+        assert wire_decoder(MpsProtoData).enabled
+        assert wire_decoder(MpsReceiveMsg).enabled
+        assert list(wire_decoder(MpsReceiveMsg).columns) == ['time', 'receiveID']
+
+    def test_decode(self):
+        rnd = random.Random(0)
+        contents = [_random_aircraft(rnd).SerializeToString() for _ in range(500)]
+        # unknown field, a duplicated field (last one wins) and a message nested in an unexpected order
+        contents[10] += b'\x38\x01'
+        contents[20] += b'\x15' + np.float32(1.5).tobytes()
+        contents[30] = b'\x15' + np.float32(2.5).tobytes() + contents[30]
+        buf = b'\xff'.join(contents)
+        lengths = np.asarray([len(c) for c in contents], dtype=np.int64)
+        offsets = np.cumsum(np.concatenate([[0], lengths[:-1] + 1]))
+
+        columns = wire_decoder(MpsProtoAircraft).decode(buf, offsets, lengths)
+        for i, content in enumerate(contents):
+            mpa = MpsProtoAircraft()
+            mpa.ParseFromString(content)
+            assert columns['head.time'][i] == mpa.head.time
+            assert columns['head.id'][i] == mpa.head.id
+            assert columns['head.type'][i] == mpa.head.type
+            assert columns['head.lng'][i] == mpa.head.lng
+            assert columns['head.lat'][i] == mpa.head.lat
+            assert columns['head.h'][i] == np.float32(mpa.head.h)
+            assert columns['roll'][i] == np.float32(mpa.roll)
+            assert columns['pitch'][i] == np.float32(mpa.pitch)
+            assert columns['speed'][i] == np.float32(mpa.speed)
+
+        assert columns['roll'][20] == 1.5
+
+    def test_decode_paths(self):
+        rnd = random.Random(1)
+        messages = [_random_aircraft(rnd) for _ in range(300)]
+        contents = [m.SerializeToString() for m in messages]
+        buf = b''.join(contents)
+        lengths = np.asarray([len(c) for c in contents], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+
+        decoder = wire_decoder(MpsProtoAircraft)
+        columns = decoder.decode(buf, offsets, lengths, paths=['head.id', 'head.type'])
+        assert set(columns) == {'head.id', 'head.type'}
+        assert columns['head.id'].tolist() == [m.head.id for m in messages]
+        assert columns['head.type'].tolist() == [m.head.type for m in messages]
+
+        # the fields of head in the reversed order, type / id / time
+        head = b'\x18\x07\x10\x05\x09' + np.float64(2.5).tobytes()
+        content = b'\x0a' + bytes([len(head)]) + head + b'\x2d' + np.float32(1.5).tobytes()
+        for paths in (['head.id'], ['head.time', 'head.type'], ['speed']):
+            columns = decoder.decode(content, np.asarray([0]), np.asarray([len(content)]), paths=paths)
+            assert {path: column.tolist() for path, column in columns.items()} == \
+                   {path: [{'head.time': 2.5, 'head.id': 5, 'head.type': 7, 'speed': 1.5}[path]] for path in paths}
+
+        columns = decode_where(decoder, buf, offsets, lengths,
+                               include={'head.id': None}, exclude={'head.type': [7030102]})
+        expected = [m for m in messages if m.head.type != 7030102]
+        assert columns['head.id'].tolist() == [m.head.id for m in expected]
+        assert columns['speed'].tolist() == [np.float32(m.speed) for m in expected]
+
+    def test_decode_skipped(self):
+        messages = [MpsReceiveMsg(time=i * 0.5, receiveID=i) for i in range(50)]
+        for i, message in enumerate(messages):
+            for j in range(i % 4):
+                info = message.msginfo.add()
+                info.sendID, info.msgtype = i * j + 200, j
+        contents = [m.SerializeToString() for m in messages]
+        lengths = np.asarray([len(c) for c in contents], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+
+        columns = wire_decoder(MpsReceiveMsg).decode(b''.join(contents), offsets, lengths)
+        assert columns['time'].tolist() == [m.time for m in messages]
+        assert columns['receiveID'].tolist() == [m.receiveID for m in messages]
+
+    def test_repeated_spans(self):
+        messages = [MpsReceiveMsg(time=i * 0.5, receiveID=i) for i in range(50)]
+        for i, message in enumerate(messages):
+            for j in range(i % 4):
+                info = message.msginfo.add()
+                info.sendID, info.msgtype = i * j + 200, j
+        contents = [m.SerializeToString() for m in messages]
+        contents[5] = messages[5].msginfo[0].SerializeToString().join([b'\x1a\x03', contents[5]])  # item first
+        contents[6] = contents[6][:-1]  # truncated item
+        contents[7] += b'\x38\x81'  # unterminated varint
+        buf = np.frombuffer(b''.join(contents), dtype=np.uint8)
+        lengths = np.asarray([len(c) for c in contents], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+
+        records, item_offsets, item_lengths, ok = repeated_spans(buf, offsets, lengths, 3)
+        assert np.nonzero(~ok)[0].tolist() == [6, 7]
+        senders = wire_decoder(MpsMsgInfo).decode(buf, item_offsets, item_lengths, paths=['sendID'])['sendID']
+        expected = [(i, info.sendID) for i, m in enumerate(messages) if i not in (6, 7)
+                    for info in ([m.msginfo[0], *m.msginfo] if i == 5 else m.msginfo)]
+        assert list(zip(records.tolist(), senders.tolist())) == expected
+
+    def test_decode_empty(self):
+        columns = wire_decoder(MpsProtoData).decode(b'', np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        assert all(len(column) == 0 for column in columns.values())
+        assert columns['time'].dtype == np.float64
+        assert columns['id'].dtype == np.uint32